@@ -11,8 +11,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.process_manager import ProcessManager
 from core.cpu_scheduler import CPUScheduler
 from core.memory_manager import MemoryManager
-from core.io_manager import IOManager
+from core.io_manager import IOManager, DiskGeometry
 from core.concurrency_manager import ConcurrencyManager
+from core.medium_term_scheduler import MediumTermScheduler
 
 app = Flask(__name__)
 CORS(app)
@@ -23,8 +24,14 @@ cpu_scheduler = None
 memory_manager = None
 io_manager = None
 concurrency_manager = None
+medium_term_scheduler = None
 kernel_initialized = False
 
+def _on_fork(parent, child):
+    # El hijo comparte (COW) o copia la memoria del padre; si no cabe, espera suspendido
+    if not memory_manager.fork(parent, child) and medium_term_scheduler:
+        medium_term_scheduler.admit_without_memory(child)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Verifica que la API esté funcionando"""
@@ -38,11 +45,39 @@ def health_check():
 def initialize_kernel():
     """Inicializa TODOS los módulos del kernel"""
     global process_manager, cpu_scheduler, memory_manager, io_manager, concurrency_manager, kernel_initialized
+    global medium_term_scheduler
     
     try:
         data = request.json or {}
         memory_mode = data.get('memory_mode', 'paging')
         total_memory = data.get('total_memory', 1024)
+        tlb_config = data.get('tlb')
+        page_table_type = data.get('page_table', 'flat')
+        page_size = data.get('page_size', 4)
+        partition_scheme = data.get('partition_scheme', 'fixed')
+        compaction_config = data.get('compaction')
+        huge_pages_config = data.get('huge_pages')
+        readahead_config = data.get('readahead')
+        working_set_config = data.get('working_set')
+        swap_config = data.get('swap')
+        backing_store_config = data.get('backing_store')
+        slab_config = data.get('slab')
+        io_schedulers_config = data.get('io_schedulers')
+        # Algoritmo de cada dispositivo: un nombre para todos o {dispositivo: nombre}
+        io_scheduler = data.get('io_scheduler', 'FCFS')
+        
+        # Validar antes de construir nada para no dejar el kernel a medio inicializar
+        try:
+            for scheduler, config in (io_schedulers_config or {}).items():
+                IOManager.check_scheduler_config(scheduler, config or {})
+            device_schedulers = (io_scheduler if isinstance(io_scheduler, dict)
+                                 else {None: io_scheduler})
+            for scheduler in device_schedulers.values():
+                IOManager.check_scheduler(scheduler)
+        except (ValueError, AttributeError, TypeError) as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+        # Los dispositivos solo se conocen al crearlos: un fallo posterior no deja el kernel marcado
+        kernel_initialized = False
         
         # Inicializar ProcessManager
         process_manager = ProcessManager()
@@ -53,15 +88,58 @@ def initialize_kernel():
         print("✅ CPUScheduler inicializado")
         
         # Inicializar MemoryManager con el modo especificado
-        memory_manager = MemoryManager(total_memory=total_memory, mode=memory_mode)
+        memory_manager = MemoryManager(total_memory=total_memory, mode=memory_mode,
+                                       page_table_type=page_table_type, page_size=page_size,
+                                       partition_scheme=partition_scheme)
         memory_manager.initialize()
+        if compaction_config:
+            memory_manager.enable_compaction(**compaction_config)
+        if tlb_config:
+            memory_manager.enable_tlb(**tlb_config)
+        if huge_pages_config:
+            memory_manager.enable_huge_pages(**huge_pages_config)
+        if readahead_config:
+            memory_manager.enable_readahead(**readahead_config)
+        if working_set_config:
+            memory_manager.enable_working_set(**working_set_config)
+        if swap_config:
+            memory_manager.enable_swap(**swap_config.get('area', {}))
+        if backing_store_config:
+            # Frames y swap con contenido real (mmap); reemplaza el área de swap
+            memory_manager.enable_backing_store(**backing_store_config)
+        cpu_scheduler.add_context_switch_listener(memory_manager.on_context_switch)
+        process_manager.add_termination_listener(memory_manager.deallocate)
+        process_manager.add_fork_listener(_on_fork)
+        memory_manager.add_memory_pressure_listeners(
+            process_manager.suspend_process, process_manager.resume_process)
         print("✅ MemoryManager inicializado")
         
         # Inicializar IOManager
         io_manager = IOManager()
         io_manager.initialize()
+        memory_manager.attach_swap_device(io_manager)
+        for scheduler, config in (io_schedulers_config or {}).items():
+            # Parámetros de DEADLINE (expiraciones, lote) y BFQ (quantum, pesos)
+            io_manager.configure_scheduler(scheduler, **(config or {}))
+        try:
+            for device_name, scheduler in device_schedulers.items():
+                io_manager.set_scheduler(scheduler, device_name)
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
         print("✅ IOManager inicializado")
         
+        if slab_config is not None:
+            # PCBs y solicitudes de E/S contabilizados en cachés slab
+            slab_allocator = memory_manager.enable_slab(**slab_config)
+            process_manager.attach_slab_allocator(slab_allocator)
+            io_manager.attach_slab_allocator(slab_allocator)
+            print("✅ SlabAllocator inicializado")
+        
+        # Planificador a mediano plazo (swap-out/swap-in de procesos completos)
+        mts_config = {k: v for k, v in (swap_config or {}).items() if k != 'area'}
+        medium_term_scheduler = MediumTermScheduler(process_manager, memory_manager, **mts_config)
+        print("✅ MediumTermScheduler inicializado")
+        
         # Inicializar ConcurrencyManager
         concurrency_manager = ConcurrencyManager()
         print("✅ ConcurrencyManager inicializado")
@@ -73,7 +151,20 @@ def initialize_kernel():
             'message': 'Kernel inicializado correctamente con todos los módulos',
             'config': {
                 'memory_mode': memory_mode,
-                'total_memory': total_memory
+                'total_memory': total_memory,
+                'page_table': page_table_type,
+                'page_size': page_size,
+                'partition_scheme': partition_scheme,
+                'compaction': compaction_config,
+                'huge_pages': huge_pages_config,
+                'tlb': tlb_config,
+                'readahead': readahead_config,
+                'working_set': working_set_config,
+                'swap': swap_config,
+                'backing_store': backing_store_config,
+                'slab': slab_config,
+                'io_schedulers': io_schedulers_config,
+                'io_scheduler': io_scheduler
             }
         }), 200
     except Exception as e:
@@ -88,7 +179,7 @@ def initialize_kernel():
 @app.route('/api/processes/create', methods=['POST'])
 def create_process():
     """Crea un nuevo proceso usando ProcessManager"""
-    global process_manager, memory_manager
+    global process_manager, memory_manager, medium_term_scheduler
     
     if not kernel_initialized or not process_manager:
         return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
@@ -107,6 +198,9 @@ def create_process():
         memory_allocated = False
         if memory_manager:
             memory_allocated = memory_manager.allocate(pid, memory_required)
+            if not memory_allocated and medium_term_scheduler:
+                # Sin memoria: espera suspendido en lugar de ejecutarse sin ella
+                medium_term_scheduler.admit_without_memory(pid)
         
         return jsonify({
             'status': 'success',
@@ -177,6 +271,39 @@ def transition_process(pid):
             'message': str(e)
         }), 500
 
+@app.route('/api/processes/<int:pid>/fork', methods=['POST'])
+def fork_process(pid):
+    """Duplica un proceso (fork) con copy-on-write o copia completa"""
+    global process_manager, memory_manager
+    
+    if not kernel_initialized or not process_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        data = request.json or {}
+        if memory_manager and 'cow' in data:
+            memory_manager.cow_fork = bool(data['cow'])
+            
+        child = process_manager.fork(pid)
+        if child is None:
+            return jsonify({'status': 'error', 'message': f'Proceso {pid} no encontrado'}), 404
+            
+        fork_stats = {}
+        if memory_manager and memory_manager.mode == 'paging':
+            fork_stats = memory_manager.paging_manager.get_fork_statistics()
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'Proceso {pid} duplicado',
+            'pid': child,
+            'fork': fork_stats
+        }), 201
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 # ==================== CPU SCHEDULER ====================
 
 @app.route('/api/cpu/schedule', methods=['POST'])
@@ -268,7 +395,7 @@ def simulate_cpu():
 @app.route('/api/simulation/run', methods=['POST'])
 def run_simulation():
     """Ejecuta una simulación COMPLETA e INTEGRADA del sistema"""
-    global cpu_scheduler, process_manager, memory_manager, io_manager
+    global cpu_scheduler, process_manager, memory_manager, io_manager, medium_term_scheduler
     
     if not kernel_initialized or not cpu_scheduler:
         return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
@@ -300,6 +427,10 @@ def run_simulation():
             
             print(f"\n--- Paso {step + 1} ---")
             
+            # 1b. PLANIFICADOR A MEDIANO PLAZO (swap-out/swap-in)
+            if medium_term_scheduler:
+                medium_term_scheduler.tick()
+            
             # 2. EJECUTAR SCHEDULER DE CPU
             cpu_scheduler.schedule(algorithm, time_quantum)
             
@@ -322,8 +453,12 @@ def run_simulation():
             
             # 3. SIMULAR OPERACIONES DE E/S (cada 5 pasos)
             if step % 5 == 0 and io_manager:
-                # Procesar colas de E/S
-                io_manager.process_io_queues(time.time(), 'FCFS')
+                # Procesar colas de E/S con el planificador configurado en cada dispositivo
+                io_manager.process_io_queues(time.time())
+                
+                # Limpiador de páginas en segundo plano
+                if memory_manager:
+                    memory_manager.run_page_cleaner()
                 
                 # Algunos procesos en READY pueden solicitar E/S
                 ready_processes = [pid for pid in process_manager.ready_queue[:2]]
@@ -342,7 +477,8 @@ def run_simulation():
                         # Acceder a una página aleatoria
                         import random
                         page_to_access = random.randint(0, min(num_pages - 1, 5))
-                        fault = memory_manager.paging_manager.access_page(pid, page_to_access)
+                        is_write = random.random() < 0.3
+                        fault = memory_manager.paging_manager.access_page(pid, page_to_access, is_write)
                         if fault:
                             memory_manager.paging_manager.load_page(pid, page_to_access, 'LRU')
             
@@ -410,8 +546,19 @@ def run_simulation():
                     'page_accesses': memory_state.get('page_accesses', 0),
                     'hit_rate': (((memory_state.get('page_accesses', 0) - memory_state.get('page_faults', 0)) 
                                  / memory_state.get('page_accesses', 1) * 100) 
-                                if memory_state.get('page_accesses', 0) > 0 else 0)
+                                if memory_state.get('page_accesses', 0) > 0 else 0),
+                    'algorithm_comparison': memory_manager.paging_manager.compare_algorithms(),
+                    'tlb': memory_state.get('tlb'),
+                    'readahead': memory_state.get('readahead'),
+                    'working_set': memory_state.get('working_set'),
+                    'writeback': memory_state.get('writeback'),
+                    'swap': memory_state.get('swap'),
+                    'backing_store': memory_state.get('backing_store'),
+                    'fork': memory_state.get('fork'),
+                    'huge_pages': memory_state.get('huge_pages'),
+                    'medium_term': medium_term_scheduler.get_statistics() if medium_term_scheduler else {}
                 } if memory_state.get('mode') == 'paging' else {},
+                'slab': memory_manager.get_slab_statistics(),
                 'io': io_stats
             },
             'processes': processes,
@@ -438,8 +585,13 @@ def get_memory_state():
         return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
     
     try:
-        # Usar el método get_memory_state() del MemoryManager
-        memory_state = memory_manager.get_memory_state()
+        # Filtros opcionales: rango (frames o direcciones), pid, solo ocupados y límite
+        memory_state = memory_manager.get_memory_state(
+            start=request.args.get('start', 0, type=int),
+            end=request.args.get('end', type=int),
+            pid=request.args.get('pid', type=int),
+            occupied_only=request.args.get('occupied_only', 'false').lower() in ('1', 'true'),
+            limit=request.args.get('limit', type=int))
         return jsonify({
             'status': 'success',
             'data': memory_state
@@ -451,6 +603,33 @@ def get_memory_state():
             'message': str(e)
         }), 500
 
+@app.route('/api/memory/mrc', methods=['GET'])
+def get_miss_ratio_curve():
+    """Curva de page faults vs frames usando PagingManager.miss_ratio_curve()"""
+    global memory_manager
+    
+    if not kernel_initialized or not memory_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    if memory_manager.mode != 'paging':
+        return jsonify({'status': 'error', 'message': 'La curva solo está disponible en modo paging'}), 400
+    
+    try:
+        max_frames = request.args.get('max_frames', type=int)
+        
+        # Curva calculada sobre las referencias registradas en la ejecución actual
+        curve = memory_manager.paging_manager.miss_ratio_curve(max_frames=max_frames)
+        return jsonify({
+            'status': 'success',
+            'data': curve
+        }), 200
+    except Exception as e:
+        print(f"❌ Error calculando curva de fallos: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/memory/allocate', methods=['POST'])
 def allocate_memory():
     """Asigna memoria usando MemoryManager.allocate()"""
@@ -505,6 +684,85 @@ def deallocate_memory():
             'message': str(e)
         }), 500
 
+@app.route('/api/memory/shm/create', methods=['POST'])
+def create_shared_memory():
+    """Crea un segmento de memoria compartida con nombre"""
+    global memory_manager
+    
+    if not kernel_initialized or not memory_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        data = request.json
+        name = data.get('name')
+        size = data.get('size', 16)
+        
+        created = memory_manager.create_shared(name, size)
+        
+        return jsonify({
+            'status': 'success' if created else 'error',
+            'message': f'Memoria compartida {name} creada' if created else 'No se pudo crear el segmento',
+            'created': created
+        }), 200 if created else 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/memory/shm/attach', methods=['POST'])
+def attach_shared_memory():
+    """Proyecta un segmento compartido en un proceso"""
+    global memory_manager
+    
+    if not kernel_initialized or not memory_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        data = request.json
+        pid = data.get('pid')
+        name = data.get('name')
+        
+        location = memory_manager.attach_shared(pid, name)
+        if location is None:
+            return jsonify({'status': 'error', 'message': f'No se pudo adjuntar {name} a P{pid}'}), 400
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'Memoria compartida {name} adjuntada a P{pid}',
+            'location': location
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/memory/shm/detach', methods=['POST'])
+def detach_shared_memory():
+    """Separa un proceso de un segmento compartido (se libera con la última separación)"""
+    global memory_manager
+    
+    if not kernel_initialized or not memory_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        data = request.json
+        pid = data.get('pid')
+        name = data.get('name')
+        
+        memory_manager.detach_shared(pid, name)
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'Memoria compartida {name} separada de P{pid}'
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 # ==================== DISPOSITIVOS E/S ====================
 
 @app.route('/api/io/devices', methods=['GET'])
@@ -544,11 +802,18 @@ def request_io():
         operation = data.get('operation', 'read')
         data_size = data.get('data_size', 1024)
         priority = data.get('priority', 5)
+        lba = data.get('lba')
+        cylinder = data.get('cylinder')
         
         # Usar el método request_io() del IOManager
-        request_id = io_manager.request_io(
-            process_id, device_name, operation, data_size, priority
-        )
+        try:
+            lba = int(lba) if lba is not None else None
+            cylinder = int(cylinder) if cylinder is not None else None
+            request_id = io_manager.request_io(
+                process_id, device_name, operation, data_size, priority, lba, cylinder
+            )
+        except (TypeError, ValueError) as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
         
         return jsonify({
             'status': 'success',
@@ -572,7 +837,13 @@ def process_io():
     
     try:
         data = request.json or {}
-        scheduler = data.get('scheduler', 'FCFS')
+        # Sin scheduler se usa el configurado en cada dispositivo
+        scheduler = data.get('scheduler')
+        if scheduler is not None:
+            try:
+                IOManager.check_scheduler(scheduler)
+            except ValueError as e:
+                return jsonify({'status': 'error', 'message': str(e)}), 400
         
         # Usar el método process_io_queues() del IOManager
         io_manager.process_io_queues(time.time(), scheduler)
@@ -592,6 +863,89 @@ def process_io():
             'message': str(e)
         }), 500
 
+@app.route('/api/io/requests', methods=['GET'])
+def get_io_requests():
+    """Solicitudes completadas con cilindro, recorrido y tiempo de servicio"""
+    global io_manager
+    
+    if not kernel_initialized or not io_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        return jsonify({
+            'status': 'success',
+            'data': io_manager.get_request_history(limit)
+        }), 200
+    except Exception as e:
+        print(f"❌ Error obteniendo solicitudes E/S: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/io/compare', methods=['POST'])
+def compare_disk_schedulers():
+    """Compara algoritmos de planificación de disco sobre la misma cola de cilindros"""
+    try:
+        data = request.json or {}
+        cylinders = data.get('cylinders', [98, 183, 37, 122, 14, 124, 65, 67])
+        head = data.get('head', 53)
+        algorithms = data.get('algorithms')
+        # Tamaño del disco simulado: SCAN y C-SCAN recorren hasta su borde
+        disk_cylinders = data.get('disk_cylinders', DiskGeometry.cylinders)
+        
+        try:
+            geometry = DiskGeometry(cylinders=int(disk_cylinders))
+            if geometry.cylinders <= 0:
+                raise ValueError('disk_cylinders debe ser positivo')
+            # Proceso y operación de cada solicitud (BFQ reparte por proceso, DEADLINE por operación)
+            results = IOManager.compare_disk_schedulers(cylinders, head, geometry=geometry,
+                                                        algorithms=algorithms,
+                                                        process_ids=data.get('process_ids'),
+                                                        operations=data.get('operations'))
+        except (TypeError, ValueError) as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+        return jsonify({
+            'status': 'success',
+            'disk_cylinders': geometry.cylinders,
+            'data': results
+        }), 200
+    except Exception as e:
+        print(f"❌ Error comparando planificadores de disco: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/io/weight', methods=['POST'])
+def set_io_weight():
+    """Peso de E/S de un proceso para el planificador BFQ"""
+    global io_manager
+    
+    if not kernel_initialized or not io_manager:
+        return jsonify({'status': 'error', 'message': 'Kernel no inicializado'}), 400
+    
+    try:
+        data = request.json or {}
+        try:
+            pid = int(data['pid'])
+            weight = float(data.get('weight', 1.0))
+            io_manager.set_io_weight(pid, weight)
+        except (KeyError, TypeError, ValueError):
+            return jsonify({'status': 'error', 'message': 'Se requiere pid y un peso positivo'}), 400
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'Peso de E/S de P{pid}: {weight}'
+        }), 200
+    except Exception as e:
+        print(f"❌ Error asignando peso de E/S: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/io/statistics', methods=['GET'])
 def get_io_statistics():
     """Obtiene estadísticas usando IOManager.get_statistics()"""
@@ -754,6 +1108,8 @@ def get_system_state():
             'cpu': cpu_scheduler.get_cpu_state() if cpu_scheduler else {},
             'cpu_metrics': cpu_scheduler.calculate_metrics() if cpu_scheduler else {},
             'memory': memory_manager.get_memory_state() if memory_manager else {},
+            'medium_term_scheduler': medium_term_scheduler.get_statistics() if medium_term_scheduler else {},
+            'slab': memory_manager.get_slab_statistics() if memory_manager else None,
             'io_devices': io_manager.get_devices_state() if io_manager else [],
             'io_statistics': io_manager.get_statistics() if io_manager else {},
             'concurrency': concurrency_manager.get_concurrency_state() if concurrency_manager else {}
@@ -779,15 +1135,21 @@ if __name__ == '__main__':
     print("  - POST /api/kernel/initialize")
     print("  - POST /api/processes/create")
     print("  - GET  /api/processes")
+    print("  - POST /api/processes/<pid>/fork")
     print("  - POST /api/cpu/schedule")
     print("  - POST /api/cpu/simulate")
     print("  - POST /api/simulation/run  ⭐ (Para simulaciones completas)")
     print("  - GET  /api/cpu/metrics")
-    print("  - GET  /api/memory/state")
+    print("  - GET  /api/memory/state?start=&end=&pid=&occupied_only=&limit=")
+    print("  - GET  /api/memory/mrc")
     print("  - POST /api/memory/allocate")
+    print("  - POST /api/memory/shm/create | attach | detach")
     print("  - GET  /api/io/devices")
     print("  - POST /api/io/request")
     print("  - POST /api/io/process")
+    print("  - GET  /api/io/requests")
+    print("  - POST /api/io/compare")
+    print("  - POST /api/io/weight")
     print("  - GET  /api/io/statistics")
     print("  - POST /api/concurrency/create-semaphore")
     print("  - POST /api/concurrency/create-mutex")
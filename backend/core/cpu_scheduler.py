@@ -1,6 +1,6 @@
 #Modulo de Planificacion de CPU
 
-from typing import Optional, List
+from typing import Callable, Optional, List
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +14,22 @@ class CPUScheduler:
         self.current_algorithm = 'FCFS'
         self.time_quantum = 4
         self.quantum_counter = 0
+        # Observadores de cambios de contexto (p. ej. flush de la TLB)
+        self.last_dispatched: Optional[int] = None
+        self.context_switch_listeners: List[Callable[[Optional[int], int], None]] = []
+        
+    def add_context_switch_listener(self, listener: Callable[[Optional[int], int], None]):
+        self.context_switch_listeners.append(listener)
+        
+    def _notify_dispatch(self):
+        # Avisar si el proceso en CPU cambió durante este ciclo
+        current = self.pm.running_process
+        if current is None or current == self.last_dispatched:
+            return
+        previous = self.last_dispatched
+        self.last_dispatched = current
+        for listener in self.context_switch_listeners:
+            listener(previous, current)
         
     def schedule(self, algorithm: str = 'FCFS', time_quantum: int = 4):
         """Ejecuta un ciclo del algoritmo de planificación"""
@@ -34,6 +50,8 @@ class CPUScheduler:
             self._schedule_priority()
         else:
             print(f"Algoritmo desconocido: {algorithm}")
+            
+        self._notify_dispatch()
     
     #Algoritmo FCFS
     def _schedule_fcfs(self):
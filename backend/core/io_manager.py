@@ -1,11 +1,17 @@
 #Modulo de Gestion de dispositivos E/S
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
 from enum import Enum
+import bisect
+import heapq
+import math
 import random
 import time
 
+IO_REQUEST_OBJECT_SIZE = 128  # bytes que ocupa una IORequest en la caché slab del kernel
+
 #Definimos tipos de dispositivos
 class DeviceType(Enum):
     DISK = "DISK"
@@ -31,11 +37,198 @@ class IORequest:
     arrival_time: float = 0.0
     start_time: float = 0.0
     completion_time: float = 0.0
+    lba: Optional[int] = None  # bloque lógico destino (discos)
+    cylinder: Optional[int] = None  # cilindro destino; se deriva del LBA si no se indica
+    seek_distance: int = 0  # cilindros recorridos por el cabezal para atenderla
+    service_time: float = 0.0  # búsqueda + rotación + transferencia (ms)
     
     def __post_init__(self):
         if self.arrival_time == 0.0:
             self.arrival_time = time.time()
 
+#Índice ordenado de claves (cilindro, request_id) en cubetas: insertar y borrar en O(log n + carga)
+class CylinderIndex:
+    LOAD = 256
+    
+    def __init__(self):
+        self._buckets: List[List[Tuple[int, int]]] = []
+        self._maxes: List[Tuple[int, int]] = []  # mayor clave de cada cubeta
+        self._len = 0
+        
+    def __len__(self) -> int:
+        return self._len
+    
+    def add(self, key: Tuple[int, int]):
+        self._len += 1
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect.bisect_left(self._maxes, key), len(self._maxes) - 1)
+        bucket = self._buckets[i]
+        bisect.insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            # Partir la cubeta para que mover elementos siga siendo barato
+            self._buckets.insert(i + 1, bucket[self.LOAD:])
+            del bucket[self.LOAD:]
+            self._maxes.insert(i, bucket[-1])
+            
+    def remove(self, key: Tuple[int, int]):
+        i = bisect.bisect_left(self._maxes, key)
+        bucket = self._buckets[i]
+        del bucket[bisect.bisect_left(bucket, key)]
+        self._len -= 1
+        if bucket:
+            self._maxes[i] = bucket[-1]
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+            
+    def ceiling(self, key: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        # Menor clave >= key
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        bucket = self._buckets[i]
+        return bucket[bisect.bisect_left(bucket, key)]
+    
+    def floor(self, key: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        # Mayor clave <= key
+        i = bisect.bisect_left(self._maxes, key)
+        if i < len(self._maxes):
+            bucket = self._buckets[i]
+            j = bisect.bisect_right(bucket, key) - 1
+            if j >= 0:
+                return bucket[j]
+        return self._maxes[i - 1] if i > 0 else None
+    
+    def first(self) -> Optional[Tuple[int, int]]:
+        return self._buckets[0][0] if self._buckets else None
+    
+    def last(self) -> Optional[Tuple[int, int]]:
+        return self._maxes[-1] if self._maxes else None
+
+#Cola de solicitudes de un dispositivo: orden de llegada, por cilindro y por prioridad
+class RequestQueue:
+    def __init__(self):
+        self.requests: OrderedDict = OrderedDict()  # request_id -> IORequest en orden de llegada
+        self.by_cylinder = CylinderIndex()  # (cilindro, request_id) ordenados
+        # (prioridad, request_id); las entradas de solicitudes ya atendidas se descartan al salir
+        self._priority_heap: List[Tuple[int, int]] = []
+        # Vistas por clase (lectura/escritura) y por proceso para DEADLINE y BFQ
+        self.by_class: Dict[str, CylinderIndex] = {'read': CylinderIndex(), 'write': CylinderIndex()}
+        self.fifo_by_class: Dict[str, OrderedDict] = {'read': OrderedDict(), 'write': OrderedDict()}
+        self.by_process: Dict[int, CylinderIndex] = {}
+        
+    def __len__(self) -> int:
+        return len(self.requests)
+    
+    def __iter__(self):
+        return iter(self.requests.values())
+    
+    @staticmethod
+    def _cylinder(request: IORequest) -> int:
+        # Los dispositivos sin geometría no tienen posición: todos en el cilindro 0
+        return request.cylinder if request.cylinder is not None else 0
+    
+    @staticmethod
+    def operation_class(request: IORequest) -> str:
+        return 'read' if request.operation == 'read' else 'write'
+    
+    def append(self, request: IORequest):
+        key = (self._cylinder(request), request.request_id)
+        self.requests[request.request_id] = request
+        self.by_cylinder.add(key)
+        heapq.heappush(self._priority_heap, (request.priority, request.request_id))
+        op = self.operation_class(request)
+        self.by_class[op].add(key)
+        self.fifo_by_class[op][request.request_id] = request
+        if request.process_id not in self.by_process:
+            self.by_process[request.process_id] = CylinderIndex()
+        self.by_process[request.process_id].add(key)
+        
+    def remove(self, request: IORequest) -> IORequest:
+        key = (self._cylinder(request), request.request_id)
+        del self.requests[request.request_id]
+        self.by_cylinder.remove(key)
+        op = self.operation_class(request)
+        self.by_class[op].remove(key)
+        del self.fifo_by_class[op][request.request_id]
+        process_index = self.by_process[request.process_id]
+        process_index.remove(key)
+        if not process_index:
+            del self.by_process[request.process_id]
+        if len(self._priority_heap) > 2 * len(self.requests) + 64:
+            self._priority_heap = [(r.priority, rid) for rid, r in self.requests.items()]
+            heapq.heapify(self._priority_heap)
+        return request
+    
+    def oldest(self) -> Optional[IORequest]:
+        return next(iter(self.requests.values()), None)
+    
+    def highest_priority(self) -> Optional[IORequest]:
+        heap = self._priority_heap
+        while heap and heap[0][1] not in self.requests:
+            heapq.heappop(heap)
+        return self.requests[heap[0][1]] if heap else None
+    
+    def _request(self, key: Optional[Tuple[int, int]]) -> Optional[IORequest]:
+        return self.requests[key[1]] if key is not None else None
+    
+    def at_or_above(self, cylinder: int) -> Optional[IORequest]:
+        # La solicitud más cercana con cilindro >= cylinder
+        return self._request(self.by_cylinder.ceiling((cylinder, -1)))
+    
+    def at_or_below(self, cylinder: int) -> Optional[IORequest]:
+        # La solicitud más cercana con cilindro <= cylinder
+        return self._request(self.by_cylinder.floor((cylinder, float('inf'))))
+    
+    def sweep_up(self, cylinder: int, index: Optional[CylinderIndex] = None) -> Optional[IORequest]:
+        # Barrido ascendente sobre un índice (toda la cola, una clase o un proceso); al final vuelve al inicio
+        index = index if index is not None else self.by_cylinder
+        return self._request(index.ceiling((cylinder, -1)) or index.first())
+    
+    def lowest(self) -> Optional[IORequest]:
+        return self._request(self.by_cylinder.first())
+    
+    def highest(self) -> Optional[IORequest]:
+        return self._request(self.by_cylinder.last())
+
+@dataclass
+#Geometría de un disco y modelo de tiempo de servicio (ms)
+class DiskGeometry:
+    cylinders: int = 1000
+    heads: int = 4
+    sectors_per_track: int = 63
+    sector_size: int = 512
+    rpm: int = 7200
+    track_to_track_ms: float = 0.5  # búsqueda al cilindro vecino
+    full_stroke_ms: float = 10.0  # búsqueda de un extremo al otro
+    
+    def total_sectors(self) -> int:
+        return self.cylinders * self.heads * self.sectors_per_track
+    
+    def cylinder_of(self, lba: int) -> int:
+        return lba // (self.heads * self.sectors_per_track)
+    
+    def rotation_ms(self) -> float:
+        return 60000 / self.rpm
+    
+    def seek_time(self, distance: int) -> float:
+        if distance == 0:
+            return 0.0
+        # Crece con la raíz de la distancia (fase de aceleración del brazo)
+        span = max(self.cylinders - 2, 1)
+        return self.track_to_track_ms + (self.full_stroke_ms - self.track_to_track_ms) * math.sqrt((distance - 1) / span)
+    
+    def transfer_time(self, data_size: int) -> float:
+        return data_size / (self.sectors_per_track * self.sector_size) * self.rotation_ms()
+    
+    def service_time(self, distance: int, data_size: int) -> float:
+        # Latencia rotacional media: media vuelta
+        return self.seek_time(distance) + self.rotation_ms() / 2 + self.transfer_time(data_size)
+
 @dataclass
 #Definir dispisitivo E/S en el SO
 class Device:
@@ -43,29 +236,98 @@ class Device:
     device_type: DeviceType
     status: DeviceStatus = DeviceStatus.IDLE
     speed: int = 100  # operaciones por segundo
-    queue: List[IORequest] = field(default_factory=list)
+    queue: RequestQueue = field(default_factory=RequestQueue)
     current_request: Optional[IORequest] = None
     total_operations: int = 0
     total_waiting_time: float = 0.0
+    geometry: Optional[DiskGeometry] = None  # solo discos
+    head_position: int = 0  # cilindro bajo el cabezal
+    direction: int = 1  # 1 hacia cilindros mayores, -1 hacia menores
+    total_seek_distance: int = 0
+    total_service_time: float = 0.0
+    # Estado persistente de los planificadores con memoria (DEADLINE, BFQ)
+    policies: Dict[str, object] = field(default_factory=dict)
+    scheduler: str = 'FCFS'  # algoritmo con el que se atiende la cola
     
     def is_available(self) -> bool:
         return self.status == DeviceStatus.IDLE
     
+    def check_address(self, lba: Optional[int], cylinder: Optional[int]):
+        # Rechaza direcciones fuera del disco en vez de plegarlas sobre otro cilindro
+        if self.geometry is None:
+            return
+        if lba is not None and not 0 <= lba < self.geometry.total_sectors():
+            raise ValueError(f"LBA {lba} fuera del disco {self.name} "
+                             f"(0-{self.geometry.total_sectors() - 1})")
+        if cylinder is not None and not 0 <= cylinder < self.geometry.cylinders:
+            raise ValueError(f"Cilindro {cylinder} fuera del disco {self.name} "
+                             f"(0-{self.geometry.cylinders - 1})")
+    
     def add_request(self, request: IORequest):
+        self.check_address(request.lba, request.cylinder)
+        if self.geometry is not None and request.cylinder is None:
+            if request.lba is not None:
+                request.cylinder = self.geometry.cylinder_of(request.lba)
+            else:
+                request.cylinder = random.randrange(self.geometry.cylinders)
         self.queue.append(request)
         print(f"  Solicitud {request.request_id} añadida a {self.name} "
               f"(cola: {len(self.queue)})")
     
-    def process_next(self, current_time: float) -> Optional[IORequest]:
+    def _position_head(self, request: IORequest, via: Tuple[int, ...] = (),
+                       direction: Optional[int] = None):
+        # Mover el cabezal al cilindro de la solicitud (pasando por via, p. ej. el borde
+        # en SCAN/C-SCAN) y calcular su tiempo de servicio
+        distance = 0
+        position = self.head_position
+        for stop in (*via, request.cylinder):
+            distance += abs(stop - position)
+            position = stop
+        if direction is None and request.cylinder != self.head_position:
+            last = via[-1] if via else self.head_position
+            direction = 1 if request.cylinder > last else -1
+        if direction is not None:
+            self.direction = direction
+        self.head_position = request.cylinder
+        request.seek_distance = distance
+        request.service_time = self.geometry.service_time(distance, request.data_size)
+        self.total_seek_distance += distance
+        self.total_service_time += request.service_time
+    
+    def select_next(self, scheduler: str = 'FCFS',
+                    current_time: Optional[float] = None) -> Tuple[Optional[IORequest], Tuple[int, ...], Optional[int]]:
+        # Siguiente solicitud según el algoritmo: (solicitud, cilindros de paso, nueva dirección)
+        if scheduler in IO_POLICIES:
+            if scheduler not in self.policies:
+                self.policies[scheduler] = IO_POLICIES[scheduler]()
+            if current_time is None:
+                current_time = time.time()
+            return self.policies[scheduler].select(self, current_time), (), None
+        if scheduler == 'SSTF':
+            return IOScheduler.sstf(self.queue, self.head_position, self.direction), (), None
+        if scheduler in IOScheduler.ELEVATORS:
+            last_cylinder = self.geometry.cylinders - 1 if self.geometry is not None else 0
+            return IOScheduler.elevator(self.queue, scheduler, self.head_position,
+                                        self.direction, last_cylinder)
+        if scheduler == 'PRIORITY':
+            return self.queue.highest_priority(), (), None
+        if scheduler == 'FCFS':
+            return self.queue.oldest(), (), None
+        raise ValueError(f"Planificador de E/S desconocido: {scheduler}")
+    
+    def process_next(self, current_time: float, scheduler: str = 'FCFS') -> Optional[IORequest]:
         if not self.queue or self.status != DeviceStatus.IDLE:
             return None
         # Obtener siguiente solicitud
-        request = self.queue.pop(0)
+        request, via, direction = self.select_next(scheduler, current_time)
+        self.queue.remove(request)
         self.current_request = request
         self.status = DeviceStatus.BUSY
         request.start_time = current_time
         waiting_time = request.start_time - request.arrival_time
         self.total_waiting_time += waiting_time
+        if self.geometry is not None:
+            self._position_head(request, via, direction)
         print(f"  {self.name} procesando solicitud {request.request_id} "
               f"(P{request.process_id}) - {request.operation}")
         
@@ -150,40 +412,132 @@ class DMAController:
                 del self.active_transfers[device_name]
                 
         return completed
-#Funcion de planificacion de dispositivos
+#Funcion de planificacion de dispositivos: eligen sobre la cola indexada por cilindro en O(log n)
 class IOScheduler:
-    @staticmethod
-    def fcfs_schedule(queue: List[IORequest]) -> List[IORequest]:
-        return queue.copy()
+    ELEVATORS = ('SCAN', 'LOOK', 'C-SCAN', 'C-LOOK')
     
     @staticmethod
-    def sstf_schedule(queue: List[IORequest], current_position: int = 0) -> List[IORequest]:
-        if not queue:
-            return []
-            
-        # Simular posiciones de disco
-        sorted_queue = sorted(queue, 
-                            key=lambda r: abs(hash(r.request_id) % 1000 - current_position))
-        return sorted_queue
+    def sstf(queue: RequestQueue, head: int, direction: int = 1) -> Optional[IORequest]:
+        # Los vecinos del cabezal en el orden por cilindro; a igual distancia sigue la dirección actual
+        above = queue.at_or_above(head)
+        below = queue.at_or_below(head)
+        if above is None or below is None:
+            return above or below
+        up = above.cylinder - head if above.cylinder is not None else 0
+        down = head - below.cylinder if below.cylinder is not None else 0
+        if up < down or (up == down and direction > 0):
+            return above
+        return below
     
     @staticmethod
-    def scan_schedule(queue: List[IORequest], direction: str = "up") -> List[IORequest]:
-        if not queue:
-            return []
-            
-        # Simular ordenamiento por posición
-        positions = [(r, hash(r.request_id) % 1000) for r in queue]
+    def elevator(queue: RequestQueue, algorithm: str, head: int, direction: int,
+                 last_cylinder: int) -> Tuple[Optional[IORequest], Tuple[int, ...], Optional[int]]:
+        """Siguiente parada del barrido; la dirección persiste en el dispositivo entre despachos"""
+        if algorithm in ('C-SCAN', 'C-LOOK'):
+            # Solo se atiende subiendo; al final se vuelve al principio
+            request = queue.at_or_above(head)
+            if request is not None:
+                return request, (), 1
+            if algorithm == 'C-SCAN':
+                return queue.lowest(), (last_cylinder, 0), 1
+            return queue.lowest(), (), 1
+        request = queue.at_or_above(head) if direction > 0 else queue.at_or_below(head)
+        if request is not None:
+            return request, (), direction
+        # Nada por delante: SCAN llega al borde antes de invertir, LOOK invierte ya
+        if direction > 0:
+            via = (last_cylinder,) if algorithm == 'SCAN' else ()
+            return queue.at_or_below(head), via, -1
+        via = (0,) if algorithm == 'SCAN' else ()
+        return queue.at_or_above(head), via, 1
+
+#Planificador por plazos: colas ordenadas por cilindro + FIFO de lectura/escritura con vencimiento
+class DeadlineScheduler:
+    def __init__(self, read_expire: float = 0.5, write_expire: float = 5.0,
+                 fifo_batch: int = 16, writes_starved: int = 2):
+        self.expire = {'read': read_expire, 'write': write_expire}  # segundos
+        self.fifo_batch = fifo_batch  # solicitudes por lote en orden de cilindro
+        self.writes_starved = writes_starved  # lotes de lectura antes de forzar uno de escritura
+        self.batch_class: Optional[str] = None
+        self.batch_left = 0
+        self.starved = 0
+        self.expired_dispatches = 0
         
-        if direction == "up":
-            sorted_queue = sorted(positions, key=lambda x: x[1])
+    def select(self, device: 'Device', current_time: float) -> IORequest:
+        queue = device.queue
+        head = device.head_position
+        # Continuar el lote en orden ascendente de cilindro (sin volver al inicio)
+        if self.batch_left > 0 and self.batch_class is not None:
+            request = queue._request(queue.by_class[self.batch_class].ceiling((head, -1)))
+            if request is not None:
+                self.batch_left -= 1
+                return request
+        # Nuevo lote: lecturas primero salvo que las escrituras lleven demasiado esperando
+        has_reads = bool(queue.fifo_by_class['read'])
+        has_writes = bool(queue.fifo_by_class['write'])
+        if has_reads and (not has_writes or self.starved < self.writes_starved):
+            op = 'read'
+            if has_writes:
+                self.starved += 1
         else:
-            sorted_queue = sorted(positions, key=lambda x: x[1], reverse=True)
-            
-        return [r for r, _ in sorted_queue]
+            op = 'write'
+            self.starved = 0
+        oldest = next(iter(queue.fifo_by_class[op].values()))
+        if current_time - oldest.arrival_time >= self.expire[op]:
+            # La más antigua venció: saltar a ella aunque rompa el barrido
+            request = oldest
+            self.expired_dispatches += 1
+        else:
+            request = queue.sweep_up(head, queue.by_class[op])
+        self.batch_class = op
+        self.batch_left = self.fifo_batch - 1
+        return request
     
-    @staticmethod
-    def priority_schedule(queue: List[IORequest]) -> List[IORequest]:
-        return sorted(queue, key=lambda r: r.priority)
+    def get_statistics(self) -> dict:
+        return {'expired_dispatches': self.expired_dispatches, 'starved': self.starved}
+
+#Cola justa por proceso (estilo BFQ): tiempo virtual por bytes servidos / peso y presupuesto por turno
+class FairQueueScheduler:
+    def __init__(self, quantum: int = 8, weights: Optional[Dict[int, float]] = None):
+        self.quantum = quantum  # solicitudes seguidas de un proceso (en orden de cilindro)
+        self.weights = weights if weights is not None else {}  # pid -> peso (1 por defecto)
+        self.vtime: Dict[int, float] = {}
+        self.position: Dict[int, int] = {}  # cilindro donde sigue el barrido de cada proceso
+        self.vclock = 0.0  # tiempo virtual del sistema: el menor de los procesos con cola
+        self.active_pid: Optional[int] = None
+        self.served = 0
+        self.switches = 0
+        
+    def select(self, device: 'Device', current_time: float) -> IORequest:
+        queue = device.queue
+        pid = self.active_pid
+        if pid not in queue.by_process or self.served >= self.quantum:
+            # Un proceso que vuelve tras estar inactivo no acumula crédito: parte de vclock
+            pid = min(queue.by_process, key=lambda p: (max(self.vtime.get(p, self.vclock), self.vclock), p))
+            self.vclock = max(self.vtime.get(pid, self.vclock), self.vclock)
+            if pid != self.active_pid:
+                self.switches += 1
+            self.active_pid = pid
+            self.served = 0
+        # Cada proceso retoma su propio barrido; si empezara en su cilindro más bajo en cada
+        # turno, sus solicitudes altas podrían esperar indefinidamente
+        request = queue.sweep_up(self.position.get(pid, device.head_position), queue.by_process[pid])
+        self.position[pid] = request.cylinder if request.cylinder is not None else 0
+        weight = self.weights.get(pid, 1.0)
+        self.vtime[pid] = max(self.vtime.get(pid, self.vclock), self.vclock) + request.data_size / weight
+        self.served += 1
+        return request
+    
+    def get_statistics(self) -> dict:
+        return {'active_process': self.active_pid, 'switches': self.switches, 'vclock': self.vclock}
+
+# Planificadores con estado: una instancia por dispositivo
+IO_POLICIES = {
+    'DEADLINE': DeadlineScheduler,
+    'BFQ': FairQueueScheduler
+}
+# Todos los algoritmos que acepta Device.select_next
+IO_SCHEDULERS = ('FCFS', 'SSTF', 'PRIORITY', *IOScheduler.ELEVATORS, *IO_POLICIES)
 
 #Planficador de dispositivos
 class IOManager:
@@ -193,6 +547,68 @@ class IOManager:
         self.dma_controller = DMAController()
         self.request_counter = 0
         self.completed_requests: List[IORequest] = []
+        # Memoria de las solicitudes pendientes contabilizada en una caché slab (opcional)
+        self.request_cache = None
+        self.request_objects: Dict[int, int] = {}
+        # Pesos de E/S por proceso (BFQ) y configuración de los planificadores con estado
+        self.io_weights: Dict[int, float] = {}
+        self.scheduler_config: Dict[str, dict] = {'BFQ': {'weights': self.io_weights}}
+        # pid -> {'requests', 'bytes', 'total_latency', 'max_latency'}
+        self.process_io: Dict[int, dict] = {}
+        
+    @staticmethod
+    def check_scheduler(scheduler: str):
+        if scheduler not in IO_SCHEDULERS:
+            raise ValueError(f"Planificador de E/S desconocido: {scheduler} "
+                             f"(disponibles: {', '.join(IO_SCHEDULERS)})")
+        
+    @staticmethod
+    def check_scheduler_config(scheduler: str, config: dict) -> dict:
+        """Valida la configuración de un planificador con estado; devuelve los pesos BFQ normalizados"""
+        if scheduler not in IO_POLICIES:
+            raise ValueError(f"Planificador de E/S sin parámetros o desconocido: {scheduler}")
+        config = dict(config)
+        weights = {}
+        if scheduler == 'BFQ':
+            # Las claves llegan como texto desde JSON
+            for pid, weight in (config.pop('weights', None) or {}).items():
+                if float(weight) <= 0:
+                    raise ValueError(f"Peso de E/S no positivo para P{pid}: {weight}")
+                weights[int(pid)] = float(weight)
+            config['weights'] = {}
+        try:
+            IO_POLICIES[scheduler](**config)
+        except TypeError as e:
+            raise ValueError(f"Parámetros inválidos para {scheduler}: {e}")
+        return weights
+        
+    def configure_scheduler(self, scheduler: str, **config):
+        # Reinicia el planificador en todos los dispositivos con la nueva configuración
+        weights = self.check_scheduler_config(scheduler, config)
+        if scheduler == 'BFQ':
+            # Los pesos se fusionan en el diccionario compartido: set_io_weight sigue aplicando
+            self.io_weights.update(weights)
+            config['weights'] = self.io_weights
+        self.scheduler_config[scheduler] = config
+        for device in self.devices.values():
+            device.policies[scheduler] = IO_POLICIES[scheduler](**config)
+            
+    def set_scheduler(self, scheduler: str, device_name: Optional[str] = None):
+        # Algoritmo con el que cada dispositivo (o solo device_name) atiende su cola
+        self.check_scheduler(scheduler)
+        if device_name is not None and device_name not in self.devices:
+            raise ValueError(f"Dispositivo {device_name} no existe")
+        for name, device in self.devices.items():
+            if device_name is None or name == device_name:
+                device.scheduler = scheduler
+            
+    def set_io_weight(self, pid: int, weight: float):
+        if weight <= 0:
+            raise ValueError(f"Peso de E/S no positivo para P{pid}: {weight}")
+        self.io_weights[pid] = weight
+        
+    def attach_slab_allocator(self, slab_allocator, object_size: int = IO_REQUEST_OBJECT_SIZE):
+        self.request_cache = slab_allocator.create_cache('io_request', object_size)
         
     def initialize(self):
         # Crear dispositivos comunes
@@ -203,16 +619,24 @@ class IOManager:
         
         print("Dispositivos E/S inicializados")
         
-    def add_device(self, name: str, device_type: DeviceType, speed: int = 100):
-        device = Device(name, device_type, speed=speed)
+    def add_device(self, name: str, device_type: DeviceType, speed: int = 100,
+                   geometry: Optional[DiskGeometry] = None):
+        if device_type == DeviceType.DISK and geometry is None:
+            geometry = DiskGeometry()
+        device = Device(name, device_type, speed=speed, geometry=geometry)
+        for scheduler, config in self.scheduler_config.items():
+            device.policies[scheduler] = IO_POLICIES[scheduler](**config)
         self.devices[name] = device
         print(f"  Dispositivo añadido: {name} ({device_type.value})")
         
     def request_io(self, process_id: int, device_name: str, 
-                   operation: str, data_size: int, priority: int = 5) -> Optional[int]:
+                   operation: str, data_size: int, priority: int = 5,
+                   lba: Optional[int] = None, cylinder: Optional[int] = None) -> Optional[int]:
         if device_name not in self.devices:
             print(f"  Error: Dispositivo {device_name} no existe")
             return None
+        # Validar antes de consumir un id o un objeto del slab
+        self.devices[device_name].check_address(lba, cylinder)
             
         self.request_counter += 1
         request = IORequest(
@@ -221,21 +645,34 @@ class IOManager:
             device_name=device_name,
             operation=operation,
             data_size=data_size,
-            priority=priority
+            priority=priority,
+            lba=lba,
+            cylinder=cylinder
         )
         
+        if self.request_cache is not None:
+            address = self.request_cache.alloc(cpu=0)
+            if address is not None:
+                self.request_objects[request.request_id] = address
+        
         device = self.devices[device_name]
         device.add_request(request)
         
         return request.request_id
         
-    def process_io_queues(self, current_time: float, scheduler: str = 'FCFS'):
+    def process_io_queues(self, current_time: float, scheduler: Optional[str] = None):
+        # Sin scheduler explícito, cada dispositivo usa el que tiene configurado
+        if scheduler is not None:
+            self.check_scheduler(scheduler)
         for device_name, device in self.devices.items():
             # Si el dispositivo está ocupado, simular progreso
             if device.status == DeviceStatus.BUSY and device.current_request:
                 # Simular tiempo de operación
                 elapsed = current_time - device.current_request.start_time
-                estimated_time = device.current_request.data_size / device.speed
+                if device.geometry is not None:
+                    estimated_time = device.current_request.service_time / 1000
+                else:
+                    estimated_time = device.current_request.data_size / device.speed
                 
                 if elapsed >= estimated_time or random.random() < 0.3:  # 30% de completar
                     # Completar operación
@@ -250,18 +687,14 @@ class IOManager:
                         )
                         
                         self.completed_requests.append(completed_request)
+                        self._account_completion(completed_request)
+                        if completed_request.request_id in self.request_objects:
+                            self.request_cache.free(
+                                self.request_objects.pop(completed_request.request_id), cpu=0)
             
-            # Procesar siguiente si está idle
+            # Procesar siguiente si está idle (el algoritmo elige sobre la cola indexada)
             if device.is_available() and device.queue:
-                # Aplicar algoritmo de planificación
-                if scheduler == 'SSTF':
-                    device.queue = IOScheduler.sstf_schedule(device.queue)
-                elif scheduler == 'SCAN':
-                    device.queue = IOScheduler.scan_schedule(device.queue)
-                elif scheduler == 'PRIORITY':
-                    device.queue = IOScheduler.priority_schedule(device.queue)
-                
-                device.process_next(current_time)
+                device.process_next(current_time, scheduler or device.scheduler)
         
         # Manejar interrupciones
         self.interrupt_controller.handle_interrupts()
@@ -269,6 +702,30 @@ class IOManager:
         # Actualizar transferencias DMA
         self.dma_controller.update_transfers()
         
+    def _account_completion(self, request: IORequest):
+        stats = self.process_io.setdefault(request.process_id, {
+            'requests': 0, 'bytes': 0, 'total_latency': 0.0, 'max_latency': 0.0})
+        latency = request.completion_time - request.arrival_time
+        stats['requests'] += 1
+        stats['bytes'] += request.data_size
+        stats['total_latency'] += latency
+        stats['max_latency'] = max(stats['max_latency'], latency)
+        
+    def get_process_io_statistics(self) -> Dict[int, dict]:
+        # Reparto del ancho de banda de E/S y latencia máxima por proceso
+        total_bytes = sum(stats['bytes'] for stats in self.process_io.values())
+        return {
+            pid: {
+                'requests': stats['requests'],
+                'bytes': stats['bytes'],
+                'bandwidth_share': stats['bytes'] / total_bytes if total_bytes else 0,
+                'avg_latency': stats['total_latency'] / stats['requests'],
+                'max_latency': stats['max_latency'],
+                'weight': self.io_weights.get(pid, 1.0)
+            }
+            for pid, stats in self.process_io.items()
+        }
+        
     def get_devices_state(self) -> List[dict]:
         return [
             {
@@ -279,7 +736,14 @@ class IOManager:
                 'current_request': device.current_request.request_id if device.current_request else None,
                 'total_operations': device.total_operations,
                 'avg_waiting_time': (device.total_waiting_time / device.total_operations 
-                                    if device.total_operations > 0 else 0)
+                                    if device.total_operations > 0 else 0),
+                'head_position': device.head_position if device.geometry else None,
+                'direction': device.direction if device.geometry else None,
+                'total_seek_distance': device.total_seek_distance,
+                'avg_service_time': (device.total_service_time / device.total_operations
+                                     if device.geometry and device.total_operations > 0 else 0),
+                'scheduler': device.scheduler,
+                'schedulers': {name: policy.get_statistics() for name, policy in device.policies.items()}
             }
             for device in self.devices.values()
         ]
@@ -292,10 +756,83 @@ class IOManager:
             avg_turnaround = sum(r.completion_time - r.arrival_time for r in self.completed_requests) / completed
         else:
             avg_turnaround = 0
+        disk_requests = [r for r in self.completed_requests if r.cylinder is not None]
         return {
             'total_requests': total_requests,
             'completed_requests': completed,
             'pending_requests': total_requests - completed,
             'avg_turnaround_time': avg_turnaround,
-            'total_interrupts': self.interrupt_controller.interrupt_counter
+            'total_interrupts': self.interrupt_controller.interrupt_counter,
+            'total_seek_distance': sum(d.total_seek_distance for d in self.devices.values()),
+            'avg_service_time': (sum(r.service_time for r in disk_requests) / len(disk_requests)
+                                 if disk_requests else 0),
+            'max_service_time': max((r.service_time for r in disk_requests), default=0),
+            'max_latency': max((stats['max_latency'] for stats in self.process_io.values()), default=0),
+            'per_process': self.get_process_io_statistics()
         }
+    
+    def get_request_history(self, limit: int = 50) -> List[dict]:
+        # Últimas solicitudes completadas con su recorrido y tiempo de servicio
+        return [
+            {
+                'request_id': r.request_id,
+                'process_id': r.process_id,
+                'device': r.device_name,
+                'operation': r.operation,
+                'cylinder': r.cylinder,
+                'seek_distance': r.seek_distance,
+                'service_time': r.service_time,
+                'waiting_time': r.start_time - r.arrival_time
+            }
+            for r in self.completed_requests[-limit:]
+        ]
+    
+    @staticmethod
+    def compare_disk_schedulers(cylinders: List[int], head: int = 0, data_size: int = 4096,
+                                geometry: Optional[DiskGeometry] = None,
+                                algorithms: Optional[List[str]] = None,
+                                process_ids: Optional[List[int]] = None,
+                                operations: Optional[List[str]] = None) -> Dict[str, dict]:
+        """Atiende la misma cola con cada algoritmo y compara recorrido, servicio y latencia"""
+        geometry = geometry or DiskGeometry()
+        algorithms = algorithms or ['FCFS', 'SSTF', 'SCAN', 'LOOK', 'C-SCAN', 'C-LOOK', 'DEADLINE', 'BFQ']
+        unknown = [name for name in algorithms if name not in IO_SCHEDULERS]
+        if unknown:
+            raise ValueError(f"Algoritmos desconocidos: {', '.join(map(str, unknown))} "
+                             f"(disponibles: {', '.join(IO_SCHEDULERS)})")
+        for name, values in (('process_ids', process_ids), ('operations', operations)):
+            if values is not None and len(values) != len(cylinders):
+                raise ValueError(f"{name} debe tener un elemento por cilindro "
+                                 f"({len(values)} != {len(cylinders)})")
+        # Las posiciones deben caer dentro del disco simulado
+        for cylinder in (head, *cylinders):
+            if not 0 <= cylinder < geometry.cylinders:
+                raise ValueError(f"Cilindro {cylinder} fuera del disco (0-{geometry.cylinders - 1})")
+        results = {}
+        for algorithm in algorithms:
+            device = Device('compare', DeviceType.DISK, geometry=geometry, head_position=head)
+            for i, cylinder in enumerate(cylinders):
+                request = IORequest(i, process_ids[i] if process_ids else 0, 'disk',
+                                    operations[i] if operations else 'read', data_size, cylinder=cylinder)
+                request.arrival_time = 0.0  # todas llegan en t=0 del reloj simulado
+                device.queue.append(request)
+            order = []
+            clock = 0.0  # segundos simulados
+            latencies: Dict[int, List[float]] = {}
+            while device.queue:
+                request, via, direction = device.select_next(algorithm, clock)
+                device.queue.remove(request)
+                device._position_head(request, via, direction)
+                clock += request.service_time / 1000
+                order.append(request.cylinder)
+                latencies.setdefault(request.process_id, []).append(clock * 1000)
+            results[algorithm] = {
+                'order': order,
+                'total_seek_distance': device.total_seek_distance,
+                'total_service_time': device.total_service_time,
+                'avg_service_time': device.total_service_time / len(cylinders) if cylinders else 0,
+                'max_latency': max((max(l) for l in latencies.values()), default=0),  # ms
+                'per_process': {pid: {'requests': len(l), 'max_latency': max(l)}
+                                for pid, l in latencies.items()}
+            }
+        return results
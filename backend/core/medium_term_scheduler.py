@@ -0,0 +1,130 @@
+#Modulo de Planificacion a Mediano Plazo (swapping de procesos completos)
+
+from typing import Dict, List, Optional
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.process_manager import ProcessManager, ProcessState
+from core.memory_manager import MemoryManager
+
+#Suspende procesos a swap cuando la memoria está sobrecomprometida y los reanuda por política
+class MediumTermScheduler:
+    def __init__(self, process_manager: ProcessManager, memory_manager: MemoryManager,
+                 resume_policy: str = 'FIFO', overcommit_ratio: float = 1.0,
+                 resume_ratio: float = 0.9):
+        self.pm = process_manager
+        self.mm = memory_manager
+        self.resume_policy = resume_policy  # 'FIFO', 'PRIORITY' o 'SMALLEST'
+        self.overcommit_ratio = overcommit_ratio
+        self.resume_ratio = resume_ratio
+        self.clock = 0
+        # pid -> {'since': tick, 'footprint': frames, 'size': bytes}
+        self.swapped: Dict[int, dict] = {}
+        self.swap_outs = 0
+        self.swap_ins = 0
+        self.bytes_swapped_out = 0
+        self.bytes_swapped_in = 0
+        self.resume_latencies: List[float] = []
+        self.suspended_ticks: List[int] = []
+        
+    def _active_pids(self) -> List[int]:
+        # Los suspendidos por el control PFF no se eligen ni se reanudan desde aquí
+        pressure = set(self.mm.pressure_suspended())
+        return [
+            pid for pid, pcb in self.pm.processes.items()
+            if pcb.state not in (ProcessState.terminado.value,
+                                 ProcessState.suspendido_listo.value,
+                                 ProcessState.suspendido_esperando.value)
+            and pid not in pressure
+        ]
+        
+    def _footprint(self, pid: int) -> int:
+        if self.mm.mode == 'paging':
+            return self.mm.paging_manager.process_footprint(pid)
+        return 0
+        
+    def admit_without_memory(self, pid: int):
+        # Proceso creado sin memoria: espera en SUSPENDED_READY hasta que quepa
+        pcb = self.pm.processes[pid]
+        self.swapped[pid] = {'since': self.clock, 'footprint': 0, 'size': pcb.memory_required}
+        self.pm.suspend_process(pid, "SIN MEMORIA")
+        
+    def swap_out(self, pid: int):
+        pcb = self.pm.processes[pid]
+        footprint = self._footprint(pid)
+        written = self.mm.swap_out(pid)
+        self.swapped[pid] = {'since': self.clock, 'footprint': footprint, 'size': pcb.memory_required}
+        self.swap_outs += 1
+        self.bytes_swapped_out += written
+        self.pm.suspend_process(pid, "SWAP")
+        print(f"  Swap-out: P{pid} ({written} bytes)")
+        
+    def swap_in(self, pid: int) -> bool:
+        info = self.swapped[pid]
+        start = time.perf_counter()
+        ok, read = self.mm.swap_in(pid, info['size'])
+        if not ok:
+            return False
+        self.resume_latencies.append(time.perf_counter() - start)
+        self.suspended_ticks.append(self.clock - info['since'])
+        del self.swapped[pid]
+        self.swap_ins += 1
+        self.bytes_swapped_in += read
+        self.pm.resume_process(pid)
+        print(f"  Swap-in: P{pid} ({read} bytes)")
+        return True
+        
+    def _select_victim(self, active: List[int]) -> Optional[int]:
+        # Menor prioridad (número mayor) y, a igualdad, la mayor huella
+        candidates = [pid for pid in active if pid != self.pm.running_process] or active
+        if len(active) <= 1:
+            return None
+        return max(candidates,
+                   key=lambda pid: (self.pm.processes[pid].priority, self._footprint(pid)))
+        
+    def _resume_order(self) -> List[int]:
+        ready = [pid for pid in self.swapped
+                 if self.pm.processes[pid].state == ProcessState.suspendido_listo.value]
+        if self.resume_policy == 'PRIORITY':
+            return sorted(ready, key=lambda pid: self.pm.processes[pid].priority)
+        if self.resume_policy == 'SMALLEST':
+            return sorted(ready, key=lambda pid: self.swapped[pid]['footprint'])
+        return sorted(ready, key=lambda pid: self.swapped[pid]['since'])
+        
+    def tick(self):
+        """Un ciclo del planificador a mediano plazo"""
+        self.clock += 1
+        
+        # Olvidar procesos que terminaron estando suspendidos
+        for pid in [p for p in self.swapped
+                    if self.pm.processes[p].state == ProcessState.terminado.value]:
+            del self.swapped[pid]
+            
+        active = self._active_pids()
+        if self.mm.is_overcommitted(active, self.overcommit_ratio):
+            victim = self._select_victim(active)
+            if victim is not None:
+                self.swap_out(victim)
+            return
+            
+        for pid in self._resume_order():
+            if not self.mm.can_admit(active, self.swapped[pid]['footprint'], self.resume_ratio):
+                break
+            if self.swap_in(pid):
+                active.append(pid)
+                
+    def get_statistics(self) -> dict:
+        return {
+            'swapped_processes': list(self.swapped),
+            'swap_outs': self.swap_outs,
+            'swap_ins': self.swap_ins,
+            'bytes_swapped_out': self.bytes_swapped_out,
+            'bytes_swapped_in': self.bytes_swapped_in,
+            'avg_resume_latency': (sum(self.resume_latencies) / len(self.resume_latencies)
+                                   if self.resume_latencies else 0),
+            'max_resume_latency': max(self.resume_latencies, default=0),
+            'avg_suspended_ticks': (sum(self.suspended_ticks) / len(self.suspended_ticks)
+                                    if self.suspended_ticks else 0)
+        }
@@ -1,9 +1,23 @@
 #Modulo de Gestion de Memoria
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from collections import deque
+from collections import deque, OrderedDict
+from array import array
+from itertools import groupby, islice
+import bisect
+import heapq
+import mmap
+import random
+import tempfile
 import time
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.io_manager import DeviceType, DiskGeometry
 
 # Creamos las particiones, la paginacion y segmentacion
 
@@ -14,27 +28,79 @@ class Partition:
     size: int
     allocated: bool = False
     process_id: Optional[int] = None
-#Gestor de particion
+    requested: int = 0  # tamaño pedido por el proceso (size - requested = fragmentación interna)
+#Gestor de particion: fijas (partition_sizes) o dinámicas (huecos creados bajo demanda)
 class PartitionManager:
-    def __init__(self, total_memory: int, partition_sizes: List[int]):
+    def __init__(self, total_memory: int, partition_sizes: Optional[List[int]] = None,
+                 block_size: int = 1, compaction_threshold: Optional[float] = 0.5,
+                 move_cost: float = 1.0):
         self.total_memory = total_memory
         self.partitions: List[Partition] = []
+        self.dynamic = partition_sizes is None
+        self.block_size = block_size  # las particiones dinámicas se redondean a este tamaño
+        # Compactar cuando la fragmentación externa (1 - mayor hueco / libre) supere el umbral
+        self.compaction_threshold = compaction_threshold
+        self.move_cost = move_cost  # coste por unidad de memoria movida al compactar
+        self.next_id = 0
+        # Contadores incrementales de fragmentación
+        self.managed_memory = 0
+        self.allocated_memory = 0
+        self.requested_memory = 0
+        self.compactions = 0
+        self.moved_memory = 0
+        self.compaction_cost = 0.0
+        self.failures = 0
+        
+        if self.dynamic:
+            self.managed_memory = total_memory
+            self.free_index = FreeBlockIndex(0, total_memory)
+        else:
+            base = 0
+            for i, size in enumerate(partition_sizes):
+                self.partitions.append(Partition(i, base, size))
+                base += size
+            self.managed_memory = base
+            self.next_id = len(partition_sizes)
+            
+    def _assign(self, partition: Partition, pid: int, size: int):
+        partition.allocated = True
+        partition.process_id = pid
+        partition.requested = size
+        self.allocated_memory += partition.size
+        self.requested_memory += size
         
-        base = 0
-        for i, size in enumerate(partition_sizes):
-            self.partitions.append(Partition(i, base, size))
-            base += size
+    def _allocate_dynamic(self, pid: int, size: int, algorithm: str) -> Optional[int]:
+        block = -(-size // self.block_size) * self.block_size
+        base = self.free_index.find(block, algorithm)
+        if base is None and block <= self.managed_memory - self.allocated_memory:
+            # Hay memoria suficiente pero repartida en huecos: compactar si se supera el umbral
+            if self._check_compaction():
+                base = self.free_index.find(block, algorithm)
+        if base is None:
+            self.failures += 1
+            return None
+        self.free_index.take(base, block)
+        partition = Partition(self.next_id, base, block)
+        self.next_id += 1
+        self._assign(partition, pid, size)
+        self.partitions.append(partition)
+        print(f"  Asignado P{pid} a partición {partition.id} [{base}, {base + block}) ({algorithm})")
+        return base
             
     def allocate_first_fit(self, pid: int, size: int) -> Optional[int]:
+        if self.dynamic:
+            return self._allocate_dynamic(pid, size, 'first_fit')
         for partition in self.partitions:
             if not partition.allocated and partition.size >= size:
-                partition.allocated = True
-                partition.process_id = pid
+                self._assign(partition, pid, size)
                 print(f"  Asignado P{pid} a partición {partition.id} (First Fit)")
                 return partition.base
+        self.failures += 1
         return None
         
     def allocate_best_fit(self, pid: int, size: int) -> Optional[int]:
+        if self.dynamic:
+            return self._allocate_dynamic(pid, size, 'best_fit')
         best = None
         best_waste = float('inf')
         
@@ -46,13 +112,15 @@ class PartitionManager:
                     best_waste = waste
                     
         if best:
-            best.allocated = True
-            best.process_id = pid
+            self._assign(best, pid, size)
             print(f"  Asignado P{pid} a partición {best.id} (Best Fit, desperdicio={best_waste})")
             return best.base
+        self.failures += 1
         return None
         
     def allocate_worst_fit(self, pid: int, size: int) -> Optional[int]:
+        if self.dynamic:
+            return self._allocate_dynamic(pid, size, 'worst_fit')
         worst = None
         max_size = -1
         
@@ -63,28 +131,102 @@ class PartitionManager:
                     max_size = partition.size
                     
         if worst:
-            worst.allocated = True
-            worst.process_id = pid
+            self._assign(worst, pid, size)
             print(f"  Asignado P{pid} a partición {worst.id} (Worst Fit)")
             return worst.base
+        self.failures += 1
         return None
         
     def deallocate(self, pid: int):
+        released = False
         for partition in self.partitions:
             if partition.process_id == pid:
+                self.allocated_memory -= partition.size
+                self.requested_memory -= partition.requested
                 partition.allocated = False
                 partition.process_id = None
+                partition.requested = 0
+                if self.dynamic:
+                    # El hueco se combina con sus vecinos libres
+                    self.free_index.free(partition.base, partition.size)
+                released = True
                 print(f"  Liberada partición {partition.id} de P{pid}")
-                
-    def get_fragmentation(self) -> Tuple[int, int]:
-        internal = 0  # Espacio asignado pero no usado
-        external = 0  # Espacio libre fragmentado
+        if self.dynamic and released:
+            self.partitions = [p for p in self.partitions if p.allocated]
+            self._check_compaction()
+            
+    def external_fragmentation(self) -> int:
+        free_memory = self.managed_memory - self.allocated_memory
+        if self.dynamic:
+            # Memoria libre inutilizable para una petición del tamaño del mayor hueco
+            return free_memory - self.free_index.largest()
+        return free_memory
         
-        for partition in self.partitions:
-            if not partition.allocated:
-                external += partition.size
+    def _check_compaction(self) -> bool:
+        if not self.dynamic or self.compaction_threshold is None:
+            return False
+        free_memory = self.managed_memory - self.allocated_memory
+        if free_memory == 0 or len(self.free_index) < 2:
+            return False
+        if self.external_fragmentation() / free_memory < self.compaction_threshold:
+            return False
+        self.compact()
+        return True
+        
+    def compact(self) -> int:
+        """Desplaza las particiones hacia la dirección 0 y deja un único hueco al final"""
+        moved = 0
+        next_base = 0
+        for partition in sorted(self.partitions, key=lambda p: p.base):
+            if partition.base != next_base:
+                moved += partition.size
+                partition.base = next_base
+            next_base += partition.size
+        self.free_index = FreeBlockIndex(next_base, self.total_memory - next_base)
+        self.compactions += 1
+        self.moved_memory += moved
+        self.compaction_cost += moved * self.move_cost
+        print(f"  Compactación: {moved} unidades movidas, hueco libre de {self.total_memory - next_base}")
+        return moved
                 
+    def get_fragmentation(self) -> Tuple[int, int]:
+        internal = self.allocated_memory - self.requested_memory  # Espacio asignado pero no usado
+        external = self.external_fragmentation()  # Espacio libre fragmentado
         return internal, external
+        
+    def layout(self) -> List[dict]:
+        # Particiones y huecos ordenados por dirección
+        entries = [
+            {'id': p.id, 'base': p.base, 'size': p.size, 'allocated': p.allocated,
+             'process_id': p.process_id, 'requested': p.requested}
+            for p in self.partitions
+        ]
+        if self.dynamic:
+            entries += [
+                {'id': f"hueco-{base}", 'base': base, 'size': size, 'allocated': False,
+                 'process_id': None, 'requested': 0}
+                for base, size in self.free_index.blocks()
+            ]
+        return sorted(entries, key=lambda e: e['base'])
+        
+    def get_statistics(self) -> dict:
+        internal, external = self.get_fragmentation()
+        free_memory = self.managed_memory - self.allocated_memory
+        return {
+            'scheme': 'dynamic' if self.dynamic else 'fixed',
+            'allocated_memory': self.allocated_memory,
+            'requested_memory': self.requested_memory,
+            'free_memory': free_memory,
+            'internal_fragmentation': internal,
+            'internal_fragmentation_ratio': internal / self.allocated_memory if self.allocated_memory else 0,
+            'external_fragmentation': external,
+            'external_fragmentation_ratio': external / free_memory if free_memory else 0,
+            'holes': len(self.free_index) if self.dynamic else sum(not p.allocated for p in self.partitions),
+            'compactions': self.compactions,
+            'moved_memory': self.moved_memory,
+            'compaction_cost': self.compaction_cost,
+            'failures': self.failures
+        }
 
 # ============= PAGINACIÓN =============
 
@@ -96,8 +238,13 @@ class Page:
     referenced: bool = False
     modified: bool = False
     load_time: float = 0.0
-    last_access_time: float = 0.0
+    last_access_time: int = 0  # Contador lógico de accesos, no reloj de pared
     reference_count: int = 0
+    next_use: float = float('inf')  # Próximo uso según la cadena de referencias (OPT)
+    prefetched: bool = False  # Cargada por readahead y aún no referenciada
+    last_use_vtime: int = 0  # Último uso en tiempo virtual del proceso (conjunto de trabajo)
+    swap_slot: Optional[int] = None  # Copia en el área de swap, si existe
+    cow: bool = False  # Frame compartido de solo lectura tras un fork (copy-on-write)
 
 @dataclass
 #Marco de pagina
@@ -106,36 +253,972 @@ class Frame:
     page_number: Optional[int] = None
     process_id: Optional[int] = None
     occupied: bool = False
+    load_seq: int = 0  # Orden de carga, invalida entradas viejas de la cola FIFO
+
+#Pool de frames libres: pila de numeros de frame + bitmap de ocupacion
+class FreeFramePool:
+    def __init__(self, total_frames: int):
+        self.total_frames = total_frames
+        # La pila se llena al reves para que pop() entregue primero el frame 0
+        self._free_stack: List[int] = list(range(total_frames - 1, -1, -1))
+        self._bitmap = bytearray(total_frames)  # 1 = ocupado
+        self._free = total_frames
+        
+    def allocate(self) -> Optional[int]:
+        # O(1) amortizado: sacar un frame libre de la pila, saltando los que
+        # se tomaron por asignación contigua (el bitmap manda)
+        while self._free_stack:
+            frame_number = self._free_stack.pop()
+            if not self._bitmap[frame_number]:
+                self._bitmap[frame_number] = 1
+                self._free -= 1
+                return frame_number
+        return None
+        
+    def allocate_contiguous(self, count: int, align: int = 1) -> Optional[int]:
+        """Reserva count frames contiguos alineados (páginas grandes); devuelve el primero"""
+        if count > self._free:
+            return None
+        run = bytes(count)
+        pos = 0
+        while pos + count <= self.total_frames:
+            start = self._bitmap.find(run, pos)
+            if start < 0:
+                return None
+            aligned = -(-start // align) * align
+            if aligned == start:
+                self._bitmap[start:start + count] = b'\x01' * count
+                self._free -= count
+                if len(self._free_stack) > 2 * self.total_frames:
+                    # Compactar entradas obsoletas de la pila
+                    self._free_stack = [f for f in range(self.total_frames - 1, -1, -1)
+                                        if not self._bitmap[f]]
+                return start
+            pos = aligned
+        return None
+        
+    def free(self, frame_number: int) -> bool:
+        # O(1): devolver el frame a la pila (ignora dobles liberaciones)
+        if not self._bitmap[frame_number]:
+            return False
+        self._bitmap[frame_number] = 0
+        self._free_stack.append(frame_number)
+        self._free += 1
+        return True
+        
+    def is_occupied(self, frame_number: int) -> bool:
+        return self._bitmap[frame_number] == 1
+        
+    @property
+    def free_count(self) -> int:
+        return self._free
+        
+    @property
+    def used_count(self) -> int:
+        return self.total_frames - self._free
+
+# ============= ORGANIZACIONES DE TABLA DE PÁGINAS =============
+
+PTE_SIZE = 8  # Bytes por entrada de tabla de páginas
+
+#Interfaz común de tabla de páginas de un proceso
+class PageTable(ABC):
+    levels = 1
+    
+    def __init__(self, num_pages: int):
+        self.num_pages = num_pages
+        self.lookups = 0
+        self.walk_steps = 0
+        
+    @abstractmethod
+    def get(self, page_number: int) -> Optional[Page]:
+        # Devuelve la entrada, creándola en el primer toque si hace falta
+        pass
+        
+    @abstractmethod
+    def peek(self, page_number: int) -> Optional[Page]:
+        # Devuelve la entrada solo si ya existe (sin asignar nada)
+        pass
+        
+    def walk(self, page_number: int) -> Optional[Page]:
+        # Recorrido de la MMU: igual que get() pero contabiliza su costo
+        self.lookups += 1
+        self.walk_steps += self.levels
+        return self.get(page_number)
+        
+    @abstractmethod
+    def pages(self) -> List[Page]:
+        pass
+        
+    @abstractmethod
+    def touched_pages(self) -> int:
+        # Páginas con entrada creada (huella real del proceso)
+        pass
+        
+    def on_map(self, page_number: int, frame_number: int):
+        pass
+        
+    def on_unmap(self, page_number: int, frame_number: int):
+        pass
+        
+    @abstractmethod
+    def memory_overhead(self) -> int:
+        pass
+        
+    def __contains__(self, page_number: int) -> bool:
+        return 0 <= page_number < self.num_pages
+        
+    def __getitem__(self, page_number: int) -> Page:
+        page = self.get(page_number)
+        if page is None:
+            raise KeyError(page_number)
+        return page
+        
+    def __len__(self) -> int:
+        return self.num_pages
+
+#Tabla plana: un diccionario de entradas por proceso
+class FlatPageTable(PageTable):
+    def __init__(self, num_pages: int):
+        super().__init__(num_pages)
+        # Paginación por demanda: las entradas se crean en el primer fallo
+        self.entries: Dict[int, Page] = {}
+        
+    def get(self, page_number: int) -> Optional[Page]:
+        if not 0 <= page_number < self.num_pages:
+            return None
+        page = self.entries.get(page_number)
+        if page is None:
+            page = Page(page_number=page_number)
+            self.entries[page_number] = page
+        return page
+        
+    def peek(self, page_number: int) -> Optional[Page]:
+        return self.entries.get(page_number)
+        
+    def pages(self) -> List[Page]:
+        return list(self.entries.values())
+        
+    def touched_pages(self) -> int:
+        return len(self.entries)
+        
+    def memory_overhead(self) -> int:
+        # Una tabla lineal reserva una entrada por cada página virtual
+        return self.num_pages * PTE_SIZE
+
+#Tabla multinivel (radix): los niveles inferiores se crean en el primer toque
+class RadixPageTable(PageTable):
+    def __init__(self, num_pages: int, levels: int = 2, bits_per_level: int = 10):
+        super().__init__(num_pages)
+        # Se agregan niveles hasta cubrir todo el espacio virtual: si no,
+        # el índice superior enmascarado haría colisionar páginas distintas
+        while num_pages > 1 << (bits_per_level * levels):
+            levels += 1
+        self.levels = levels
+        self.bits_per_level = bits_per_level
+        self.fanout = 1 << bits_per_level
+        self.mask = self.fanout - 1
+        self.root: List = [None] * self.fanout
+        self.tables_allocated = 1
+        self.entries_created = 0
+        
+    def _indexes(self, page_number: int) -> List[int]:
+        return [
+            (page_number >> (self.bits_per_level * (self.levels - 1 - level))) & self.mask
+            for level in range(self.levels)
+        ]
+        
+    def _find(self, page_number: int, create: bool) -> Optional[Page]:
+        if not 0 <= page_number < self.num_pages:
+            return None
+        indexes = self._indexes(page_number)
+        table = self.root
+        for index in indexes[:-1]:
+            child = table[index]
+            if child is None:
+                if not create:
+                    return None
+                child = [None] * self.fanout
+                table[index] = child
+                self.tables_allocated += 1
+            table = child
+        page = table[indexes[-1]]
+        if page is None and create:
+            page = Page(page_number=page_number)
+            table[indexes[-1]] = page
+            self.entries_created += 1
+        return page
+        
+    def get(self, page_number: int) -> Optional[Page]:
+        return self._find(page_number, create=True)
+        
+    def peek(self, page_number: int) -> Optional[Page]:
+        return self._find(page_number, create=False)
+        
+    def pages(self) -> List[Page]:
+        result = []
+        stack = [(self.root, 1)]
+        while stack:
+            table, depth = stack.pop()
+            for entry in table:
+                if entry is None:
+                    continue
+                if depth == self.levels:
+                    result.append(entry)
+                else:
+                    stack.append((entry, depth + 1))
+        return result
+        
+    def touched_pages(self) -> int:
+        return self.entries_created
+        
+    def memory_overhead(self) -> int:
+        return self.tables_allocated * self.fanout * PTE_SIZE
+
+#Tabla invertida global (hash): una entrada por frame físico
+class InvertedPageTable:
+    ENTRY_SIZE = 16  # pid + página virtual + enlace de la cadena
+    ANCHOR_SIZE = 4
+    
+    def __init__(self, total_frames: int):
+        self.num_buckets = 1
+        while self.num_buckets < max(total_frames, 1):
+            self.num_buckets <<= 1
+        self.anchors = [-1] * self.num_buckets
+        self.entry_pid = [-1] * total_frames
+        self.entry_page = [-1] * total_frames
+        self.chain_next = [-1] * total_frames
+        
+    def _bucket(self, pid: int, page_number: int) -> int:
+        return hash((pid, page_number)) & (self.num_buckets - 1)
+        
+    def find(self, pid: int, page_number: int) -> Tuple[Optional[int], int]:
+        # Devuelve (frame, sondeos) recorriendo la cadena del bucket
+        probes = 1
+        frame_number = self.anchors[self._bucket(pid, page_number)]
+        while frame_number >= 0:
+            if self.entry_pid[frame_number] == pid and self.entry_page[frame_number] == page_number:
+                return frame_number, probes
+            frame_number = self.chain_next[frame_number]
+            probes += 1
+        return None, probes
+        
+    def insert(self, pid: int, page_number: int, frame_number: int):
+        # Un frame reutilizado sale primero de la cadena anterior
+        self.remove(frame_number)
+        bucket = self._bucket(pid, page_number)
+        self.entry_pid[frame_number] = pid
+        self.entry_page[frame_number] = page_number
+        self.chain_next[frame_number] = self.anchors[bucket]
+        self.anchors[bucket] = frame_number
+        
+    def remove(self, frame_number: int):
+        # Entrada vacía: página -1 (el pid no sirve, los segmentos compartidos usan pids negativos)
+        if self.entry_page[frame_number] < 0:
+            return
+        pid = self.entry_pid[frame_number]
+        bucket = self._bucket(pid, self.entry_page[frame_number])
+        previous = -1
+        current = self.anchors[bucket]
+        while current >= 0 and current != frame_number:
+            previous = current
+            current = self.chain_next[current]
+        if current == frame_number:
+            if previous < 0:
+                self.anchors[bucket] = self.chain_next[current]
+            else:
+                self.chain_next[previous] = self.chain_next[current]
+        self.entry_pid[frame_number] = -1
+        self.entry_page[frame_number] = -1
+        self.chain_next[frame_number] = -1
+        
+    def memory_overhead(self) -> int:
+        return len(self.entry_pid) * self.ENTRY_SIZE + self.num_buckets * self.ANCHOR_SIZE
+
+#Vista por proceso sobre la tabla invertida global
+class InvertedPageTableView(PageTable):
+    def __init__(self, num_pages: int, pid: int, inverted_table: InvertedPageTable):
+        super().__init__(num_pages)
+        self.pid = pid
+        self.inverted_table = inverted_table
+        # Metadatos de software de las páginas tocadas (no forman parte de la IPT)
+        self.entries: Dict[int, Page] = {}
+        
+    def get(self, page_number: int) -> Optional[Page]:
+        if not 0 <= page_number < self.num_pages:
+            return None
+        page = self.entries.get(page_number)
+        if page is None:
+            page = Page(page_number=page_number)
+            self.entries[page_number] = page
+        return page
+        
+    def peek(self, page_number: int) -> Optional[Page]:
+        return self.entries.get(page_number)
+        
+    def walk(self, page_number: int) -> Optional[Page]:
+        # El costo es el número de sondeos en la cadena del hash
+        _, probes = self.inverted_table.find(self.pid, page_number)
+        self.lookups += 1
+        self.walk_steps += probes
+        return self.get(page_number)
+        
+    def pages(self) -> List[Page]:
+        return list(self.entries.values())
+        
+    def touched_pages(self) -> int:
+        return len(self.entries)
+        
+    def on_map(self, page_number: int, frame_number: int):
+        self.inverted_table.insert(self.pid, page_number, frame_number)
+        
+    def on_unmap(self, page_number: int, frame_number: int):
+        self.inverted_table.remove(frame_number)
+        
+    def memory_overhead(self) -> int:
+        # El tamaño lo fija la IPT global, contabilizada una sola vez
+        return 0
+
+#Área de swap respaldada por un archivo local, en slots del tamaño de página
+class SwapArea:
+    def __init__(self, page_size: int, num_slots: int = 1024, path: Optional[str] = None,
+                 use_mmap: bool = False):
+        self.page_size = page_size
+        self.path = path
+        self.use_mmap = use_mmap
+        self._file = open(path, 'w+b') if path else tempfile.TemporaryFile()
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self.num_slots = 0
+        self._free_slots: List[int] = []
+        self._grow(max(num_slots, 1))
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.writes = 0
+        self.reads = 0
+        self.copy_seconds = 0.0
+        
+    def _grow(self, extra_slots: int):
+        # Ampliar el archivo; los slots nuevos se entregan en orden ascendente
+        start = self.num_slots
+        self.num_slots += extra_slots
+        if self._view is not None:
+            self._view.release()
+            self._map.close()
+        self._file.truncate(self.num_slots * self.page_size)
+        if self.use_mmap:
+            self._map = mmap.mmap(self._file.fileno(), self.num_slots * self.page_size)
+            self._view = memoryview(self._map)
+        self._free_slots.extend(range(self.num_slots - 1, start - 1, -1))
+        
+    def allocate(self) -> int:
+        if not self._free_slots:
+            self._grow(self.num_slots)
+        return self._free_slots.pop()
+        
+    def free(self, slot: int):
+        self._free_slots.append(slot)
+        
+    def write(self, slot: int, data):
+        # data puede ser un memoryview de un frame: se copia sin buffers intermedios
+        start = time.perf_counter()
+        offset = slot * self.page_size
+        if self._view is not None:
+            self._view[offset:offset + len(data)] = data
+        else:
+            self._file.seek(offset)
+            self._file.write(data)
+        self.copy_seconds += time.perf_counter() - start
+        self.bytes_written += len(data)
+        self.writes += 1
+        
+    def read(self, slot: int, into: Optional[memoryview] = None):
+        # Con into se copia directamente al frame destino; si no, se devuelven bytes
+        start = time.perf_counter()
+        offset = slot * self.page_size
+        if into is not None:
+            if self._view is not None:
+                into[:] = self._view[offset:offset + len(into)]
+            else:
+                self._file.seek(offset)
+                self._file.readinto(into)
+            data = into
+        else:
+            self._file.seek(offset)
+            data = self._file.read(self.page_size)
+        self.copy_seconds += time.perf_counter() - start
+        self.bytes_read += len(data)
+        self.reads += 1
+        return data
+        
+    def copy_slot(self, src: int) -> int:
+        # Duplica un slot (fork de una página que está en swap)
+        dst = self.allocate()
+        start = time.perf_counter()
+        if self._view is not None:
+            self._view[dst * self.page_size:(dst + 1) * self.page_size] = \
+                self._view[src * self.page_size:(src + 1) * self.page_size]
+        else:
+            self._file.seek(src * self.page_size)
+            data = self._file.read(self.page_size)
+            self._file.seek(dst * self.page_size)
+            self._file.write(data)
+        self.copy_seconds += time.perf_counter() - start
+        self.bytes_read += self.page_size
+        self.bytes_written += self.page_size
+        self.reads += 1
+        self.writes += 1
+        return dst
+        
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._map.close()
+        self._file.close()
+        
+    def get_statistics(self) -> dict:
+        return {
+            'path': self.path,
+            'slots': self.num_slots,
+            'slots_used': self.num_slots - len(self._free_slots),
+            'bytes_written': self.bytes_written,
+            'bytes_read': self.bytes_read,
+            'writes': self.writes,
+            'reads': self.reads,
+            'mmap': self.use_mmap,
+            # Ancho de banda real de copia entre frames y swap (MB/s)
+            'copy_bandwidth': ((self.bytes_written + self.bytes_read) / self.copy_seconds / 2**20
+                               if self.copy_seconds > 0 else 0)
+        }
+
+#Memoria física real: cada frame es una porción de un único arena mmap anónimo
+class FrameArena:
+    def __init__(self, num_frames: int, frame_bytes: int):
+        self.frame_bytes = frame_bytes
+        self._map = mmap.mmap(-1, num_frames * frame_bytes)
+        self._view = memoryview(self._map)
+        self._zero = bytes(frame_bytes)
+        self._files: Dict[int, Tuple[object, mmap.mmap, memoryview]] = {}
+        self.zero_fills = 0
+        self.file_fills = 0
+        self.bytes_filled = 0
+        self.fill_seconds = 0.0
+        
+    def frame(self, frame_number: int) -> memoryview:
+        start = frame_number * self.frame_bytes
+        return self._view[start:start + self.frame_bytes]
+        
+    def map_file(self, pid: int, path: str):
+        # Archivo de respaldo del proceso (imagen): la página n son los bytes n*frame_bytes
+        self.unmap_file(pid)
+        f = open(path, 'rb')
+        if os.fstat(f.fileno()).st_size == 0:
+            f.close()
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._files[pid] = (f, mapped, memoryview(mapped))
+        
+    def share_file(self, parent: int, child: int):
+        entry = self._files.get(parent)
+        if entry is not None:
+            self.map_file(child, entry[0].name)
+        
+    def unmap_file(self, pid: int):
+        entry = self._files.pop(pid, None)
+        if entry is not None:
+            f, mapped, view = entry
+            view.release()
+            mapped.close()
+            f.close()
+            
+    def fill(self, frame_number: int, pid: int, page_number: int):
+        # Página que nunca fue a swap: se copia del archivo de respaldo o se llena de ceros
+        start = time.perf_counter()
+        dest = self.frame(frame_number)
+        entry = self._files.get(pid)
+        offset = page_number * self.frame_bytes
+        if entry is not None and offset < len(entry[2]):
+            src = entry[2][offset:offset + self.frame_bytes]
+            dest[:len(src)] = src
+            dest[len(src):] = self._zero[len(src):]
+            self.file_fills += 1
+        else:
+            dest[:] = self._zero
+            self.zero_fills += 1
+        self.bytes_filled += self.frame_bytes
+        self.fill_seconds += time.perf_counter() - start
+        
+    def get_statistics(self) -> dict:
+        return {
+            'frame_bytes': self.frame_bytes,
+            'arena_bytes': len(self._view),
+            'mapped_files': len(self._files),
+            'zero_fills': self.zero_fills,
+            'file_fills': self.file_fills,
+            'bytes_filled': self.bytes_filled,
+            'fill_bandwidth': (self.bytes_filled / self.fill_seconds / 2**20
+                               if self.fill_seconds > 0 else 0)
+        }
+
+#Modelo de TLB: cache de traducciones (asid, página) -> frame
+class TLB:
+    def __init__(self, size: int = 16, associativity: int = 4, replacement: str = 'LRU',
+                 use_asid: bool = True, tlb_access_time: float = 1.0,
+                 memory_access_time: float = 100.0, page_table_levels: int = 1):
+        # associativity >= size equivale a una TLB totalmente asociativa
+        self.size = size
+        self.associativity = max(1, min(associativity, size))
+        self.num_sets = max(1, size // self.associativity)
+        self.replacement = replacement
+        self.use_asid = use_asid
+        self.tlb_access_time = tlb_access_time
+        self.memory_access_time = memory_access_time
+        self.page_table_levels = page_table_levels
+        self.sets: List['OrderedDict[Tuple[int, int], int]'] = [
+            OrderedDict() for _ in range(self.num_sets)
+        ]
+        self._rng = random.Random(0)
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.context_switches = 0
+        
+    def _set_for(self, page_number: int) -> 'OrderedDict[Tuple[int, int], int]':
+        return self.sets[page_number % self.num_sets]
+        
+    def _tag(self, pid: int, page_number: int) -> Tuple[int, int]:
+        # Sin ASID todas las entradas comparten etiqueta y se vacían en cada cambio
+        return (pid if self.use_asid else 0, page_number)
+        
+    def lookup(self, pid: int, page_number: int) -> Optional[int]:
+        entries = self._set_for(page_number)
+        tag = self._tag(pid, page_number)
+        frame_number = entries.get(tag)
+        if frame_number is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.replacement == 'LRU':
+            entries.move_to_end(tag)
+        return frame_number
+        
+    def insert(self, pid: int, page_number: int, frame_number: int):
+        entries = self._set_for(page_number)
+        tag = self._tag(pid, page_number)
+        if tag not in entries and len(entries) >= self.associativity:
+            if self.replacement == 'RANDOM':
+                del entries[self._rng.choice(list(entries))]
+            else:
+                entries.popitem(last=False)
+        entries[tag] = frame_number
+        entries.move_to_end(tag)
+        
+    def invalidate(self, pid: int, page_number: int):
+        self._set_for(page_number).pop(self._tag(pid, page_number), None)
+        
+    def flush(self, pid: Optional[int] = None):
+        if pid is None or not self.use_asid:
+            for entries in self.sets:
+                entries.clear()
+        else:
+            for entries in self.sets:
+                for tag in [t for t in entries if t[0] == pid]:
+                    del entries[tag]
+        self.flushes += 1
+        
+    def context_switch(self, old_pid: Optional[int], new_pid: Optional[int]):
+        # Con ASID las entradas sobreviven al cambio de contexto
+        self.context_switches += 1
+        if not self.use_asid:
+            self.flush()
+            
+    def effective_access_time(self) -> float:
+        total = self.hits + self.misses
+        hit_ratio = self.hits / total if total > 0 else 0
+        hit_cost = self.tlb_access_time + self.memory_access_time
+        miss_cost = (self.tlb_access_time
+                     + self.page_table_levels * self.memory_access_time
+                     + self.memory_access_time)
+        return hit_ratio * hit_cost + (1 - hit_ratio) * miss_cost
+        
+    def get_statistics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'size': self.size,
+            'associativity': self.associativity,
+            'replacement': self.replacement,
+            'asid': self.use_asid,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total * 100) if total > 0 else 0,
+            'flushes': self.flushes,
+            'context_switches': self.context_switches,
+            'effective_access_time': self.effective_access_time()
+        }
+
+#Páginas grandes: regiones alineadas de factor páginas base en frames contiguos
+class HugePagePolicy:
+    def __init__(self, factor: int = 8, promote_threshold: float = 1.0,
+                 min_process_pages: Optional[int] = None):
+        self.factor = factor
+        # Fracción de la región que debe estar residente para promoverla
+        self.promote_threshold = promote_threshold
+        # Solo procesos con huella grande usan páginas grandes
+        self.min_process_pages = min_process_pages if min_process_pages is not None else 2 * factor
+        self.mappings: Dict[Tuple[int, int], int] = {}        # (pid, región) -> primer frame
+        self.frame_region: Dict[int, Tuple[int, int]] = {}    # frame -> (pid, región)
+        self.promotions = 0
+        self.in_place_promotions = 0
+        self.pages_migrated = 0
+        self.promotion_failures = 0
+        self.demotions = 0
+        
+    def region_pages(self, region: int) -> range:
+        return range(region * self.factor, (region + 1) * self.factor)
+
+#Readahead adaptativo: precarga las siguientes páginas en accesos secuenciales
+class ReadaheadPolicy:
+    def __init__(self, initial_window: int = 4, min_window: int = 1, max_window: int = 32):
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.windows: Dict[int, int] = {}          # pid -> tamaño de ventana actual
+        self.last_fault: Dict[int, int] = {}       # pid -> última página con fallo
+        self.next_expected: Dict[int, int] = {}    # pid -> página tras la última ventana
+        self.prefetch_issued = 0
+        self.prefetch_hits = 0
+        self.prefetch_wasted = 0
+        
+    def on_fault(self, pid: int, page_number: int) -> List[int]:
+        # Devuelve las páginas a precargar si el patrón es secuencial
+        sequential = (self.last_fault.get(pid) == page_number - 1
+                      or self.next_expected.get(pid) == page_number)
+        self.last_fault[pid] = page_number
+        if not sequential:
+            return []
+        window = self.windows.setdefault(pid, self.initial_window)
+        self.next_expected[pid] = page_number + window + 1
+        return list(range(page_number + 1, page_number + window + 1))
+        
+    def on_prefetch_hit(self, pid: int):
+        # La precarga acertó: ampliar la ventana
+        self.prefetch_hits += 1
+        window = self.windows.get(pid, self.initial_window)
+        self.windows[pid] = min(self.max_window, window * 2)
+        
+    def on_prefetch_wasted(self, pid: int):
+        # Página precargada desalojada sin usarse: reducir la ventana
+        self.prefetch_wasted += 1
+        window = self.windows.get(pid, self.initial_window)
+        self.windows[pid] = max(self.min_window, window // 2)
+        
+    def forget(self, pid: int):
+        self.windows.pop(pid, None)
+        self.last_fault.pop(pid, None)
+        self.next_expected.pop(pid, None)
+        
+    def get_statistics(self) -> dict:
+        return {
+            'prefetch_issued': self.prefetch_issued,
+            'prefetch_hits': self.prefetch_hits,
+            'prefetch_wasted': self.prefetch_wasted,
+            'prefetch_hit_rate': (self.prefetch_hits / self.prefetch_issued * 100
+                                  if self.prefetch_issued > 0 else 0),
+            'windows': dict(self.windows)
+        }
+
+#Conjunto de trabajo por proceso y control de asignación por frecuencia de fallos (PFF)
+class WorkingSetController:
+    def __init__(self, tau: int = 50, lower_fault_rate: float = 0.05,
+                 upper_fault_rate: float = 0.25, interval: int = 20,
+                 initial_frames: int = 4, min_frames: int = 1):
+        self.tau = tau                  # Ventana del conjunto de trabajo (referencias propias)
+        self.lower_fault_rate = lower_fault_rate
+        self.upper_fault_rate = upper_fault_rate
+        self.interval = interval        # Referencias entre evaluaciones del PFF
+        self.initial_frames = initial_frames
+        self.min_frames = min_frames
+        self.virtual_time: Dict[int, int] = {}
+        # Últimas tau referencias de cada proceso y cuántas veces aparece cada página
+        self.windows: Dict[int, deque] = {}
+        self.window_counts: Dict[int, Dict[int, int]] = {}
+        self.interval_refs: Dict[int, int] = {}
+        self.interval_faults: Dict[int, int] = {}
+        self.fault_rates: Dict[int, float] = {}
+        self.quotas: Dict[int, int] = {}
+        self.suspended: List[int] = []
+        self.grows = 0
+        self.shrinks = 0
+        self.suspensions = 0
+        self.resumptions = 0
+        
+    def tick(self, pid: int, page_number: int) -> int:
+        # Avanza el tiempo virtual del proceso y desliza su ventana en O(1)
+        self.virtual_time[pid] = self.virtual_time.get(pid, 0) + 1
+        window = self.windows.setdefault(pid, deque())
+        counts = self.window_counts.setdefault(pid, {})
+        window.append(page_number)
+        counts[page_number] = counts.get(page_number, 0) + 1
+        if len(window) > self.tau:
+            old = window.popleft()
+            counts[old] -= 1
+            if counts[old] == 0:
+                del counts[old]
+        return self.virtual_time[pid]
+        
+    def working_set_size(self, pid: int) -> int:
+        # |W(t, tau)|: páginas distintas en las últimas tau referencias
+        return len(self.window_counts.get(pid, ()))
+        
+    def quota(self, pid: int) -> int:
+        return self.quotas.setdefault(pid, self.initial_frames)
+        
+    def record(self, pid: int, fault: bool) -> Optional[float]:
+        # Devuelve la tasa de fallos al cerrar cada intervalo
+        self.interval_refs[pid] = self.interval_refs.get(pid, 0) + 1
+        if fault:
+            self.interval_faults[pid] = self.interval_faults.get(pid, 0) + 1
+        if self.interval_refs[pid] < self.interval:
+            return None
+        rate = self.interval_faults.get(pid, 0) / self.interval_refs[pid]
+        self.fault_rates[pid] = rate
+        self.interval_refs[pid] = 0
+        self.interval_faults[pid] = 0
+        return rate
+        
+    def adjust(self, pid: int, rate: float, max_frames: int) -> int:
+        # PFF: más frames si falla mucho, menos si casi no falla
+        quota = self.quota(pid)
+        if rate > self.upper_fault_rate and quota < max_frames:
+            quota += 1
+            self.grows += 1
+        elif rate < self.lower_fault_rate and quota > self.min_frames:
+            quota -= 1
+            self.shrinks += 1
+        self.quotas[pid] = quota
+        return quota
+        
+    def forget(self, pid: int):
+        for table in (self.virtual_time, self.windows, self.window_counts,
+                      self.interval_refs, self.interval_faults, self.fault_rates, self.quotas):
+            table.pop(pid, None)
+        if pid in self.suspended:
+            self.suspended.remove(pid)
+
 #Gestor de paginaciones
 class PagingManager:
-    def __init__(self, total_frames: int, page_size: int = 4096):
+    PAGE_TABLE_TYPES = ('flat', 'two_level', 'three_level', 'inverted')
+    CLEAN_SCAN_LIMIT = 8  # Candidatas que FIFO/LRU revisan buscando una página limpia
+    
+    def __init__(self, total_frames: int, page_size: int = 4096, page_table_type: str = 'flat'):
+        if page_table_type not in self.PAGE_TABLE_TYPES:
+            raise ValueError(f"Tipo de tabla de páginas desconocido: {page_table_type}")
         self.page_size = page_size
         self.frames: List[Frame] = [Frame(i) for i in range(total_frames)]
-        self.page_tables: Dict[int, Dict[int, Page]] = {}  # pid -> {page_num: Page}
+        self.free_frames = FreeFramePool(total_frames)
+        self.page_table_type = page_table_type
+        self.page_tables: Dict[int, PageTable] = {}  # pid -> tabla de páginas
+        self.inverted_table = (InvertedPageTable(total_frames)
+                               if page_table_type == 'inverted' else None)
+        self.page_table_lookups = 0
+        self.page_table_walk_steps = 0
+        # Mapa inverso frame -> (pid, página) vive en Frame; aquí los frames de cada pid
+        self.resident_frames: Dict[int, Set[int]] = {}
+        self.frames_reclaimed = 0
         self.page_faults = 0
         self.page_accesses = 0
+        # LRU exacto: frames residentes de menos a más recientemente usado
+        self.access_counter = 0
+        self.lru_order: 'OrderedDict[int, None]' = OrderedDict()
+        # FIFO: cola de (frame, load_seq) en orden de carga
+        self.load_counter = 0
+        self.fifo_queue: deque = deque()
+        # CLOCK: manecilla circular persistente sobre los frames
+        self.clock_hand = 0
+        # OPT: cadena de referencias futura, próximos usos y montículo máximo
+        self.future_references: List[Tuple[int, int]] = []
+        self.future_next_use: List[int] = []
+        self.reference_position = 0
+        self.opt_heap: List[Tuple[float, int]] = []
+        # Referencias recientes de esta ejecución (para comparar algoritmos); se conservan
+        # las últimas trace_limit (16 bytes cada una) para no crecer sin límite
+        self.trace_pids = array('q')
+        self.trace_pages = array('q')
+        self.trace_limit = 1 << 20
+        # TLB opcional delante de las tablas de páginas
+        self.tlb: Optional[TLB] = None
+        self.huge: Optional[HugePagePolicy] = None
+        # Readahead opcional para fallos secuenciales
+        self.readahead: Optional[ReadaheadPolicy] = None
+        # Conjunto de trabajo, WSClock y control PFF opcionales
+        self.working_set: Optional[WorkingSetController] = None
+        self.wsclock_hand = 0
+        self.suspend_listeners: List[Callable[[int], None]] = []
+        self.resume_listeners: List[Callable[[int], None]] = []
+        # Write-back de páginas sucias al dispositivo de swap
+        self.io_manager = None
+        self.swap_device: Optional[str] = None
+        self.swap_area: Optional[SwapArea] = None
+        self.arena: Optional[FrameArena] = None
+        self.frame_bytes = page_size
+        self._zero_page = bytes(page_size)
+        self.swapped_out: Dict[int, List[int]] = {}  # pid -> páginas residentes al salir
+        # Memoria compartida: cada segmento tiene su propia tabla bajo un pid negativo
+        self.shm_segments: Dict[str, dict] = {}
+        self.shm_attachments: Dict[int, List[Tuple[int, int, str]]] = {}  # pid -> (base, páginas, nombre)
+        self.next_shm_id = 1
+        # Copy-on-write: frame -> proyecciones (pid, página) que lo comparten
+        self.frame_sharers: Dict[int, Set[Tuple[int, int]]] = {}
+        self.forks = 0
+        self.cow_forks = 0
+        self.fork_seconds = 0.0
+        self.fork_pages_shared = 0
+        self.fork_pages_copied = 0
+        self.cow_faults = 0
+        self.cow_pages_copied = 0
+        self.dirty_frames: Set[int] = set()
+        self.pages_dirtied = 0
+        self.dirty_evictions = 0
+        self.eviction_writebacks = 0
+        self.cleaner_writebacks = 0
+        self.cleaner_batches = 0
+        self.swap_bytes_written = 0
+        
+    def enable_swap(self, num_slots: int = 1024, path: Optional[str] = None,
+                    use_mmap: bool = False) -> SwapArea:
+        if self.swap_area is not None:
+            self.swap_area.close()
+        self.swap_area = SwapArea(self.frame_bytes, num_slots, path, use_mmap)
+        return self.swap_area
+        
+    def enable_backing_store(self, frame_bytes: Optional[int] = None, swap_slots: int = 1024,
+                             swap_path: Optional[str] = None) -> FrameArena:
+        """Frames con contenido real en un arena mmap y swap mmap; debe llamarse antes de usar memoria"""
+        self.frame_bytes = frame_bytes or self.page_size
+        self._zero_page = bytes(self.frame_bytes)
+        self.arena = FrameArena(len(self.frames), self.frame_bytes)
+        self.enable_swap(swap_slots, swap_path, use_mmap=True)
+        return self.arena
+        
+    def map_backing_file(self, pid: int, path: str):
+        if self.arena is not None:
+            self.arena.map_file(pid, path)
+            
+    def page_data(self, pid: int, page_number: int) -> Optional[memoryview]:
+        # Contenido del frame donde reside la página (None si no está residente)
+        if pid in self.shm_attachments:
+            pid, page_number = self._resolve_shared(pid, page_number)
+        table = self.page_tables.get(pid)
+        page = table.peek(page_number) if table is not None else None
+        if self.arena is None or page is None or not page.valid:
+            return None
+        return self.arena.frame(page.frame_number)
+        
+    def attach_swap_device(self, io_manager, device_name: str = 'swap0', speed: int = 50):
+        # Las escrituras de páginas sucias pasan por el subsistema de E/S
+        if device_name not in io_manager.devices:
+            # Disco dimensionado para la capacidad actual del área de swap
+            geometry = DiskGeometry()
+            if self.swap_area is not None:
+                sectors = self.swap_area.num_slots * self.page_size * 2
+                per_cylinder = geometry.heads * geometry.sectors_per_track
+                geometry.cylinders = max(geometry.cylinders, -(-sectors // per_cylinder))
+            io_manager.add_device(device_name, DeviceType.DISK, speed=speed, geometry=geometry)
+        self.io_manager = io_manager
+        self.swap_device = device_name
+        
+    def enable_working_set(self, **config) -> WorkingSetController:
+        self.working_set = WorkingSetController(**config)
+        return self.working_set
+        
+    def enable_huge_pages(self, **config) -> HugePagePolicy:
+        self.huge = HugePagePolicy(**config)
+        return self.huge
+        
+    def enable_readahead(self, **config) -> ReadaheadPolicy:
+        self.readahead = ReadaheadPolicy(**config)
+        return self.readahead
+        
+    def enable_tlb(self, **config) -> TLB:
+        # Un fallo de TLB cuesta tantos accesos a memoria como niveles tenga la tabla
+        config.setdefault('page_table_levels', self._page_table_levels())
+        self.tlb = TLB(**config)
+        return self.tlb
+        
+    def _page_table_levels(self) -> int:
+        return {'two_level': 2, 'three_level': 3}.get(self.page_table_type, 1)
         
     def create_page_table(self, pid: int, num_pages: int):
-        self.page_tables[pid] = {
-            i: Page(page_number=i) 
-            for i in range(num_pages)
-        }
-        print(f"Tabla de páginas creada para P{pid}: {num_pages} páginas")
+        if self.page_table_type == 'flat':
+            table = FlatPageTable(num_pages)
+        elif self.page_table_type == 'two_level':
+            table = RadixPageTable(num_pages, levels=2, bits_per_level=10)
+        elif self.page_table_type == 'three_level':
+            table = RadixPageTable(num_pages, levels=3, bits_per_level=9)
+        else:
+            table = InvertedPageTableView(num_pages, pid, self.inverted_table)
+        self.page_tables[pid] = table
+        print(f"Tabla de páginas creada para P{pid}: {num_pages} páginas ({self.page_table_type})")
         
-    def access_page(self, pid: int, page_number: int) -> bool:
+    def access_page(self, pid: int, page_number: int, write: bool = False) -> bool:
         self.page_accesses += 1
         
-        if pid not in self.page_tables:
+        # Las páginas de un segmento compartido se resuelven en la tabla del segmento
+        vpid, vpage = pid, page_number
+        if pid in self.shm_attachments:
+            pid, page_number = self._resolve_shared(pid, page_number)
+        
+        table = self.page_tables.get(pid)
+        if table is None:
             return False
             
-        page = self.page_tables[pid].get(page_number)
+        # Una página grande ocupa una sola entrada de TLB para toda la región
+        tlb_page = page_number
+        huge_mapped = (self.huge is not None and
+                       (pid, page_number // self.huge.factor) in self.huge.mappings)
+        if huge_mapped:
+            tlb_page = self._huge_tlb_key(page_number // self.huge.factor)
+            
+        # Consultar la TLB antes de recorrer la tabla de páginas
+        tlb_hit = self.tlb is not None and self.tlb.lookup(pid, tlb_page) is not None
+        if tlb_hit:
+            page = table.peek(page_number)
+        else:
+            steps_before = table.walk_steps
+            page = table.walk(page_number)
+            if huge_mapped and table.levels > 1:
+                # La entrada de página grande está en el penúltimo nivel
+                table.walk_steps -= 1
+            self.page_table_lookups += 1
+            self.page_table_walk_steps += table.walk_steps - steps_before
         if not page:
             return False
             
+        # Primera escritura sobre una página compartida: copiarla
+        if write and page.cow and page.valid:
+            self._cow_fault(pid, page)
+            
         # Actualizar estadísticas
-        page.last_access_time = time.time()
+        self.access_counter += 1
+        page.last_access_time = self.access_counter
         page.reference_count += 1
         page.referenced = True
+        if write and not page.modified:
+            page.modified = True
+            self.pages_dirtied += 1
+        page.next_use = self._advance_reference_string(pid, page_number)
+        self.trace_pids.append(pid)
+        self.trace_pages.append(page_number)
+        if len(self.trace_pids) >= 2 * self.trace_limit:
+            # Se descartan en bloque las más antiguas: O(1) amortizado por referencia
+            del self.trace_pids[:-self.trace_limit]
+            del self.trace_pages[:-self.trace_limit]
+        
+        if self.working_set is not None:
+            page.last_use_vtime = self.working_set.tick(vpid, vpage)
+            rate = self.working_set.record(vpid, not page.valid)
+            if rate is not None:
+                self._adjust_allocation(vpid, rate)
         
         # Si la página no está en memoria física
         if not page.valid:
@@ -143,13 +1226,75 @@ class PagingManager:
             print(f"  Page Fault: P{pid}, Página {page_number}")
             return True
             
+        if self.tlb is not None and not tlb_hit:
+            # El fallo COW o el ajuste de cuota pueden haber dividido la página grande
+            huge_base = (self.huge.mappings.get((pid, page_number // self.huge.factor))
+                         if huge_mapped else None)
+            if huge_base is not None:
+                self.tlb.insert(pid, tlb_page, huge_base)
+            else:
+                self.tlb.insert(pid, page_number, page.frame_number)
+        if page.modified:
+            self.dirty_frames.add(page.frame_number)
+            if write and self.arena is not None:
+                # Escritura real sobre el contenido del frame
+                self.arena.frame(page.frame_number)[0] = self.access_counter & 0xFF
+            
+        if page.prefetched:
+            page.prefetched = False
+            if self.readahead is not None:
+                self.readahead.on_prefetch_hit(pid)
+            
+        # Acierto: mover al extremo MRU en O(1)
+        self.lru_order.move_to_end(page.frame_number)
+        self._push_opt(page.frame_number, page)
         return False
         
     def load_page(self, pid: int, page_number: int, replacement_algo: str = 'FIFO') -> bool:
+        if pid in self.shm_attachments:
+            pid, page_number = self._resolve_shared(pid, page_number)
+        if not self._load(pid, page_number, replacement_algo):
+            return False
+        # Un fallo durante la suspensión ya trajo la página: el swap-in no debe recargarla
+        pending = self.swapped_out.get(pid)
+        if pending and page_number in pending:
+            pending.remove(page_number)
+            
+        # Precargar las páginas siguientes si el fallo es secuencial
+        if self.readahead is not None:
+            table = self.page_tables[pid]
+            for next_page in self.readahead.on_fault(pid, page_number):
+                if next_page not in table:
+                    break
+                existing = table.peek(next_page)
+                if existing is not None and existing.valid:
+                    continue
+                if self._load(pid, next_page, replacement_algo):
+                    table.peek(next_page).prefetched = True
+                    self.readahead.prefetch_issued += 1
+                    
+        if self.huge is not None:
+            self._try_promote(pid, page_number // self.huge.factor)
+        return True
+        
+    def _load(self, pid: int, page_number: int, replacement_algo: str) -> bool:
         if pid not in self.page_tables:
             return False
             
-        page = self.page_tables[pid][page_number]
+        page = self.page_tables[pid].get(page_number)
+        if page is None:
+            return False
+            
+        # Con asignación local, un proceso en su cuota reemplaza sus propias páginas
+        # (los segmentos compartidos, con pid negativo, no tienen cuota)
+        if self.working_set is not None and pid >= 0:
+            if pid in self.working_set.suspended:
+                return False
+            if len(self.resident_frames.get(pid, ())) >= self.working_set.quota(pid):
+                victim_frame = self._local_victim(pid)
+                if victim_frame is not None:
+                    self._replace_page(victim_frame, pid, page_number)
+                    return True
         
         # Buscar frame libre
         free_frame = self._find_free_frame()
@@ -164,6 +1309,8 @@ class PagingManager:
             page.frame_number = free_frame
             page.valid = True
             page.load_time = time.time()
+            self._track_load(free_frame)
+            self._fill_frame(free_frame)
             
             print(f"  Página {page_number} cargada en frame {free_frame}")
             return True
@@ -177,11 +1324,679 @@ class PagingManager:
         return False
         
     def _find_free_frame(self) -> Optional[int]:
-        for frame in self.frames:
-            if not frame.occupied:
-                return frame.frame_number
+        return self.free_frames.allocate()
+        
+    def _release_frame(self, frame_number: int):
+        if self.huge is not None and frame_number in self.huge.frame_region:
+            self._demote(*self.huge.frame_region[frame_number])
+        frame = self.frames[frame_number]
+        if frame.process_id is not None:
+            table = self.page_tables.get(frame.process_id)
+            if table is not None:
+                page = table.peek(frame.page_number)
+                if page is not None:
+                    self._check_wasted_prefetch(frame.process_id, page)
+                    page.valid = False
+                    page.frame_number = None
+                table.on_unmap(frame.page_number, frame_number)
+            if self.tlb is not None:
+                self.tlb.invalidate(frame.process_id, frame.page_number)
+            self.resident_frames.get(frame.process_id, set()).discard(frame_number)
+        self.dirty_frames.discard(frame_number)
+        frame.occupied = False
+        frame.process_id = None
+        frame.page_number = None
+        self.lru_order.pop(frame_number, None)
+        self.free_frames.free(frame_number)
+        
+    def _store_in_swap(self, page: Page):
+        if self.swap_area is None:
+            return
+        if page.swap_slot is None:
+            page.swap_slot = self.swap_area.allocate()
+        if self.arena is not None and page.frame_number is not None:
+            self.swap_area.write(page.swap_slot, self.arena.frame(page.frame_number))
+        else:
+            self.swap_area.write(page.swap_slot, self._zero_page)
+        
+    def _swap_lba(self, page: Page) -> Optional[int]:
+        # Sector del disco de swap donde empieza el slot de la página (page_size en KB, sectores de 512 B)
+        if page.swap_slot is None:
+            return None
+        sectors = self.page_size * 2
+        geometry = self.io_manager.devices[self.swap_device].geometry
+        if geometry is None:
+            return page.swap_slot * sectors
+        # El área de swap crece sin límite: los slots que no caben se pliegan dentro del disco
+        disk_slots = max(geometry.total_sectors() // sectors, 1)
+        return (page.swap_slot % disk_slots) * sectors
+        
+    def _write_back(self, pid: int, page: Page, reason: str):
+        # Escribir la página sucia en swap a través del IOManager
+        page.modified = False
+        if page.frame_number is not None:
+            self.dirty_frames.discard(page.frame_number)
+        if reason == 'eviction':
+            self.dirty_evictions += 1
+        self._store_in_swap(page)
+        if self.io_manager is None:
+            return
+        # page_size está en KB; el IOManager espera bytes
+        self.io_manager.request_io(pid, self.swap_device, 'write', self.page_size * 1024,
+                                   lba=self._swap_lba(page))
+        self.swap_bytes_written += self.page_size * 1024
+        if reason == 'eviction':
+            self.eviction_writebacks += 1
+        else:
+            self.cleaner_writebacks += 1
+            
+    def _evict_frame(self, frame_number: int):
+        # Desalojo (no salida del proceso): las páginas sucias se escriben antes
+        if frame_number in self.frame_sharers:
+            self._break_sharing(frame_number)
+        page = self._resident_page(self.frames[frame_number])
+        if page is not None and page.modified:
+            self._write_back(self.frames[frame_number].process_id, page, 'eviction')
+        self._release_frame(frame_number)
+        
+    def run_page_cleaner(self, batch_size: int = 8) -> int:
+        """Escribe en swap hasta batch_size páginas sucias con una sola solicitud de E/S"""
+        if self.io_manager is None or not self.dirty_frames:
+            return 0
+        batch = list(islice(self.dirty_frames, batch_size))
+        cleaned = 0
+        lba = None
+        for frame_number in batch:
+            page = self._resident_page(self.frames[frame_number])
+            self.dirty_frames.discard(frame_number)
+            if page is not None and page.modified:
+                self._store_in_swap(page)
+                page.modified = False
+                if lba is None:
+                    lba = self._swap_lba(page)
+                cleaned += 1
+        if cleaned:
+            self.io_manager.request_io(0, self.swap_device, 'write', cleaned * self.page_size * 1024,
+                                       lba=lba)
+            self.swap_bytes_written += cleaned * self.page_size * 1024
+            self.cleaner_writebacks += cleaned
+            self.cleaner_batches += 1
+        return cleaned
+        
+    def _is_dirty(self, frame_number: int) -> bool:
+        page = self._resident_page(self.frames[frame_number])
+        return page is not None and page.modified
+        
+    def get_writeback_statistics(self) -> dict:
+        pages_written = self.eviction_writebacks + self.cleaner_writebacks
+        return {
+            'swap_device': self.swap_device,
+            'dirty_pages': len(self.dirty_frames),
+            'pages_dirtied': self.pages_dirtied,
+            'dirty_evictions': self.dirty_evictions,
+            'eviction_writebacks': self.eviction_writebacks,
+            'cleaner_writebacks': self.cleaner_writebacks,
+            'cleaner_batches': self.cleaner_batches,
+            'swap_bytes_written': self.swap_bytes_written,
+            # Páginas escritas en swap por cada página ensuciada por los procesos
+            'write_amplification': (pages_written / self.pages_dirtied
+                                    if self.pages_dirtied > 0 else 0)
+        }
+        
+    def swap_out_process(self, pid: int) -> int:
+        """Lleva a swap todas las páginas residentes del proceso y libera sus frames"""
+        swapped = []
+        bytes_before = self.swap_area.bytes_written if self.swap_area is not None else 0
+        for frame_number in list(self.resident_frames.get(pid, ())):
+            if frame_number in self.frame_sharers:
+                # Frame compartido: solo se retira la proyección de este proceso
+                swapped.append(self._sharer_page(frame_number, pid))
+                self._unshare(frame_number, pid, keep_copy=True)
+                continue
+            page = self._resident_page(self.frames[frame_number])
+            if page is not None:
+                if page.modified or page.swap_slot is None:
+                    self._store_in_swap(page)
+                    page.modified = False
+                swapped.append(page.page_number)
+            self._release_frame(frame_number)
+        self.swapped_out[pid] = swapped
+        if self.swap_area is None:
+            return len(swapped) * self.page_size
+        return self.swap_area.bytes_written - bytes_before
+        
+    def swap_in_process(self, pid: int, replacement_algo: str = 'LRU') -> int:
+        """Recarga desde swap las páginas que el proceso tenía residentes"""
+        bytes_before = self.swap_area.bytes_read if self.swap_area is not None else 0
+        pages = self.swapped_out.pop(pid, [])
+        table = self.page_tables.get(pid)
+        for page_number in pages:
+            # Las que ya volvieron por un fallo de página conservan su frame
+            page = table.peek(page_number) if table is not None else None
+            if page is not None and page.valid:
+                continue
+            self._load(pid, page_number, replacement_algo)
+        if self.swap_area is None:
+            return len(pages) * self.page_size
+        return self.swap_area.bytes_read - bytes_before
+        
+    def fork_process(self, parent: int, child: int, cow: bool = True) -> Optional[dict]:
+        """Crea la memoria del hijo: frames compartidos (COW) o copia completa"""
+        parent_table = self.page_tables.get(parent)
+        if parent_table is None:
+            return None
+        start = time.perf_counter()
+        self.create_page_table(child, len(parent_table))
+        child_table = self.page_tables[child]
+        # La memoria compartida sigue compartida en el hijo (no es copy-on-write)
+        for base, _, name in self.shm_attachments.get(parent, ()):
+            self.attach_shared(child, name, base)
+        # Una tabla invertida solo admite una proyección por frame: se copia siempre
+        cow = cow and self.page_table_type != 'inverted'
+        if self.arena is not None:
+            self.arena.share_file(parent, child)
+        # Una página grande no se comparte COW: se divide antes de compartir sus frames
+        if cow and self.huge is not None:
+            for region in [r for owner, r in self.huge.mappings if owner == parent]:
+                self._demote(parent, region)
+        shared = copied = 0
+        for parent_page in parent_table.pages():
+            child_page = child_table.get(parent_page.page_number)
+            if parent_page.valid and cow:
+                self._share_frame(parent_page.frame_number, child, child_page)
+                parent_page.cow = True
+                # El hijo no tiene copia en swap propia: su frame cuenta como sucio
+                child_page.modified = parent_page.modified or parent_page.swap_slot is not None
+                shared += 1
+            elif parent_page.valid:
+                if self._load(child, child_page.page_number, 'LRU') and child_page.valid:
+                    self._copy_page(parent_page, child_page.frame_number)
+                    child_page.modified = True
+                    copied += 1
+            elif parent_page.swap_slot is not None and self.swap_area is not None:
+                child_page.swap_slot = self.swap_area.copy_slot(parent_page.swap_slot)
+                copied += 1
+        elapsed = time.perf_counter() - start
+        self.forks += 1
+        self.cow_forks += cow
+        self.fork_seconds += elapsed
+        self.fork_pages_shared += shared
+        self.fork_pages_copied += copied
+        print(f"Fork P{parent} -> P{child}: {shared} páginas compartidas, {copied} copiadas")
+        return {'cow': cow, 'pages_shared': shared, 'pages_copied': copied, 'seconds': elapsed}
+        
+    def _share_frame(self, frame_number: int, pid: int, page: Page):
+        frame = self.frames[frame_number]
+        sharers = self.frame_sharers.setdefault(frame_number, {(frame.process_id, frame.page_number)})
+        sharers.add((pid, page.page_number))
+        page.frame_number = frame_number
+        page.valid = True
+        page.cow = True
+        self.resident_frames.setdefault(pid, set()).add(frame_number)
+        self.page_tables[pid].on_map(page.page_number, frame_number)
+        
+    def _copy_page(self, src_page: Page, dst_frame: int):
+        # Copia real del contenido (solo con arena mmap)
+        if self.arena is None:
+            return
+        if src_page.valid:
+            self.arena.frame(dst_frame)[:] = self.arena.frame(src_page.frame_number)
+        elif src_page.swap_slot is not None:
+            self.swap_area.read(src_page.swap_slot, self.arena.frame(dst_frame))
+            
+    def _cow_fault(self, pid: int, page: Page):
+        self.cow_faults += 1
+        old_frame = page.frame_number
+        if len(self.frame_sharers.get(old_frame, ())) < 2:
+            # Último proceso que lo usaba: la página vuelve a ser privada sin copiar
+            page.cow = False
+            return
+        new_frame = self._find_free_frame()
+        if new_frame is None:
+            victim = self._select_victim('LRU')
+            if victim is None:
+                return
+            self._evict_frame(victim)
+            if not page.valid:
+                # Se desalojó el propio frame compartido: será un fallo de página normal
+                return
+            new_frame = self._find_free_frame()
+        self._unshare(old_frame, pid)
+        frame = self.frames[new_frame]
+        frame.occupied = True
+        frame.process_id = pid
+        frame.page_number = page.page_number
+        page.frame_number = new_frame
+        page.valid = True
+        page.load_time = time.time()
+        self._track_load(new_frame)
+        if self.arena is not None:
+            self.arena.frame(new_frame)[:] = self.arena.frame(old_frame)
+        self.cow_pages_copied += 1
+        print(f"  COW: P{pid}, Página {page.page_number} copiada al frame {new_frame}")
+        
+    def _sharer_page(self, frame_number: int, pid: int) -> Optional[int]:
+        for sharer_pid, page_number in self.frame_sharers.get(frame_number, ()):
+            if sharer_pid == pid:
+                return page_number
         return None
         
+    def _unshare(self, frame_number: int, pid: int, keep_copy: bool = False) -> bool:
+        """Quita la proyección de pid sobre un frame compartido; True si otros lo siguen usando"""
+        if self.huge is not None and self.huge.frame_region.get(frame_number, (None,))[0] == pid:
+            self._demote(*self.huge.frame_region[frame_number])
+        sharers = self.frame_sharers[frame_number]
+        page_number = self._sharer_page(frame_number, pid)
+        sharers.discard((pid, page_number))
+        table = self.page_tables.get(pid)
+        page = table.peek(page_number) if table is not None else None
+        if page is not None:
+            if keep_copy and (page.modified or page.swap_slot is None):
+                self._store_in_swap(page)
+                page.modified = False
+            page.valid = False
+            page.frame_number = None
+            page.cow = False
+            table.on_unmap(page_number, frame_number)
+        if self.tlb is not None:
+            self.tlb.invalidate(pid, page_number)
+        self.resident_frames.get(pid, set()).discard(frame_number)
+        frame = self.frames[frame_number]
+        if frame.process_id == pid and sharers:
+            # El frame pasa a otro de los procesos que lo comparten
+            frame.process_id, frame.page_number = next(iter(sharers))
+        if len(sharers) < 2:
+            for sharer_pid, sharer_page in sharers:
+                remaining = self.page_tables[sharer_pid].peek(sharer_page)
+                if remaining is not None:
+                    remaining.cow = False
+            del self.frame_sharers[frame_number]
+        return bool(sharers)
+        
+    def _break_sharing(self, frame_number: int):
+        # Antes de desalojar un frame compartido, cada proyección extra guarda su copia
+        owner = self.frames[frame_number].process_id
+        for sharer_pid, _ in list(self.frame_sharers[frame_number]):
+            if sharer_pid != owner:
+                self._unshare(frame_number, sharer_pid, keep_copy=True)
+                
+    def create_shared_segment(self, name: str, num_pages: int) -> bool:
+        if name in self.shm_segments:
+            return False
+        seg_pid = -self.next_shm_id
+        self.next_shm_id += 1
+        self.create_page_table(seg_pid, num_pages)
+        self.shm_segments[name] = {'pid': seg_pid, 'pages': num_pages, 'attached': set()}
+        return True
+        
+    def attach_shared(self, pid: int, name: str, base_page: Optional[int] = None) -> Optional[int]:
+        """Proyecta el segmento en el espacio del proceso; devuelve la página base"""
+        segment = self.shm_segments.get(name)
+        if segment is None or pid in segment['attached']:
+            return None
+        attachments = self.shm_attachments.setdefault(pid, [])
+        if base_page is None:
+            # Por defecto, justo después de las páginas privadas y de otros segmentos
+            table = self.page_tables.get(pid)
+            base_page = max([len(table) if table is not None else 0] +
+                            [base + size for base, size, _ in attachments])
+        attachments.append((base_page, segment['pages'], name))
+        segment['attached'].add(pid)
+        print(f"  Memoria compartida '{name}' proyectada en P{pid} desde la página {base_page}")
+        return base_page
+        
+    def detach_shared(self, pid: int, name: str):
+        segment = self.shm_segments.get(name)
+        if segment is None or pid not in segment['attached']:
+            return
+        segment['attached'].discard(pid)
+        attachments = [a for a in self.shm_attachments[pid] if a[2] != name]
+        if attachments:
+            self.shm_attachments[pid] = attachments
+        else:
+            del self.shm_attachments[pid]
+        if not segment['attached']:
+            # Última desconexión: se liberan sus frames y su swap
+            del self.shm_segments[name]
+            self.release_process(segment['pid'])
+            print(f"  Memoria compartida '{name}' liberada")
+            
+    def _resolve_shared(self, pid: int, page_number: int) -> Tuple[int, int]:
+        for base, size, name in self.shm_attachments[pid]:
+            if base <= page_number < base + size:
+                return self.shm_segments[name]['pid'], page_number - base
+        return pid, page_number
+        
+    def get_resident_statistics(self) -> dict:
+        """Memoria residente por proceso; las páginas compartidas cuentan una sola vez en el total"""
+        processes = {}
+        for pid, frames in self.resident_frames.items():
+            if pid < 0:
+                continue
+            private = shared = 0
+            pss = 0.0
+            for frame_number in frames:
+                sharers = self.frame_sharers.get(frame_number)
+                if sharers:
+                    shared += 1
+                    pss += 1 / len(sharers)
+                else:
+                    private += 1
+                    pss += 1
+            processes[pid] = {'private': private, 'shared': shared, 'pss': pss}
+        for segment in self.shm_segments.values():
+            resident = len(self.resident_frames.get(segment['pid'], ()))
+            for pid in segment['attached']:
+                entry = processes.setdefault(pid, {'private': 0, 'shared': 0, 'pss': 0.0})
+                entry['shared'] += resident
+                entry['pss'] += resident / len(segment['attached'])
+        for entry in processes.values():
+            entry['rss'] = entry['private'] + entry['shared']
+        return {
+            'processes': processes,
+            # Suma de RSS: cuenta cada página compartida una vez por proceso
+            'sum_rss': sum(e['rss'] for e in processes.values()),
+            'resident_frames': self.free_frames.used_count,
+            'shared_segments': {
+                name: {'pages': seg['pages'], 'refcount': len(seg['attached']),
+                       'resident': len(self.resident_frames.get(seg['pid'], ()))}
+                for name, seg in self.shm_segments.items()
+            }
+        }
+        
+    @staticmethod
+    def _huge_tlb_key(region: int) -> int:
+        # Clave negativa por región: no colisiona con números de página base
+        return -1 - region
+        
+    def _try_promote(self, pid: int, region: int) -> bool:
+        huge = self.huge
+        if (pid, region) in huge.mappings:
+            return False
+        table = self.page_tables.get(pid)
+        pages = huge.region_pages(region)
+        if table is None or len(table) < huge.min_process_pages or pages.stop > len(table):
+            return False
+        region_pages = [table.peek(n) for n in pages]
+        resident = [p for p in region_pages if p is not None and p.valid]
+        if len(resident) < huge.promote_threshold * huge.factor:
+            return False
+        if any(p.cow or p.frame_number in self.frame_sharers for p in resident):
+            return False
+            
+        first = region_pages[0].frame_number if region_pages[0] is not None else None
+        in_place = (len(resident) == huge.factor and first is not None and first % huge.factor == 0
+                    and all(p.frame_number == first + i for i, p in enumerate(region_pages)))
+        if in_place:
+            base = first
+            huge.in_place_promotions += 1
+        else:
+            base = self.free_frames.allocate_contiguous(huge.factor, huge.factor)
+            if base is None:
+                huge.promotion_failures += 1
+                return False
+            for i, page_number in enumerate(pages):
+                self._migrate_page(pid, table.get(page_number), base + i)
+                
+        huge.mappings[(pid, region)] = base
+        for i, page_number in enumerate(pages):
+            huge.frame_region[base + i] = (pid, region)
+            if self.tlb is not None:
+                self.tlb.invalidate(pid, page_number)
+        if self.tlb is not None:
+            self.tlb.insert(pid, self._huge_tlb_key(region), base)
+        huge.promotions += 1
+        print(f"  Página grande: P{pid}, páginas {pages.start}-{pages.stop - 1} en frames "
+              f"{base}-{base + huge.factor - 1}")
+        return True
+        
+    def scan_huge_promotions(self, max_regions: int = 4) -> int:
+        """Reintenta en segundo plano promover regiones ya residentes (como khugepaged)"""
+        if self.huge is None:
+            return 0
+        promoted = attempts = 0
+        for pid, frames in list(self.resident_frames.items()):
+            regions = {self.frames[f].page_number // self.huge.factor for f in frames}
+            for region in sorted(regions):
+                if (pid, region) in self.huge.mappings:
+                    continue
+                if attempts >= max_regions:
+                    return promoted
+                attempts += 1
+                promoted += self._try_promote(pid, region)
+        return promoted
+        
+    def _migrate_page(self, pid: int, page: Page, new_frame: int):
+        # Mover la página a un frame ya reservado de la región contigua
+        frame = self.frames[new_frame]
+        frame.occupied = True
+        frame.process_id = pid
+        frame.page_number = page.page_number
+        if page.valid:
+            old_frame = page.frame_number
+            prefetched = page.prefetched
+            page.prefetched = False
+            self._release_frame(old_frame)
+            page.prefetched = prefetched
+            page.frame_number = new_frame
+            page.valid = True
+            self._track_load(new_frame)
+            if self.arena is not None:
+                # El frame viejo ya está libre pero su contenido sigue intacto
+                self.arena.frame(new_frame)[:] = self.arena.frame(old_frame)
+            self.huge.pages_migrated += 1
+        else:
+            page.frame_number = new_frame
+            page.valid = True
+            page.load_time = time.time()
+            self._track_load(new_frame)
+            self._fill_frame(new_frame)
+            
+    def _demote(self, pid: int, region: int):
+        # Dividir la página grande: las páginas base siguen residentes donde están
+        huge = self.huge
+        base = huge.mappings.pop((pid, region))
+        for frame_number in range(base, base + huge.factor):
+            huge.frame_region.pop(frame_number, None)
+        if self.tlb is not None:
+            self.tlb.invalidate(pid, self._huge_tlb_key(region))
+        huge.demotions += 1
+        
+    def get_huge_page_statistics(self) -> Optional[dict]:
+        huge = self.huge
+        if huge is None:
+            return None
+        processes: Dict[int, int] = {}
+        for pid, _ in huge.mappings:
+            processes[pid] = processes.get(pid, 0) + 1
+        stats = {
+            'factor': huge.factor,
+            'huge_page_size': huge.factor * self.page_size,
+            'huge_pages': len(huge.mappings),
+            'promotions': huge.promotions,
+            'in_place_promotions': huge.in_place_promotions,
+            'pages_migrated': huge.pages_migrated,
+            'promotion_failures': huge.promotion_failures,
+            'demotions': huge.demotions,
+            'processes': {
+                pid: {
+                    'huge_pages': count,
+                    # Entradas de TLB y bytes de tabla que harían falta con páginas base
+                    'tlb_entries_saved': count * (huge.factor - 1),
+                    'page_table_bytes_saved': count * (huge.factor - 1) * PTE_SIZE
+                }
+                for pid, count in processes.items()
+            },
+            'page_table_bytes_saved': len(huge.mappings) * (huge.factor - 1) * PTE_SIZE
+        }
+        if self.tlb is not None:
+            entries = [tag for entries in self.tlb.sets for tag in entries]
+            huge_entries = sum(1 for _, page_number in entries if page_number < 0)
+            stats['tlb_reach'] = (huge_entries * huge.factor + len(entries) - huge_entries) * self.page_size
+            stats['tlb_reach_base_pages'] = len(entries) * self.page_size
+            stats['tlb_huge_entries'] = huge_entries
+        return stats
+        
+    def get_fork_statistics(self) -> dict:
+        return {
+            'forks': self.forks,
+            'cow_forks': self.cow_forks,
+            'avg_fork_time': self.fork_seconds / self.forks if self.forks > 0 else 0,
+            'pages_shared_at_fork': self.fork_pages_shared,
+            'pages_copied_at_fork': self.fork_pages_copied,
+            'cow_faults': self.cow_faults,
+            'cow_pages_copied': self.cow_pages_copied,
+            'shared_frames': len(self.frame_sharers),
+            # Frames que harían falta de más con copia completa
+            'frames_saved': sum(len(s) - 1 for s in self.frame_sharers.values())
+        }
+        
+    def process_footprint(self, pid: int) -> int:
+        # Frames que el proceso necesita: su conjunto de trabajo o sus páginas tocadas
+        if self.working_set is not None:
+            return max(self.working_set.working_set_size(pid), 1)
+        table = self.page_tables.get(pid)
+        return table.touched_pages() if table is not None else 0
+        
+    def release_process(self, pid: int) -> int:
+        """Libera los frames del proceso en O(residentes) y borra su tabla de páginas"""
+        for _, _, name in list(self.shm_attachments.get(pid, ())):
+            self.detach_shared(pid, name)
+        frames = self.resident_frames.pop(pid, set())
+        for frame_number in list(frames):
+            if frame_number in self.frame_sharers and self._unshare(frame_number, pid):
+                # Otros procesos siguen usando el frame
+                frames.discard(frame_number)
+                continue
+            self._release_frame(frame_number)
+        self.frames_reclaimed += len(frames)
+        table = self.page_tables.pop(pid, None)
+        if table is not None and self.swap_area is not None:
+            for page in table.pages():
+                if page.swap_slot is not None:
+                    self.swap_area.free(page.swap_slot)
+                    page.swap_slot = None
+        self.swapped_out.pop(pid, None)
+        if self.arena is not None:
+            self.arena.unmap_file(pid)
+        if self.readahead is not None:
+            self.readahead.forget(pid)
+        if self.working_set is not None:
+            self.working_set.forget(pid)
+        if frames:
+            print(f"  Liberados {len(frames)} frames de P{pid}")
+        return len(frames)
+        
+    def _track_load(self, frame_number: int):
+        # Registrar la carga en las estructuras de LRU y FIFO
+        self.lru_order[frame_number] = None
+        self.lru_order.move_to_end(frame_number)
+        self.load_counter += 1
+        self.frames[frame_number].load_seq = self.load_counter
+        self.fifo_queue.append((frame_number, self.load_counter))
+        frame = self.frames[frame_number]
+        self.resident_frames.setdefault(frame.process_id, set()).add(frame_number)
+        self.dirty_frames.discard(frame_number)
+        table = self.page_tables.get(frame.process_id)
+        if table is not None:
+            table.on_map(frame.page_number, frame_number)
+        page = self._resident_page(frame)
+        if page is not None:
+            self._push_opt(frame_number, page)
+            if page.modified:
+                self.dirty_frames.add(frame_number)
+        if self.tlb is not None:
+            self.tlb.insert(frame.process_id, frame.page_number, frame_number)
+            
+    def _fill_frame(self, frame_number: int):
+        # Contenido de la página recién cargada
+        frame = self.frames[frame_number]
+        page = self._resident_page(frame)
+        if page is None:
+            return
+        if page.swap_slot is not None and self.swap_area is not None:
+            # Fallo sobre una página que está en swap: leerla del archivo
+            self.swap_area.read(page.swap_slot,
+                                self.arena.frame(frame_number) if self.arena is not None else None)
+        elif self.arena is not None:
+            self.arena.fill(frame_number, frame.process_id, frame.page_number)
+        
+    def _check_wasted_prefetch(self, pid: int, page: Optional[Page]):
+        # Una página precargada que sale de memoria sin usarse es precarga desperdiciada
+        if page is not None and page.prefetched:
+            page.prefetched = False
+            if self.readahead is not None:
+                self.readahead.on_prefetch_wasted(pid)
+                
+    def _resident_page(self, frame: Frame) -> Optional[Page]:
+        table = self.page_tables.get(frame.process_id)
+        if table is None:
+            return None
+        return table.peek(frame.page_number)
+        
+    def get_page_table_statistics(self) -> dict:
+        if self.inverted_table is not None:
+            overhead = self.inverted_table.memory_overhead()
+        else:
+            overhead = sum(table.memory_overhead() for table in self.page_tables.values())
+        return {
+            'type': self.page_table_type,
+            'tables': len(self.page_tables),
+            'memory_overhead_bytes': overhead,
+            'lookups': self.page_table_lookups,
+            'avg_lookup_cost': (self.page_table_walk_steps / self.page_table_lookups
+                                if self.page_table_lookups > 0 else 0)
+        }
+        
+    def frame_range(self, start: int = 0, end: Optional[int] = None, pid: Optional[int] = None,
+                    occupied_only: bool = False, limit: Optional[int] = None) -> Tuple[List[Frame], Optional[int]]:
+        # Frames de [start, end) que cumplen el filtro, hasta limit; devuelve también
+        # el frame donde continuar la siguiente página (None si no quedan)
+        end = len(self.frames) if end is None else min(end, len(self.frames))
+        if pid is not None:
+            # Con filtro de pid basta recorrer sus frames residentes, no toda la memoria
+            numbers = sorted(n for n in self.resident_frames.get(pid, ()) if start <= n < end)
+            candidates = (self.frames[n] for n in numbers)
+        else:
+            candidates = islice(self.frames, start, end)
+        selected = []
+        for frame in candidates:
+            if pid is not None and frame.process_id != pid:
+                continue
+            if occupied_only and not frame.occupied:
+                continue
+            if limit is not None and len(selected) == limit:
+                return selected, frame.frame_number
+            selected.append(frame)
+        return selected, None
+        
+    def ownership_map(self, start: int = 0, end: Optional[int] = None,
+                      max_runs: Optional[int] = None) -> Tuple[List[Tuple[Optional[int], int, int]], Optional[int]]:
+        # Mapa de propietarios comprimido por tramos: (pid o None si libre, primer frame, longitud),
+        # hasta max_runs tramos; devuelve también el frame donde continuar (None si no quedan)
+        end = len(self.frames) if end is None else min(end, len(self.frames))
+        runs = []
+        first = start
+        owners = (f.process_id if f.occupied else None for f in islice(self.frames, start, end))
+        for owner, group in groupby(owners):
+            if max_runs is not None and len(runs) == max_runs:
+                return runs, first
+            length = sum(1 for _ in group)
+            runs.append((owner, first, length))
+            first += length
+        return runs, None
+        
+    def get_utilization(self) -> dict:
+        total = self.free_frames.total_frames
+        used = self.free_frames.used_count
+        return {
+            'total_frames': total,
+            'used_frames': used,
+            'free_frames': self.free_frames.free_count,
+            'utilization': (used / total * 100) if total > 0 else 0,
+            'frames_reclaimed': self.frames_reclaimed
+        }
+        
     def _select_victim(self, algorithm: str) -> Optional[int]:
         if algorithm == 'FIFO':
             return self._fifo_victim()
@@ -189,67 +2004,527 @@ class PagingManager:
             return self._lru_victim()
         elif algorithm == 'CLOCK':
             return self._clock_victim()
+        elif algorithm == 'OPT':
+            return self._opt_victim()
+        elif algorithm == 'WSCLOCK':
+            return self._wsclock_victim()
         return None
         
     def _fifo_victim(self) -> Optional[int]:
-        oldest_time = float('inf')
-        victim = None
-        
-        for frame in self.frames:
-            if frame.occupied and frame.process_id in self.page_tables:
-                page = self.page_tables[frame.process_id][frame.page_number]
-                if page.load_time < oldest_time:
-                    oldest_time = page.load_time
-                    victim = frame.frame_number
-                    
-        return victim
+        # Descartar entradas obsoletas (frame recargado o liberado) en O(1) amortizado
+        while self.fifo_queue:
+            frame_number, load_seq = self.fifo_queue[0]
+            frame = self.frames[frame_number]
+            if frame.occupied and frame.load_seq == load_seq:
+                break
+            self.fifo_queue.popleft()
+        if not self.fifo_queue:
+            return None
+            
+        # Preferir una página limpia entre las más antiguas
+        for index in range(min(self.CLEAN_SCAN_LIMIT, len(self.fifo_queue))):
+            frame_number, load_seq = self.fifo_queue[index]
+            frame = self.frames[frame_number]
+            if frame.occupied and frame.load_seq == load_seq and not self._is_dirty(frame_number):
+                del self.fifo_queue[index]
+                return frame_number
+        return self.fifo_queue.popleft()[0]
         
     def _lru_victim(self) -> Optional[int]:
-        oldest_access = float('inf')
-        victim = None
+        # El extremo LRU es el primer frame del OrderedDict; se prefiere uno limpio
+        if not self.lru_order:
+            return None
+        for frame_number in islice(self.lru_order, self.CLEAN_SCAN_LIMIT):
+            if not self._is_dirty(frame_number):
+                return frame_number
+        return next(iter(self.lru_order))
         
-        for frame in self.frames:
-            if frame.occupied and frame.process_id in self.page_tables:
-                page = self.page_tables[frame.process_id][frame.page_number]
-                if page.last_access_time < oldest_access:
-                    oldest_access = page.last_access_time
-                    victim = frame.frame_number
-                    
+    def _clock_victim(self) -> Optional[int]:
+        # Algoritmo del reloj (segunda oportunidad) con manecilla persistente
+        total = len(self.frames)
+        # Peor caso: una vuelta limpia bits de referencia, otra programa las escrituras
+        # de las sucias y la tercera encuentra ya un frame limpio
+        for _ in range(3 * total):
+            frame = self.frames[self.clock_hand]
+            self.clock_hand = (self.clock_hand + 1) % total
+            if not frame.occupied:
+                continue
+                
+            page = self._resident_page(frame)
+            if page is None:
+                return frame.frame_number
+            if page.referenced:
+                page.referenced = False  # Segunda oportunidad
+                continue
+            if page.modified and self.io_manager is not None:
+                # Sucia: programar su escritura y darle otra vuelta
+                self._write_back(frame.process_id, page, 'cleaner')
+                continue
+            return frame.frame_number
+            
+        return None
+        
+    def _page_age(self, pid: int, page: Page) -> int:
+        # Edad en tiempo virtual del dueño (tiempo global si no hay control de WS)
+        if self.working_set is None:
+            return self.access_counter - page.last_access_time
+        return self.working_set.virtual_time.get(pid, 0) - page.last_use_vtime
+        
+    def _wsclock_victim(self) -> Optional[int]:
+        # WSClock: como CLOCK, pero solo desaloja páginas fuera del conjunto de trabajo
+        tau = self.working_set.tau if self.working_set is not None else len(self.frames)
+        total = len(self.frames)
+        oldest_frame = None
+        oldest_age = -1
+        for _ in range(total):
+            frame = self.frames[self.wsclock_hand]
+            self.wsclock_hand = (self.wsclock_hand + 1) % total
+            if not frame.occupied:
+                continue
+            page = self._resident_page(frame)
+            if page is None:
+                return frame.frame_number
+            if page.referenced:
+                page.referenced = False
+                if self.working_set is not None:
+                    page.last_use_vtime = self.working_set.virtual_time.get(frame.process_id, 0)
+                continue
+            age = self._page_age(frame.process_id, page)
+            if age > tau and page.modified and self.io_manager is not None:
+                self._write_back(frame.process_id, page, 'cleaner')
+                continue
+            if age > tau:
+                return frame.frame_number
+            if age > oldest_age:
+                oldest_frame, oldest_age = frame.frame_number, age
+                
+        # Vuelta completa sin candidatas fuera de la ventana: la más antigua
+        return oldest_frame if oldest_frame is not None else self._lru_victim()
+        
+    def _local_victim(self, pid: int) -> Optional[int]:
+        # Reemplazo local: la página propia no referenciada más antigua, O(residentes)
+        victim = None
+        victim_key = None
+        for frame_number in self.resident_frames.get(pid, ()):
+            if frame_number in self.frame_sharers:
+                continue
+            page = self._resident_page(self.frames[frame_number])
+            if page is None:
+                return frame_number
+            key = (page.referenced, page.last_access_time)
+            if victim_key is None or key < victim_key:
+                victim, victim_key = frame_number, key
         return victim
         
-    def _clock_victim(self) -> Optional[int]:
-        # Implementación simplificada del algoritmo del reloj
-        for frame in self.frames:
-            if frame.occupied and frame.process_id in self.page_tables:
-                page = self.page_tables[frame.process_id][frame.page_number]
+    def working_set_size(self, pid: int) -> int:
+        if self.working_set is None:
+            return len(self.resident_frames.get(pid, ()))
+        return self.working_set.working_set_size(pid)
+        
+    def _adjust_allocation(self, pid: int, rate: float):
+        ws = self.working_set
+        quota = ws.adjust(pid, rate, len(self.frames))
+        
+        # Recortar los frames que exceden la nueva cuota
+        while len(self.resident_frames.get(pid, ())) > quota:
+            victim = self._local_victim(pid)
+            if victim is None:
+                break
+            self._evict_frame(victim)
+            
+        self._balance_load()
+        
+    def _balance_load(self):
+        # Si la suma de conjuntos de trabajo excede la memoria, suspender procesos
+        ws = self.working_set
+        # Los segmentos compartidos (pseudo-pids negativos) no son procesos suspendibles,
+        # y los que el planificador a mediano plazo llevó a swap son suyos
+        active = [p for p in self.page_tables
+                  if p >= 0 and p not in ws.suspended and p not in self.swapped_out]
+        demand = {p: max(self.working_set_size(p), 1) for p in active}
+        total = len(self.frames)
+        
+        if sum(demand.values()) > total and len(active) > 1:
+            victim_pid = max(active, key=lambda p: demand[p])
+            self._suspend(victim_pid)
+        elif ws.suspended:
+            candidate = ws.suspended[0]
+            if sum(demand.values()) + ws.quota(candidate) <= total:
+                self._resume(candidate)
                 
-                if not page.referenced:
-                    return frame.frame_number
-                else:
-                    page.referenced = False  # Segunda oportunidad
-                    
-        # Si todos tienen bit de referencia, tomar el primero
-        return 0 if self.frames[0].occupied else None
+    def _suspend(self, pid: int):
+        ws = self.working_set
+        ws.suspended.append(pid)
+        ws.suspensions += 1
+        for frame_number in list(self.resident_frames.get(pid, ())):
+            if frame_number in self.frame_sharers:
+                self._unshare(frame_number, pid, keep_copy=True)
+            else:
+                self._evict_frame(frame_number)
+        print(f"  Sobrecarga de memoria: P{pid} suspendido")
+        for listener in self.suspend_listeners:
+            listener(pid)
+            
+    def _resume(self, pid: int):
+        ws = self.working_set
+        ws.suspended.remove(pid)
+        ws.resumptions += 1
+        print(f"  Memoria disponible: P{pid} reanudado")
+        for listener in self.resume_listeners:
+            listener(pid)
+            
+    def get_working_set_statistics(self) -> Optional[dict]:
+        ws = self.working_set
+        if ws is None:
+            return None
+        return {
+            'tau': ws.tau,
+            'processes': {
+                pid: {
+                    'working_set_size': self.working_set_size(pid),
+                    'resident_frames': len(self.resident_frames.get(pid, ())),
+                    'quota': ws.quota(pid),
+                    'fault_rate': ws.fault_rates.get(pid, 0)
+                }
+                for pid in self.page_tables
+            },
+            'suspended': list(ws.suspended),
+            'grows': ws.grows,
+            'shrinks': ws.shrinks,
+            'suspensions': ws.suspensions,
+            'resumptions': ws.resumptions
+        }
+        
+    def set_reference_string(self, references: List[Tuple[int, int]]):
+        """Registra la cadena de referencias futura (pid, página) para OPT"""
+        self.future_references = [tuple(ref) for ref in references]
+        if self.future_references:
+            ids, _ = self._compact_references(np.array(self.future_references))
+            self.future_next_use = self._next_use_positions(ids).tolist()
+        else:
+            self.future_next_use = []
+        self.reference_position = 0
+        
+    def _advance_reference_string(self, pid: int, page_number: int) -> float:
+        # Devuelve el próximo uso de la referencia actual si coincide con la cadena
+        position = self.reference_position
+        if position >= len(self.future_references):
+            return float('inf')
+        if self.future_references[position] != (pid, page_number):
+            return float('inf')
+        self.reference_position += 1
+        next_use = self.future_next_use[position]
+        return float('inf') if next_use >= len(self.future_references) else next_use
+        
+    def _push_opt(self, frame_number: int, page: Page):
+        heapq.heappush(self.opt_heap, (-page.next_use, frame_number))
+        # Reconstruir si las entradas obsoletas dominan el montículo
+        if len(self.opt_heap) > 2 * len(self.frames) + 64:
+            self.opt_heap = []
+            for frame_num in self.lru_order:
+                resident = self._resident_page(self.frames[frame_num])
+                if resident is not None:
+                    self.opt_heap.append((-resident.next_use, frame_num))
+            heapq.heapify(self.opt_heap)
+            
+    def _opt_victim(self) -> Optional[int]:
+        # Belady: frame cuyo próximo uso es el más lejano, O(log frames) amortizado
+        while self.opt_heap:
+            neg_next_use, frame_number = heapq.heappop(self.opt_heap)
+            frame = self.frames[frame_number]
+            if not frame.occupied:
+                continue
+            page = self._resident_page(frame)
+            if page is None or page.next_use == -neg_next_use:
+                return frame_number
+        return self._lru_victim()
+        
+    def _trace_references(self) -> np.ndarray:
+        # Matriz (pid, página) con las últimas trace_limit referencias registradas
+        return np.stack([
+            np.frombuffer(self.trace_pids, dtype=np.int64)[-self.trace_limit:],
+            np.frombuffer(self.trace_pages, dtype=np.int64)[-self.trace_limit:]
+        ], axis=1)
+        
+    def compare_algorithms(self, num_frames: Optional[int] = None) -> Dict[str, dict]:
+        """Compara FIFO, LRU, CLOCK y OPT sobre las referencias registradas"""
+        if not self.trace_pids:
+            return {}
+        references = self._trace_references()
+        frames = num_frames if num_frames is not None else len(self.frames)
+        results = self.simulate_references(references, frames)
+        return {
+            algo: {'page_faults': r['page_faults'], 'hit_rate': r['hit_rate']}
+            for algo, r in results.items()
+        }
+        
+    @staticmethod
+    def _count_earlier_smaller(values: np.ndarray, thresholds: np.ndarray, leaf: int = 64) -> np.ndarray:
+        # counts[i] = #{j < i : values[j] < thresholds[i]} con mezcla por mitades (CDQ)
+        # vectorizada: cada par (j, i) se cuenta en el único nivel que los separa
+        n = len(values)
+        pad = (-n) % leaf
+        v = np.concatenate([values, np.full(pad, n, dtype=np.int64)]).reshape(-1, leaf)
+        q = np.concatenate([thresholds, np.full(pad, -1, dtype=np.int64)]).reshape(-1, leaf)
+        # Nivel base: comparación directa dentro de bloques de 'leaf' referencias
+        earlier = np.tri(leaf, leaf, -1, dtype=bool)
+        counts = ((v[:, None, :] < q[:, :, None]) & earlier).sum(axis=2).ravel()
+        m = len(counts)
+        span = m + 2
+        pos = np.arange(m, dtype=np.int64)
+        thr = q.ravel() + 1
+        # Valores y consultas ordenados dentro de cada bloque: las búsquedas salen en orden
+        vals = np.sort(v, axis=1).ravel() + 1
+        qidx = (np.argsort(q, axis=1, kind='stable') + pos[::leaf][:, None]).ravel()
+        width = leaf
+        while width < m:
+            block = pos // width
+            right = (block & 1) == 1
+            qi = qidx[right]
+            left_block = block[right] - 1
+            found = np.searchsorted(block * span + vals, left_block * span + thr[qi], 'left')
+            counts[qi] += found - left_block * width
+            # Fusionar cada par de bloques (el orden estable solo mezcla dos tramos ordenados)
+            pair_base = pos // (2 * width) * span
+            vals = np.sort(pair_base + vals, kind='stable') - pair_base
+            qidx = qidx[np.argsort(pair_base + thr[qidx], kind='stable')]
+            width *= 2
+        return counts[:n]
+        
+    @staticmethod
+    def lru_stack_distances(references: np.ndarray) -> np.ndarray:
+        """Distancia de pila LRU de cada referencia (0 = fallo frío) en O(n log n), vectorizada"""
+        ids, _ = PagingManager._compact_references(references)
+        n = len(ids)
+        distances = np.zeros(n, dtype=np.int64)
+        if n == 0:
+            return distances
+            
+        # Posición del uso anterior de cada referencia (-1 si es la primera)
+        next_use = PagingManager._next_use_positions(ids)
+        previous = np.full(n, -1, dtype=np.int64)
+        has_next = next_use < n
+        previous[next_use[has_next]] = np.nonzero(has_next)[0]
+        
+        # Páginas distintas en (prev, i): las j de la ventana cuyo uso anterior es < prev.
+        # Todas las j <= prev cumplen previous[j] < prev, así que basta restar prev + 1
+        earlier = PagingManager._count_earlier_smaller(previous, previous)
+        reused = previous >= 0
+        distances[reused] = earlier[reused] - previous[reused]
+        return distances
+        
+    def miss_ratio_curve(self, references: Optional[np.ndarray] = None,
+                         max_frames: Optional[int] = None) -> dict:
+        """Curva de page faults vs número de frames (LRU) en una sola pasada"""
+        if references is None:
+            references = self._trace_references()
+        distances = self.lru_stack_distances(references)
+        n = len(distances)
+        cold_misses = int(np.count_nonzero(distances == 0))
+        limit = max_frames if max_frames is not None else int(distances.max(initial=0))
+        limit = max(limit, 1)
+        
+        # faults(k) = fallos fríos + referencias con distancia > k
+        histogram = np.bincount(distances[distances > 0], minlength=limit + 1)[:limit + 1]
+        reused = n - cold_misses
+        faults = cold_misses + reused - np.cumsum(histogram)[1:]
+        return {
+            'references': n,
+            'cold_misses': cold_misses,
+            'frames': list(range(1, limit + 1)),
+            'page_faults': faults.tolist(),
+            'miss_ratio': ((faults / n) if n > 0 else np.zeros(limit)).tolist()
+        }
         
     def _replace_page(self, victim_frame: int, new_pid: int, new_page: int):
+        if self.huge is not None and victim_frame in self.huge.frame_region:
+            # Bajo presión, la página grande se divide en páginas base antes de desalojar
+            self._demote(*self.huge.frame_region[victim_frame])
+        if victim_frame in self.frame_sharers:
+            self._break_sharing(victim_frame)
         frame = self.frames[victim_frame]
         
         # Invalidar página víctima
-        if frame.process_id in self.page_tables and frame.page_number in self.page_tables[frame.process_id]:
-            old_page = self.page_tables[frame.process_id][frame.page_number]
+        old_table = self.page_tables.get(frame.process_id)
+        old_page = old_table.peek(frame.page_number) if old_table is not None else None
+        if old_page is not None:
+            self._check_wasted_prefetch(frame.process_id, old_page)
+            if old_page.modified:
+                self._write_back(frame.process_id, old_page, 'eviction')
             old_page.valid = False
             old_page.frame_number = None
+            old_table.on_unmap(frame.page_number, victim_frame)
+            if self.tlb is not None:
+                self.tlb.invalidate(frame.process_id, frame.page_number)
             print(f"  Reemplazando: P{frame.process_id}-Pg{frame.page_number} "
                   f"por P{new_pid}-Pg{new_page}")
+        self.resident_frames.get(frame.process_id, set()).discard(victim_frame)
         
         # Cargar nueva página
         frame.process_id = new_pid
         frame.page_number = new_page
         
-        new_page_obj = self.page_tables[new_pid][new_page]
+        new_page_obj = self.page_tables[new_pid].get(new_page)
         new_page_obj.frame_number = victim_frame
         new_page_obj.valid = True
         new_page_obj.load_time = time.time()
+        self._track_load(victim_frame)
+        self._fill_frame(victim_frame)
+        
+    # ---------- Simulación por lotes de cadenas de referencia ----------
+    
+    @staticmethod
+    def _compact_references(references: np.ndarray) -> Tuple[np.ndarray, int]:
+        # Convierte pares (pid, página) en ids densos 0..k-1
+        refs = np.asarray(references, dtype=np.int64)
+        if refs.ndim == 1:
+            refs = np.stack([np.zeros_like(refs), refs], axis=1)
+        keys = (refs[:, 0] << 32) | (refs[:, 1] & 0xFFFFFFFF)
+        unique_keys, ids = np.unique(keys, return_inverse=True)
+        return ids.astype(np.int64), len(unique_keys)
+        
+    @staticmethod
+    def _next_use_positions(ids: np.ndarray) -> np.ndarray:
+        # Para cada referencia i, posición de la siguiente referencia a la misma
+        # página (n si no vuelve a usarse). Ordenar por (id, posición) deja cada
+        # referencia junto a su siguiente uso.
+        n = len(ids)
+        next_use = np.full(n, n, dtype=np.int64)
+        if n == 0:
+            return next_use
+        order = np.argsort(ids, kind='stable')
+        same_page = ids[order[:-1]] == ids[order[1:]]
+        next_use[order[:-1][same_page]] = order[1:][same_page]
+        return next_use
+        
+    @staticmethod
+    def _simulate_fifo(ids: list, num_pages: int, num_frames: int, faults: bytearray) -> int:
+        # Con frames fijos, FIFO equivale a un buffer circular
+        slot_page = [-1] * num_frames
+        resident = bytearray(num_pages)
+        pointer = 0
+        count = 0
+        for i, page in enumerate(ids):
+            if resident[page]:
+                continue
+            faults[i] = 1
+            count += 1
+            old = slot_page[pointer]
+            if old >= 0:
+                resident[old] = 0
+            slot_page[pointer] = page
+            resident[page] = 1
+            pointer = (pointer + 1) % num_frames
+        return count
+        
+    @staticmethod
+    def _simulate_lru(ids: list, num_pages: int, num_frames: int, faults: bytearray) -> int:
+        order: 'OrderedDict[int, None]' = OrderedDict()
+        count = 0
+        for i, page in enumerate(ids):
+            if page in order:
+                order.move_to_end(page)
+                continue
+            faults[i] = 1
+            count += 1
+            if len(order) >= num_frames:
+                order.popitem(last=False)
+            order[page] = None
+        return count
+        
+    @staticmethod
+    def _simulate_clock(ids: list, num_pages: int, num_frames: int, faults: bytearray) -> int:
+        slot_page = [-1] * num_frames
+        slot_of = [-1] * num_pages
+        referenced = bytearray(num_frames)
+        hand = 0
+        used = 0
+        count = 0
+        for i, page in enumerate(ids):
+            slot = slot_of[page]
+            if slot >= 0:
+                referenced[slot] = 1
+                continue
+            faults[i] = 1
+            count += 1
+            if used < num_frames:
+                slot = used
+                used += 1
+            else:
+                while referenced[hand]:
+                    referenced[hand] = 0
+                    hand = (hand + 1) % num_frames
+                slot = hand
+                slot_of[slot_page[slot]] = -1
+                hand = (hand + 1) % num_frames
+            slot_page[slot] = page
+            slot_of[page] = slot
+            referenced[slot] = 1
+        return count
+        
+    @staticmethod
+    def _simulate_opt(ids: list, next_use: list, num_pages: int, num_frames: int,
+                      faults: bytearray) -> int:
+        # Belady: desalojar la página residente cuyo próximo uso es más lejano.
+        # Montículo máximo (claves negadas) con borrado perezoso.
+        current_next = [-1] * num_pages  # -1 = no residente
+        heap: List[Tuple[int, int]] = []
+        resident = 0
+        count = 0
+        for i, page in enumerate(ids):
+            nxt = next_use[i]
+            if current_next[page] < 0:
+                faults[i] = 1
+                count += 1
+                if resident >= num_frames:
+                    while True:
+                        neg_next, victim = heapq.heappop(heap)
+                        if current_next[victim] == -neg_next:
+                            break
+                    current_next[victim] = -1
+                else:
+                    resident += 1
+            current_next[page] = nxt
+            heapq.heappush(heap, (-nxt, page))
+        return count
+        
+    @staticmethod
+    def simulate_references(references: np.ndarray, num_frames: int,
+                            algorithms: Tuple[str, ...] = ('FIFO', 'LRU', 'CLOCK', 'OPT')) -> Dict[str, dict]:
+        """Simula una cadena de referencias (pid, página) sin tocar el estado del gestor"""
+        # Cada política depende de sus fallos anteriores y se simula con un bucle sobre
+        # listas planas (~1-7M refs/s); solo las distancias de pila LRU, que dan la curva
+        # para todos los tamaños a la vez, están vectorizadas (lru_stack_distances)
+        ids, num_pages = PagingManager._compact_references(references)
+        n = len(ids)
+        id_list = ids.tolist()
+        next_use = None
+        results = {}
+        
+        for algorithm in algorithms:
+            faults = bytearray(n)
+            if num_frames <= 0:
+                faults = bytearray(b'\x01' * n)
+                count = n
+            elif algorithm == 'FIFO':
+                count = PagingManager._simulate_fifo(id_list, num_pages, num_frames, faults)
+            elif algorithm == 'LRU':
+                count = PagingManager._simulate_lru(id_list, num_pages, num_frames, faults)
+            elif algorithm == 'CLOCK':
+                count = PagingManager._simulate_clock(id_list, num_pages, num_frames, faults)
+            elif algorithm == 'OPT':
+                if next_use is None:
+                    next_use = PagingManager._next_use_positions(ids).tolist()
+                count = PagingManager._simulate_opt(id_list, next_use, num_pages, num_frames, faults)
+            else:
+                continue
+                
+            results[algorithm] = {
+                'page_faults': count,
+                'fault_bitmap': np.frombuffer(bytes(faults), dtype=np.bool_),
+                'hit_rate': ((n - count) / n * 100) if n > 0 else 0
+            }
+        return results
 
 # Definimos la segmentacion
 
@@ -259,65 +2534,539 @@ class Segment:
     base: int
     limit: int
     name: str = ""
+    shared: bool = False
+#Índice de bloques libres: por dirección (coalescencia) y por tamaño (ajuste)
+class FreeBlockIndex:
+    def __init__(self, base: int, size: int):
+        self._bases: List[int] = []                 # direcciones ordenadas
+        self._size_at: Dict[int, int] = {}          # base -> tamaño
+        self._by_size: List[Tuple[int, int]] = []   # (tamaño, base) ordenados
+        # Árbol de segmentos disperso sobre las direcciones: nodo -> mayor bloque libre
+        # que empieza en su rango (hojas en _leaves + base; solo se guardan nodos no vacíos)
+        self._leaves = 1
+        while self._leaves < base + size:
+            self._leaves <<= 1
+        self._max_at: Dict[int, int] = {}
+        if size > 0:
+            self._insert(base, size)
+            
+    def _set_leaf(self, base: int, size: int):
+        node = self._leaves + base
+        while node:
+            if size:
+                self._max_at[node] = size
+            else:
+                self._max_at.pop(node, None)
+            node >>= 1
+            size = max(self._max_at.get(2 * node, 0), self._max_at.get(2 * node + 1, 0))
+            
+    def _insert(self, base: int, size: int):
+        bisect.insort(self._bases, base)
+        self._size_at[base] = size
+        bisect.insort(self._by_size, (size, base))
+        self._set_leaf(base, size)
+        
+    def _remove(self, base: int) -> int:
+        size = self._size_at.pop(base)
+        del self._bases[bisect.bisect_left(self._bases, base)]
+        del self._by_size[bisect.bisect_left(self._by_size, (size, base))]
+        self._set_leaf(base, 0)
+        return size
+        
+    def find(self, size: int, algorithm: str = 'first_fit') -> Optional[int]:
+        if algorithm == 'best_fit':
+            # El bloque más pequeño que alcanza (a igualdad, el de menor dirección)
+            i = bisect.bisect_left(self._by_size, (size, -1))
+            return self._by_size[i][1] if i < len(self._by_size) else None
+        if algorithm == 'worst_fit':
+            if not self._by_size or self._by_size[-1][0] < size:
+                return None
+            # El mayor bloque (a igualdad, el de menor dirección)
+            i = bisect.bisect_left(self._by_size, (self._by_size[-1][0], -1))
+            return self._by_size[i][1]
+        # first_fit: se baja por el árbol hacia la izquierda mientras el subárbol alcance,
+        # O(log M) con M el tamaño del espacio de direcciones
+        if self._max_at.get(1, 0) < size:
+            return None
+        node = 1
+        while node < self._leaves:
+            node *= 2
+            if self._max_at.get(node, 0) < size:
+                node += 1
+        return node - self._leaves
+        
+    def take(self, base: int, size: int):
+        block_size = self._remove(base)
+        if block_size > size:
+            self._insert(base + size, block_size - size)
+            
+    def free(self, base: int, size: int):
+        # Combinar solo con los vecinos inmediatos
+        i = bisect.bisect_left(self._bases, base)
+        if i > 0:
+            prev = self._bases[i - 1]
+            if prev + self._size_at[prev] == base:
+                base, size = prev, self._remove(prev) + size
+                i -= 1
+        if i < len(self._bases) and base + size == self._bases[i]:
+            size += self._remove(self._bases[i])
+        self._insert(base, size)
+        
+    def blocks(self) -> List[Tuple[int, int]]:
+        return [(base, self._size_at[base]) for base in self._bases]
+        
+    def largest(self) -> int:
+        return self._by_size[-1][0] if self._by_size else 0
+        
+    def total(self) -> int:
+        return sum(self._size_at.values())
+        
+    def __len__(self) -> int:
+        return len(self._bases)
+
 #Manejador de segmentaciones    
 class SegmentationManager:
     
     def __init__(self, total_memory: int):
         self.total_memory = total_memory
         self.segment_tables: Dict[int, List[Segment]] = {}
-        self.free_blocks: List[Tuple[int, int]] = [(0, total_memory)]  # (base, size)
-        
-    def create_segment(self, pid: int, segment_num: int, size: int, name: str = "") -> bool:
-        # Buscar bloque libre
-        for i, (base, block_size) in enumerate(self.free_blocks):
-            if block_size >= size:
-                # Asignar segmento
-                segment = Segment(segment_num, base, size, name)
-                
-                if pid not in self.segment_tables:
-                    self.segment_tables[pid] = []
-                self.segment_tables[pid].append(segment)
-                
-                # Actualizar bloques libres
-                if block_size == size:
-                    self.free_blocks.pop(i)
-                else:
-                    self.free_blocks[i] = (base + size, block_size - size)
-                    
-                print(f"  Segmento '{name}' ({size} bytes) creado en base {base}")
-                return True
-                
-        print(f"  No hay espacio para segmento de {size} bytes")
-        return False
+        self.free_index = FreeBlockIndex(0, total_memory)
+        # Segmentos compartidos con nombre: una sola base para todos los procesos
+        self.shared_segments: Dict[str, dict] = {}  # nombre -> {'base', 'limit', 'attached'}
+        
+    @property
+    def free_blocks(self) -> List[Tuple[int, int]]:
+        # (base, size) ordenados por dirección
+        return self.free_index.blocks()
+        
+    def _allocate_block(self, size: int, algorithm: str = 'first_fit') -> Optional[int]:
+        # Buscar bloque libre en O(log n) con el índice por tamaño
+        base = self.free_index.find(size, algorithm)
+        if base is not None:
+            self.free_index.take(base, size)
+        return base
+        
+    def _free_block(self, base: int, size: int):
+        self.free_index.free(base, size)
+        
+    def create_segment(self, pid: int, segment_num: int, size: int, name: str = "",
+                       algorithm: str = 'first_fit') -> bool:
+        base = self._allocate_block(size, algorithm)
+        if base is None:
+            print(f"  No hay espacio para segmento de {size} bytes")
+            return False
+            
+        # Asignar segmento
+        segment = Segment(segment_num, base, size, name)
+        
+        if pid not in self.segment_tables:
+            self.segment_tables[pid] = []
+        self.segment_tables[pid].append(segment)
+        
+        print(f"  Segmento '{name}' ({size} bytes) creado en base {base}")
+        return True
+        
+    def create_shared_segment(self, name: str, size: int) -> bool:
+        if name in self.shared_segments:
+            return False
+        base = self._allocate_block(size)
+        if base is None:
+            print(f"  No hay espacio para segmento compartido de {size} bytes")
+            return False
+        self.shared_segments[name] = {'base': base, 'limit': size, 'attached': set()}
+        print(f"  Segmento compartido '{name}' ({size} bytes) creado en base {base}")
+        return True
+        
+    def attach_shared(self, pid: int, name: str) -> Optional[int]:
+        """Añade el segmento compartido a la tabla del proceso; devuelve su número de segmento"""
+        shared = self.shared_segments.get(name)
+        if shared is None or pid in shared['attached']:
+            return None
+        table = self.segment_tables.setdefault(pid, [])
+        segment_num = max((s.segment_number for s in table), default=-1) + 1
+        table.append(Segment(segment_num, shared['base'], shared['limit'], name, shared=True))
+        shared['attached'].add(pid)
+        return segment_num
+        
+    def detach_shared(self, pid: int, name: str):
+        shared = self.shared_segments.get(name)
+        if shared is None or pid not in shared['attached']:
+            return
+        shared['attached'].discard(pid)
+        table = self.segment_tables.get(pid, [])
+        self.segment_tables[pid] = [s for s in table if not (s.shared and s.name == name)]
+        if not shared['attached']:
+            # Última desconexión: el bloque vuelve a la lista libre
+            del self.shared_segments[name]
+            self._free_block(shared['base'], shared['limit'])
+            print(f"  Segmento compartido '{name}' liberado")
         
     def deallocate_segments(self, pid: int):
         if pid not in self.segment_tables:
             return
             
-        for segment in self.segment_tables[pid]:
-            self.free_blocks.append((segment.base, segment.limit))
-            
-        # Combinar bloques contiguos
-        self.free_blocks.sort()
-        merged = []
-        for base, size in self.free_blocks:
-            if merged and merged[-1][0] + merged[-1][1] == base:
-                merged[-1] = (merged[-1][0], merged[-1][1] + size)
+        for segment in list(self.segment_tables[pid]):
+            if segment.shared:
+                self.detach_shared(pid, segment.name)
             else:
-                merged.append((base, size))
-        self.free_blocks = merged
+                self._free_block(segment.base, segment.limit)
         
         del self.segment_tables[pid]
+        
+    def get_used_memory(self) -> int:
+        # Los segmentos compartidos se cuentan una vez, no por cada proceso
+        private = sum(s.limit for segs in self.segment_tables.values() for s in segs if not s.shared)
+        return private + sum(shared['limit'] for shared in self.shared_segments.values())
+
+#Asignador buddy: bloques de 2^k unidades, división y fusión con la dirección XOR
+class BuddyAllocator:
+    def __init__(self, total_memory: int, min_block: int = 1):
+        self.min_block = min_block
+        self.total_units = total_memory // min_block
+        self.max_order = max(self.total_units.bit_length() - 1, 0)
+        # Listas libres por orden (pilas con entradas obsoletas; el bitmap manda)
+        self.free_lists: List[List[int]] = [[] for _ in range(self.max_order + 1)]
+        self.bitmaps: List[bytearray] = [bytearray(self.total_units >> order)
+                                         for order in range(self.max_order + 1)]
+        self.free_counts = [0] * (self.max_order + 1)
+        self.allocated: Dict[int, Tuple[int, int, Optional[int]]] = {}  # dir -> (orden, pedido, pid)
+        self.process_blocks: Dict[int, List[int]] = {}
+        self.requested_units = 0
+        self.allocated_units = 0
+        self.allocations = 0
+        self.frees = 0
+        self.splits = 0
+        self.merges = 0
+        self.failures = 0
+        # Memoria que no es potencia de 2: se cubre con bloques alineados decrecientes
+        address = 0
+        for order in range(self.max_order, -1, -1):
+            if address + (1 << order) <= self.total_units:
+                self._push(order, address)
+                address += 1 << order
+                
+    def _push(self, order: int, address: int):
+        self.free_lists[order].append(address)
+        self.bitmaps[order][address >> order] = 1
+        self.free_counts[order] += 1
+        
+    def _pop(self, order: int) -> Optional[int]:
+        stack = self.free_lists[order]
+        bitmap = self.bitmaps[order]
+        while stack:
+            address = stack.pop()
+            if bitmap[address >> order]:
+                bitmap[address >> order] = 0
+                self.free_counts[order] -= 1
+                return address
+        return None
+        
+    def _remove(self, order: int, address: int):
+        # Baja perezosa: solo el bitmap; la entrada de la pila se descarta al salir
+        self.bitmaps[order][address >> order] = 0
+        self.free_counts[order] -= 1
+        stack = self.free_lists[order]
+        if len(stack) > 2 * self.free_counts[order] + 64:
+            bitmap = self.bitmaps[order]
+            self.free_lists[order] = [a for a in dict.fromkeys(stack) if bitmap[a >> order]]
+            
+    def allocate(self, size: int, pid: Optional[int] = None) -> Optional[int]:
+        """Reserva el bloque 2^k más pequeño que alcanza; devuelve su dirección"""
+        units = max(1, -(-size // self.min_block))
+        order = (units - 1).bit_length()
+        k = order
+        while k <= self.max_order and not self.free_counts[k]:
+            k += 1
+        if k > self.max_order:
+            self.failures += 1
+            return None
+        address = self._pop(k)
+        # Dividir: la mitad superior de cada división queda libre en el orden inferior
+        while k > order:
+            k -= 1
+            self._push(k, address + (1 << k))
+            self.splits += 1
+        self.allocated[address] = (order, units, pid)
+        if pid is not None:
+            self.process_blocks.setdefault(pid, []).append(address)
+        self.requested_units += units
+        self.allocated_units += 1 << order
+        self.allocations += 1
+        return address * self.min_block
+        
+    def free(self, address: int):
+        address //= self.min_block
+        order, units, _ = self.allocated.pop(address)
+        self.requested_units -= units
+        self.allocated_units -= 1 << order
+        self.frees += 1
+        # Fusionar mientras el buddy (dirección XOR 2^orden) esté libre en el mismo orden
+        while order < self.max_order:
+            buddy = address ^ (1 << order)
+            bitmap = self.bitmaps[order]
+            if (buddy >> order) >= len(bitmap) or not bitmap[buddy >> order]:
+                break
+            self._remove(order, buddy)
+            self.merges += 1
+            address &= ~(1 << order)
+            order += 1
+        self._push(order, address)
+        
+    def free_process(self, pid: int):
+        for address in self.process_blocks.pop(pid, []):
+            self.free(address * self.min_block)
+            
+    def process_size(self, pid: int) -> int:
+        return sum((1 << self.allocated[a][0]) * self.min_block
+                   for a in self.process_blocks.get(pid, []))
+        
+    def largest_free_block(self) -> int:
+        for order in range(self.max_order, -1, -1):
+            if self.free_counts[order]:
+                return (1 << order) * self.min_block
+        return 0
+        
+    def get_statistics(self) -> dict:
+        free_units = sum(count << order for order, count in enumerate(self.free_counts))
+        free_memory = free_units * self.min_block
+        largest = self.largest_free_block()
+        return {
+            'min_block': self.min_block,
+            'max_order': self.max_order,
+            'free_blocks': {(1 << order) * self.min_block: count
+                            for order, count in enumerate(self.free_counts) if count},
+            'allocated_blocks': len(self.allocated),
+            'free_memory': free_memory,
+            'largest_free_block': largest,
+            # Interna: redondeo a potencia de 2; externa: memoria libre que no está en el mayor bloque
+            'internal_fragmentation': (self.allocated_units - self.requested_units) * self.min_block,
+            'internal_fragmentation_ratio': (1 - self.requested_units / self.allocated_units
+                                             if self.allocated_units else 0),
+            'external_fragmentation': free_memory - largest,
+            'external_fragmentation_ratio': 1 - largest / free_memory if free_memory else 0,
+            'allocations': self.allocations,
+            'frees': self.frees,
+            'splits': self.splits,
+            'merges': self.merges,
+            'failures': self.failures
+        }
+
+#Slab: páginas contiguas partidas en objetos del mismo tamaño
+class Slab:
+    def __init__(self, slab_id: int, capacity: int, page_address: Optional[int]):
+        self.slab_id = slab_id
+        self.page_address = page_address  # dirección en el asignador de páginas (None: virtual)
+        self.capacity = capacity
+        self.free_objects: List[int] = list(range(capacity - 1, -1, -1))  # pila de índices libres
+        
+    @property
+    def in_use(self) -> int:
+        return self.capacity - len(self.free_objects)
+
+#Caché de objetos de un tamaño con listas de slabs llenos, parciales y vacíos
+class SlabCache:
+    def __init__(self, name: str, object_size: int, page_size: int = 4096,
+                 pages_per_slab: Optional[int] = None, page_source=None,
+                 num_cpus: int = 0, magazine_size: int = 16, max_empty: int = 2):
+        self.name = name
+        self.object_size = object_size
+        if pages_per_slab is None:
+            # Al menos 8 objetos por slab para que el desperdicio por slab sea pequeño
+            pages_per_slab = max(1, -(-8 * object_size // page_size))
+        self.slab_bytes = pages_per_slab * page_size
+        self.objects_per_slab = self.slab_bytes // object_size
+        self.page_source = page_source  # callable (bytes) -> dirección, y su liberador
+        self.max_empty = max_empty
+        self.slabs: Dict[int, Slab] = {}
+        # Diccionarios como conjuntos ordenados: mover un slab entre listas es O(1)
+        self.full: Dict[int, Slab] = {}
+        self.partial: Dict[int, Slab] = {}
+        self.empty: Dict[int, Slab] = {}
+        self.next_slab_id = 0
+        # Magazines por CPU: pilas de objetos ya reservados en los slabs
+        self.magazine_size = magazine_size
+        self.magazines: List[List[int]] = [[] for _ in range(num_cpus)]
+        self.active_objects = 0
+        self.allocations = 0
+        self.frees = 0
+        self.magazine_hits = 0
+        self.slabs_created = 0
+        self.slabs_destroyed = 0
+        self.failures = 0
+        
+    def _grow(self) -> Optional[Slab]:
+        page_address = None
+        if self.page_source is not None:
+            page_address = self.page_source[0](self.slab_bytes)
+            if page_address is None:
+                return None
+        slab = Slab(self.next_slab_id, self.objects_per_slab, page_address)
+        self.next_slab_id += 1
+        self.slabs[slab.slab_id] = slab
+        self.empty[slab.slab_id] = slab
+        self.slabs_created += 1
+        return slab
+        
+    def _destroy(self, slab: Slab):
+        del self.slabs[slab.slab_id]
+        del self.empty[slab.slab_id]
+        if self.page_source is not None:
+            self.page_source[1](slab.page_address)
+        self.slabs_destroyed += 1
+        
+    def _slab_alloc(self) -> Optional[int]:
+        # Preferir parciales: mantiene los vacíos disponibles para devolverlos
+        if self.partial:
+            slab = self.partial[next(iter(self.partial))]
+        elif self.empty:
+            slab = self.empty.pop(next(iter(self.empty)))
+            self.partial[slab.slab_id] = slab
+        else:
+            slab = self._grow()
+            if slab is None:
+                return None
+            del self.empty[slab.slab_id]
+            self.partial[slab.slab_id] = slab
+        index = slab.free_objects.pop()
+        if not slab.free_objects:
+            del self.partial[slab.slab_id]
+            self.full[slab.slab_id] = slab
+        return slab.slab_id * self.slab_bytes + index * self.object_size
+        
+    def _slab_free(self, address: int):
+        slab = self.slabs[address // self.slab_bytes]
+        if not slab.free_objects:
+            del self.full[slab.slab_id]
+            self.partial[slab.slab_id] = slab
+        slab.free_objects.append(address % self.slab_bytes // self.object_size)
+        if len(slab.free_objects) == slab.capacity:
+            del self.partial[slab.slab_id]
+            self.empty[slab.slab_id] = slab
+            if len(self.empty) > self.max_empty:
+                self._destroy(slab)
+                
+    def alloc(self, cpu: Optional[int] = None) -> Optional[int]:
+        """Reserva un objeto; con cpu usa primero su magazine"""
+        if cpu is not None and self.magazines:
+            magazine = self.magazines[cpu % len(self.magazines)]
+            if magazine:
+                self.magazine_hits += 1
+                self.allocations += 1
+                self.active_objects += 1
+                return magazine.pop()
+        address = self._slab_alloc()
+        if address is None:
+            self.failures += 1
+            return None
+        self.allocations += 1
+        self.active_objects += 1
+        return address
+        
+    def free(self, address: int, cpu: Optional[int] = None):
+        self.frees += 1
+        self.active_objects -= 1
+        if cpu is not None and self.magazines:
+            magazine = self.magazines[cpu % len(self.magazines)]
+            if len(magazine) >= self.magazine_size:
+                # Magazine lleno: devolver la mitad a los slabs
+                half = self.magazine_size // 2
+                for object_address in magazine[:half]:
+                    self._slab_free(object_address)
+                del magazine[:half]
+            magazine.append(address)
+            return
+        self._slab_free(address)
+        
+    def shrink(self) -> int:
+        # Vacía los magazines y devuelve todos los slabs vacíos al asignador de páginas
+        for magazine in self.magazines:
+            while magazine:
+                self._slab_free(magazine.pop())
+        released = len(self.empty)
+        for slab in list(self.empty.values()):
+            self._destroy(slab)
+        return released
+        
+    def get_statistics(self) -> dict:
+        capacity = len(self.slabs) * self.objects_per_slab
+        return {
+            'name': self.name,
+            'object_size': self.object_size,
+            'objects_per_slab': self.objects_per_slab,
+            'slab_bytes': self.slab_bytes,
+            'active_objects': self.active_objects,
+            'total_objects': capacity,
+            'full_slabs': len(self.full),
+            'partial_slabs': len(self.partial),
+            'empty_slabs': len(self.empty),
+            'memory': len(self.slabs) * self.slab_bytes,
+            'utilization': self.active_objects * self.object_size / (len(self.slabs) * self.slab_bytes)
+                           if self.slabs else 0,
+            'magazine_objects': sum(len(m) for m in self.magazines),
+            'magazine_hit_rate': self.magazine_hits / self.allocations if self.allocations else 0,
+            'allocations': self.allocations,
+            'frees': self.frees,
+            'slabs_created': self.slabs_created,
+            'slabs_destroyed': self.slabs_destroyed,
+            'failures': self.failures
+        }
+
+#Asignador slab: cachés por tamaño de objeto sobre un asignador de páginas
+class SlabAllocator:
+    def __init__(self, page_size: int = 4096, page_allocator=None, page_unit: int = 1,
+                 num_cpus: int = 0, magazine_size: int = 16):
+        self.page_size = page_size
+        self.page_allocator = page_allocator  # p. ej. BuddyAllocator; None: páginas virtuales
+        self.page_unit = page_unit            # bytes por unidad del asignador de páginas
+        self.num_cpus = num_cpus
+        self.magazine_size = magazine_size
+        self.caches: Dict[str, SlabCache] = {}
+        
+    def _alloc_pages(self, size: int) -> Optional[int]:
+        return self.page_allocator.allocate(-(-size // self.page_unit))
+        
+    def create_cache(self, name: str, object_size: int, **config) -> SlabCache:
+        if name in self.caches:
+            return self.caches[name]
+        config.setdefault('num_cpus', self.num_cpus)
+        config.setdefault('magazine_size', self.magazine_size)
+        page_source = None
+        if self.page_allocator is not None:
+            page_source = (self._alloc_pages, self.page_allocator.free)
+        self.caches[name] = SlabCache(name, object_size, self.page_size,
+                                      page_source=page_source, **config)
+        return self.caches[name]
+        
+    def shrink(self) -> int:
+        return sum(cache.shrink() for cache in self.caches.values())
+        
+    def get_statistics(self) -> dict:
+        caches = {name: cache.get_statistics() for name, cache in self.caches.items()}
+        memory = sum(c['memory'] for c in caches.values())
+        used = sum(c['active_objects'] * c['object_size'] for c in caches.values())
+        return {
+            'caches': caches,
+            'memory': memory,
+            'used': used,
+            'utilization': used / memory if memory else 0
+        }
 
 #Se define el gesto de memoria
 
 class MemoryManager:
     
-    def __init__(self, total_memory: int = 1024, mode: str = 'paging'):
+    def __init__(self, total_memory: int = 1024, mode: str = 'paging', page_table_type: str = 'flat',
+                 page_size: int = 4, huge_page_size: Optional[int] = None,
+                 partition_scheme: str = 'fixed'):
         self.total_memory = total_memory
         self.mode = mode
+        self.cow_fork = True  # fork con copy-on-write (False: copia completa)
+        self.slab_allocator: Optional[SlabAllocator] = None
         
-        if mode == 'partitions':
+        if mode == 'partitions' and partition_scheme == 'dynamic':
+            # Particiones dinámicas: los huecos se crean al asignar
+            self.partition_manager = PartitionManager(total_memory)
+        elif mode == 'partitions':
             # Particiones fijas
             self.partition_manager = PartitionManager(
                 total_memory, 
@@ -325,15 +3074,174 @@ class MemoryManager:
             )
         elif mode == 'paging':
             # Paginación
-            num_frames = total_memory // 4  # 4KB por frame
-            self.paging_manager = PagingManager(num_frames, 4)
+            num_frames = total_memory // page_size  # page_size KB por frame
+            self.paging_manager = PagingManager(num_frames, page_size, page_table_type)
+            if huge_page_size:
+                self.enable_huge_pages(huge_page_size)
         elif mode == 'segmentation':
             # Segmentación
             self.segmentation_manager = SegmentationManager(total_memory)
+        elif mode == 'buddy':
+            # Sistema buddy (bloques de 1 KB a total_memory)
+            self.buddy_allocator = BuddyAllocator(total_memory)
             
     def initialize(self):
         print(f"Memoria inicializada: {self.total_memory} KB (modo: {self.mode})")
         
+    def enable_tlb(self, **config) -> Optional[TLB]:
+        if self.mode != 'paging':
+            return None
+        return self.paging_manager.enable_tlb(**config)
+        
+    def enable_huge_pages(self, huge_page_size: int, **config) -> Optional[HugePagePolicy]:
+        # huge_page_size en KB, múltiplo del tamaño de página base
+        if self.mode != 'paging':
+            return None
+        factor = max(1, huge_page_size // self.paging_manager.page_size)
+        return self.paging_manager.enable_huge_pages(factor=factor, **config)
+        
+    def enable_readahead(self, **config) -> Optional[ReadaheadPolicy]:
+        if self.mode != 'paging':
+            return None
+        return self.paging_manager.enable_readahead(**config)
+        
+    def enable_working_set(self, **config) -> Optional[WorkingSetController]:
+        if self.mode != 'paging':
+            return None
+        return self.paging_manager.enable_working_set(**config)
+        
+    def add_memory_pressure_listeners(self, on_suspend, on_resume):
+        # El control PFF suspende/reanuda procesos a través de estos callbacks
+        if self.mode == 'paging':
+            self.paging_manager.suspend_listeners.append(on_suspend)
+            self.paging_manager.resume_listeners.append(on_resume)
+            
+    def enable_swap(self, num_slots: int = 1024, path: Optional[str] = None) -> Optional[SwapArea]:
+        if self.mode != 'paging':
+            return None
+        return self.paging_manager.enable_swap(num_slots, path)
+        
+    def enable_backing_store(self, swap_slots: int = 1024,
+                             swap_path: Optional[str] = None) -> Optional[FrameArena]:
+        # page_size está en KB: cada frame del arena ocupa page_size * 1024 bytes reales
+        if self.mode != 'paging':
+            return None
+        return self.paging_manager.enable_backing_store(self.paging_manager.page_size * 1024,
+                                                        swap_slots, swap_path)
+        
+    def enable_compaction(self, threshold: Optional[float] = 0.5, move_cost: float = 1.0):
+        # Solo tiene efecto con particiones dinámicas (None desactiva la compactación)
+        if self.mode == 'partitions':
+            self.partition_manager.compaction_threshold = threshold
+            self.partition_manager.move_cost = move_cost
+            
+    def enable_slab(self, page_size: int = 4096, **config) -> SlabAllocator:
+        # En modo buddy los slabs consumen bloques reales (unidades de 1 KB); si no, páginas virtuales
+        if self.mode == 'buddy':
+            config.setdefault('page_allocator', self.buddy_allocator)
+            config.setdefault('page_unit', 1024 * self.buddy_allocator.min_block)
+        self.slab_allocator = SlabAllocator(page_size, **config)
+        return self.slab_allocator
+        
+    def get_slab_statistics(self) -> Optional[dict]:
+        return self.slab_allocator.get_statistics() if self.slab_allocator is not None else None
+        
+    def allocated_size(self, pid: int) -> int:
+        if self.mode == 'partitions':
+            return sum(p.size for p in self.partition_manager.partitions if p.process_id == pid)
+        elif self.mode == 'paging':
+            table = self.paging_manager.page_tables.get(pid)
+            return len(table) * self.paging_manager.page_size if table is not None else 0
+        elif self.mode == 'segmentation':
+            return sum(seg.limit for seg in self.segmentation_manager.segment_tables.get(pid, []))
+        elif self.mode == 'buddy':
+            return self.buddy_allocator.process_size(pid)
+        return 0
+        
+    def swap_out(self, pid: int) -> int:
+        # Saca al proceso de memoria; devuelve los bytes escritos en swap
+        if self.mode == 'paging':
+            return self.paging_manager.swap_out_process(pid)
+        size = self.allocated_size(pid)
+        self.deallocate(pid)
+        return size
+        
+    def swap_in(self, pid: int, size: int) -> Tuple[bool, int]:
+        # Devuelve (éxito, bytes leídos de swap)
+        if self.mode == 'paging':
+            if pid not in self.paging_manager.page_tables:
+                return self.allocate(pid, size), 0
+            return True, self.paging_manager.swap_in_process(pid)
+        if self.allocate(pid, size):
+            return True, size
+        return False, 0
+        
+    def pressure_suspended(self) -> List[int]:
+        # Procesos suspendidos por el control PFF (los reanuda PagingManager, no el MTS)
+        if self.mode != 'paging' or self.paging_manager.working_set is None:
+            return []
+        return list(self.paging_manager.working_set.suspended)
+        
+    def is_overcommitted(self, active_pids: List[int], ratio: float = 1.0) -> bool:
+        # Solo la paginación puede sobrecomprometer memoria (las demás fallan al asignar)
+        if self.mode != 'paging':
+            return False
+        demand = sum(self.paging_manager.process_footprint(pid) for pid in active_pids)
+        return demand > len(self.paging_manager.frames) * ratio
+        
+    def can_admit(self, active_pids: List[int], footprint: int, ratio: float = 0.9) -> bool:
+        if self.mode != 'paging':
+            return True
+        demand = sum(self.paging_manager.process_footprint(pid) for pid in active_pids)
+        return demand + footprint <= len(self.paging_manager.frames) * ratio
+        
+    def attach_swap_device(self, io_manager, device_name: str = 'swap0'):
+        if self.mode == 'paging':
+            self.paging_manager.attach_swap_device(io_manager, device_name)
+            
+    def run_page_cleaner(self, batch_size: int = 8) -> int:
+        if self.mode != 'paging':
+            return 0
+        # El demonio de fondo también reintenta promover páginas grandes
+        self.paging_manager.scan_huge_promotions()
+        return self.paging_manager.run_page_cleaner(batch_size)
+        
+    def fork(self, parent: int, child: int, cow: Optional[bool] = None) -> bool:
+        # En paginación el hijo comparte frames (COW); en los demás modos se copia
+        if self.mode == 'paging':
+            if cow is None:
+                cow = self.cow_fork
+            return self.paging_manager.fork_process(parent, child, cow) is not None
+        size = self.allocated_size(parent)
+        return size > 0 and self.allocate(child, size)
+        
+    def create_shared(self, name: str, size: int) -> bool:
+        if self.mode == 'paging':
+            page_size = self.paging_manager.page_size
+            return self.paging_manager.create_shared_segment(name, (size + page_size - 1) // page_size)
+        elif self.mode == 'segmentation':
+            return self.segmentation_manager.create_shared_segment(name, size)
+        return False
+        
+    def attach_shared(self, pid: int, name: str) -> Optional[int]:
+        # Paginación: página base del segmento; segmentación: número de segmento
+        if self.mode == 'paging':
+            return self.paging_manager.attach_shared(pid, name)
+        elif self.mode == 'segmentation':
+            return self.segmentation_manager.attach_shared(pid, name)
+        return None
+        
+    def detach_shared(self, pid: int, name: str):
+        if self.mode == 'paging':
+            self.paging_manager.detach_shared(pid, name)
+        elif self.mode == 'segmentation':
+            self.segmentation_manager.detach_shared(pid, name)
+        
+    def on_context_switch(self, old_pid: Optional[int], new_pid: Optional[int]):
+        # Llamado por el CPUScheduler en cada cambio de proceso
+        if self.mode == 'paging' and self.paging_manager.tlb is not None:
+            self.paging_manager.tlb.context_switch(old_pid, new_pid)
+        
     def allocate(self, pid: int, size: int, algorithm: str = 'first_fit') -> bool:
         if self.mode == 'partitions':
             if algorithm == 'first_fit':
@@ -348,14 +3256,15 @@ class MemoryManager:
             
         elif self.mode == 'paging':
             num_pages = (size + self.paging_manager.page_size - 1) // self.paging_manager.page_size
+            # Paginación por demanda: nada se carga hasta el primer fallo
             self.paging_manager.create_page_table(pid, num_pages)
-            # Cargar páginas iniciales
-            for page_num in range(min(num_pages, 3)):  # Cargar primeras 3 páginas
-                self.paging_manager.load_page(pid, page_num)
             return True
             
         elif self.mode == 'segmentation':
-            return self.segmentation_manager.create_segment(pid, 0, size, f"process_{pid}")
+            return self.segmentation_manager.create_segment(pid, 0, size, f"process_{pid}", algorithm)
+            
+        elif self.mode == 'buddy':
+            return self.buddy_allocator.allocate(size, pid) is not None
             
         return False
         
@@ -363,52 +3272,129 @@ class MemoryManager:
         if self.mode == 'partitions':
             self.partition_manager.deallocate(pid)
         elif self.mode == 'paging':
-            if pid in self.paging_manager.page_tables:
-                del self.paging_manager.page_tables[pid]
+            self.paging_manager.release_process(pid)
         elif self.mode == 'segmentation':
             self.segmentation_manager.deallocate_segments(pid)
+        elif self.mode == 'buddy':
+            self.buddy_allocator.free_process(pid)
             
-    def get_memory_state(self) -> dict:
+    def get_memory_state(self, start: int = 0, end: Optional[int] = None, pid: Optional[int] = None,
+                         occupied_only: bool = False, limit: Optional[int] = None) -> dict:
+        """Estado de memoria acotado: rango de frames (paginación) o de direcciones, pid y solo ocupados"""
+        def in_range(base: int) -> bool:
+            return base >= start and (end is None or base < end)
+        
+        def select(items: List[dict], default_limit: Optional[int],
+                   owner_key: str = 'process') -> Tuple[List[dict], bool]:
+            # Filtra por pid/ocupación y recorta; indica si quedaron elementos fuera
+            items = [
+                item for item in items
+                if in_range(item['base'])
+                and (pid is None or item[owner_key] == pid)
+                and (not occupied_only or item[owner_key] is not None)
+            ]
+            max_items = limit if limit is not None else default_limit
+            if max_items is None or len(items) <= max_items:
+                return items, False
+            return items[:max_items], True
+        
         if self.mode == 'partitions':
+            partitions, truncated = select(self.partition_manager.layout(), None, 'process_id')
             return {
                 'mode': 'partitions',
-                'partitions': [
-                    {
-                        'id': p.id,
-                        'size': p.size,
-                        'allocated': p.allocated,
-                        'process_id': p.process_id
-                    }
-                    for p in self.partition_manager.partitions
-                ]
+                'partitions': partitions,
+                'truncated': truncated,
+                **self.partition_manager.get_statistics()
             }
         elif self.mode == 'paging':
+            utilization = self.paging_manager.get_utilization()
+            tlb = self.paging_manager.tlb
+            # Por defecto solo los primeros 20 frames; el mapa de tramos cubre el rango
+            # hasta 256 tramos (con memoria muy fragmentada también se pagina)
+            frames, next_start = self.paging_manager.frame_range(
+                start, end, pid, occupied_only, limit if limit is not None else 20)
+            runs, next_run_start = self.paging_manager.ownership_map(start, end, max_runs=256)
             return {
                 'mode': 'paging',
-                'total_frames': len(self.paging_manager.frames),
+                'total_frames': utilization['total_frames'],
+                'used_frames': utilization['used_frames'],
+                'free_frames': utilization['free_frames'],
+                'utilization': utilization['utilization'],
                 'page_faults': self.paging_manager.page_faults,
                 'page_accesses': self.paging_manager.page_accesses,
+                'tlb': tlb.get_statistics() if tlb is not None else None,
+                'page_tables': self.paging_manager.get_page_table_statistics(),
+                'readahead': (self.paging_manager.readahead.get_statistics()
+                              if self.paging_manager.readahead is not None else None),
+                'working_set': self.paging_manager.get_working_set_statistics(),
+                'writeback': self.paging_manager.get_writeback_statistics(),
+                'swap': (self.paging_manager.swap_area.get_statistics()
+                         if self.paging_manager.swap_area is not None else None),
+                'backing_store': (self.paging_manager.arena.get_statistics()
+                                  if self.paging_manager.arena is not None else None),
+                'fork': self.paging_manager.get_fork_statistics(),
+                'resident': self.paging_manager.get_resident_statistics(),
+                'huge_pages': self.paging_manager.get_huge_page_statistics(),
                 'frames': [
                     {
                         'frame': f.frame_number,
                         'occupied': f.occupied,
                         'process': f.process_id
                     }
-                    for f in self.paging_manager.frames[:20]  # Primeros 20
-                ]
+                    for f in frames
+                ],
+                'next_start': next_start,  # cursor para pedir la siguiente página de frames
+                'ownership': [
+                    {'process': owner, 'start': first, 'length': length}
+                    for owner, first, length in runs
+                ],
+                'ownership_next_start': next_run_start
             }
         elif self.mode == 'segmentation':
+            # Segmentos y huecos libres en orden de dirección; el límite es global
+            items, truncated = select(sorted([
+                {'process': owner, 'num': s.segment_number, 'base': s.base, 'size': s.limit, 'name': s.name}
+                for owner, segs in self.segmentation_manager.segment_tables.items() for s in segs
+            ] + [
+                {'process': None, 'base': base, 'size': size}
+                for base, size in self.segmentation_manager.free_blocks
+            ], key=lambda item: item['base']), None)
+            by_process: Dict[int, List[dict]] = {}
+            for item in items:
+                if item['process'] is not None:
+                    by_process.setdefault(item['process'], []).append(
+                        {k: item[k] for k in ('num', 'base', 'size', 'name')})
             return {
                 'mode': 'segmentation',
                 'segments': [
-                    {
-                        'process': pid,
-                        'segments': [
-                            {'num': s.segment_number, 'base': s.base, 'size': s.limit, 'name': s.name}
-                            for s in segs
-                        ]
-                    }
-                    for pid, segs in self.segmentation_manager.segment_tables.items()
-                ]
+                    {'process': owner, 'segments': segs}
+                    for owner, segs in by_process.items()
+                ],
+                'free_segments': [
+                    {'base': item['base'], 'size': item['size']}
+                    for item in items if item['process'] is None
+                ],
+                'truncated': truncated,
+                'shared_segments': {
+                    name: {'base': shared['base'], 'size': shared['limit'],
+                           'refcount': len(shared['attached'])}
+                    for name, shared in self.segmentation_manager.shared_segments.items()
+                },
+                'used_memory': self.segmentation_manager.get_used_memory(),
+                'free_blocks': len(self.segmentation_manager.free_index),
+                'largest_free_block': self.segmentation_manager.free_index.largest()
+            }
+        elif self.mode == 'buddy':
+            buddy = self.buddy_allocator
+            blocks, truncated = select([
+                {'base': address * buddy.min_block, 'size': (1 << order) * buddy.min_block,
+                 'requested': units * buddy.min_block, 'process': owner}
+                for address, (order, units, owner) in sorted(buddy.allocated.items())
+            ], 50)
+            return {
+                'mode': 'buddy',
+                'blocks': blocks,
+                'truncated': truncated,
+                **buddy.get_statistics()
             }
         return {}
@@ -3,15 +3,19 @@
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import time
 
+PCB_OBJECT_SIZE = 512  # bytes que ocupa un PCB en la caché slab del kernel
+
 class ProcessState(Enum):
     nuevo = "NEW"
     listo = "READY"
     corriendo = "RUNNING"
     esperando = "WAITING"
     terminado = "TERMINATED"
+    suspendido_listo = "SUSPENDED_READY"
+    suspendido_esperando = "SUSPENDED_WAITING"
 
 @dataclass
 class PCB:
@@ -19,6 +23,7 @@ class PCB:
     name: str
     state: str = "NEW"
     priority: int = 5
+    parent_pid: Optional[int] = None
     program_counter: int = 0
     cpu_registers: dict = field(default_factory=dict)
     
@@ -54,7 +59,26 @@ class ProcessManager:
         self.next_pid = 1
         self.ready_queue: List[int] = []
         self.waiting_queue: List[int] = []
+        self.suspended_queue: List[int] = []
         self.running_process: Optional[int] = None
+        # Observadores de terminación (p. ej. liberar memoria del proceso)
+        self.termination_listeners: List[Callable[[int], None]] = []
+        
+        # Observadores de fork (p. ej. compartir la memoria del padre con el hijo)
+        self.fork_listeners: List[Callable[[int, int], None]] = []
+        
+        # Memoria de los PCB contabilizada en una caché slab (opcional)
+        self.pcb_cache = None
+        self.pcb_objects: Dict[int, int] = {}
+        
+    def attach_slab_allocator(self, slab_allocator, object_size: int = PCB_OBJECT_SIZE):
+        self.pcb_cache = slab_allocator.create_cache('pcb', object_size)
+        
+    def add_termination_listener(self, listener: Callable[[int], None]):
+        self.termination_listeners.append(listener)
+        
+    def add_fork_listener(self, listener: Callable[[int, int], None]):
+        self.fork_listeners.append(listener)
         
     def create_process(self, name: str, priority: int = 5, 
                       burst_time: int = 10, memory_required: int = 100) -> int:
@@ -71,10 +95,34 @@ class ProcessManager:
         )
         
         self.processes[pid] = pcb
+        if self.pcb_cache is not None:
+            address = self.pcb_cache.alloc(cpu=0)
+            if address is not None:
+                self.pcb_objects[pid] = address
         self.transition_to_ready(pid)
         
         return pid
     
+    def fork(self, pid: int) -> Optional[int]:
+        #Duplica el proceso: el hijo hereda el contexto y la memoria del padre
+        if pid not in self.processes:
+            return None
+        parent = self.processes[pid]
+        if parent.state == ProcessState.terminado.value:
+            return None
+            
+        child = self.create_process(parent.name, parent.priority,
+                                    parent.remaining_time, parent.memory_required)
+        pcb = self.processes[child]
+        pcb.parent_pid = pid
+        pcb.program_counter = parent.program_counter
+        pcb.cpu_registers = dict(parent.cpu_registers)
+        print(f"Proceso {pid} ({parent.name}): fork -> {child}")
+        
+        for listener in self.fork_listeners:
+            listener(pid, child)
+        return child
+    
     def transition_to_ready(self, pid: int):
         #Transicion a READY
         if pid not in self.processes:
@@ -82,6 +130,12 @@ class ProcessManager:
             
         pcb = self.processes[pid]
         old_state = pcb.state
+        
+        # Evento completado mientras estaba en swap: sigue fuera de memoria
+        if old_state == ProcessState.suspendido_esperando.value:
+            pcb.state = ProcessState.suspendido_listo.value
+            print(f"Proceso {pid} ({pcb.name}): {old_state} -> SUSPENDED_READY")
+            return
         pcb.state = ProcessState.nuevo.value
         
         if pid not in self.ready_queue:
@@ -90,6 +144,10 @@ class ProcessManager:
         if pid in self.waiting_queue:
             self.waiting_queue.remove(pid)
             
+        # Apropiación: libera la CPU para el siguiente proceso
+        if self.running_process == pid:
+            self.running_process = None
+            
         print(f"Proceso {pid} ({pcb.name}): {old_state} -> READY")
     
     def transition_to_running(self, pid: int):
@@ -135,6 +193,46 @@ class ProcessManager:
         pcb.io_operations += 1
         print(f"Proceso {pid} ({pcb.name}): {old_state} -> WAITING ({reason})")
     
+    def suspend_process(self, pid: int, reason: str = "MEMORY"):
+        #Transicion a Suspended (fuera de memoria, el planificador no lo ve)
+        if pid not in self.processes:
+            return
+            
+        pcb = self.processes[pid]
+        if pcb.state in (ProcessState.terminado.value, ProcessState.suspendido_listo.value,
+                         ProcessState.suspendido_esperando.value):
+            return
+        old_state = pcb.state
+        if old_state == ProcessState.esperando.value:
+            pcb.state = ProcessState.suspendido_esperando.value
+        else:
+            pcb.state = ProcessState.suspendido_listo.value
+        
+        if pid in self.ready_queue:
+            self.ready_queue.remove(pid)
+        if pid in self.waiting_queue:
+            self.waiting_queue.remove(pid)
+        if self.running_process == pid:
+            self.running_process = None
+        if pid not in self.suspended_queue:
+            self.suspended_queue.append(pid)
+            
+        print(f"Proceso {pid} ({pcb.name}): {old_state} -> {pcb.state} ({reason})")
+    
+    def resume_process(self, pid: int):
+        #Suspended_Ready -> Ready, Suspended_Waiting -> Waiting
+        if pid not in self.suspended_queue:
+            return
+        self.suspended_queue.remove(pid)
+        pcb = self.processes[pid]
+        if pcb.state == ProcessState.suspendido_esperando.value:
+            pcb.state = ProcessState.esperando.value
+            if pid not in self.waiting_queue:
+                self.waiting_queue.append(pid)
+            print(f"Proceso {pid} ({pcb.name}): SUSPENDED_WAITING -> WAITING")
+        else:
+            self.transition_to_ready(pid)
+    
     def terminate_process(self, pid: int):
         #Transicion a Terminated
         if pid not in self.processes:
@@ -149,10 +247,17 @@ class ProcessManager:
             self.ready_queue.remove(pid)
         if pid in self.waiting_queue:
             self.waiting_queue.remove(pid)
+        if pid in self.suspended_queue:
+            self.suspended_queue.remove(pid)
         if self.running_process == pid:
             self.running_process = None
             
         print(f"Proceso {pid} ({pcb.name}) TERMINADO")
+        if pid in self.pcb_objects:
+            self.pcb_cache.free(self.pcb_objects.pop(pid), cpu=0)
+        
+        for listener in self.termination_listeners:
+            listener(pid)
     
     def execute_process(self, pid: int, time_slice: int = 1) -> bool:
         #Ejecuta un proceso por un time slice
@@ -190,6 +295,7 @@ class ProcessManager:
                 'name': pcb.name,
                 'state': pcb.state,
                 'priority': pcb.priority,
+                'parent_pid': pcb.parent_pid,
                 'burst_time': pcb.burst_time,
                 'remaining_time': pcb.remaining_time,
                 'waiting_time': pcb.waiting_time,
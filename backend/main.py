@@ -9,6 +9,8 @@ from core.cpu_scheduler import CPUScheduler
 from core.memory_manager import MemoryManager
 from core.io_manager import IOManager
 from core.concurrency_manager import ConcurrencyManager
+from core.medium_term_scheduler import MediumTermScheduler
+import numpy as np
 import time
 
 #Definimos la clase principal que es el kernel
@@ -19,8 +21,28 @@ class Kernel:
         self.memory_manager=MemoryManager()
         self.io_manager=IOManager()
         self.concurrency_manager=ConcurrencyManager()
+        self.medium_term_scheduler=MediumTermScheduler(self.process_manager, self.memory_manager)
         self.running=False
         self.clock=0
+        # PCBs y solicitudes de E/S se contabilizan en cachés slab del kernel
+        slab_allocator=self.memory_manager.enable_slab()
+        self.process_manager.attach_slab_allocator(slab_allocator)
+        self.io_manager.attach_slab_allocator(slab_allocator)
+        # Los cambios de contexto del planificador vacían/etiquetan la TLB
+        self.cpu_scheduler.add_context_switch_listener(
+            lambda old_pid, new_pid: self.memory_manager.on_context_switch(old_pid, new_pid))
+        # Al terminar un proceso se recuperan sus frames
+        self.process_manager.add_termination_listener(
+            lambda pid: self.memory_manager.deallocate(pid))
+        # En un fork el hijo comparte la memoria del padre (copy-on-write)
+        self.process_manager.add_fork_listener(self._on_fork)
+        # El control PFF suspende y reanuda procesos ante sobrecarga de memoria
+        self.memory_manager.add_memory_pressure_listeners(
+            self.process_manager.suspend_process, self.process_manager.resume_process)
+    
+    def _on_fork(self, parent, child):
+        if not self.memory_manager.fork(parent, child):
+            self.medium_term_scheduler.admit_without_memory(child)
     
     def initialize(self):
         #Inicializa el kernel
@@ -29,6 +51,8 @@ class Kernel:
         print("="*60)
         self.memory_manager.initialize()
         self.io_manager.initialize()
+        # Las páginas sucias desalojadas se escriben en el disco de swap
+        self.memory_manager.attach_swap_device(self.io_manager)
         print("✅ Sistema operagtivo listo.\n")
     
     def create_process(self, name, priority=5, burst_time=10, memory_required=100):
@@ -38,9 +62,10 @@ class Kernel:
             print(f"✅ Proceso {pid} ({name}) creado y memoria asignada.")
             return pid
         else:
-            print(f"❌ Error: No hay memoria suficiente para proceso {pid}")
-            self.process_manager.terminate_process(pid)
-            return None
+            # Sin memoria: queda suspendido hasta que el planificador a mediano plazo lo admita
+            print(f"⚠️ No hay memoria suficiente para proceso {pid}, queda suspendido")
+            self.medium_term_scheduler.admit_without_memory(pid)
+            return pid
     
     def run_simulation(self, algorithm='FCFS', time_quantum=4, steps=20):
         print(f"\n{'='*60}")
@@ -65,12 +90,18 @@ class Kernel:
             print(f"⏰ Clock: {self.clock}")
             print('─'*60)
             
+            # Planificador a mediano plazo: swap-out ante sobrecompromiso, swap-in si hay espacio
+            self.medium_term_scheduler.tick()
+            
             # Ejecutar scheduler
             self.cpu_scheduler.schedule(algorithm, time_quantum)
             
             # Procesar E/S
             self.io_manager.process_io_queues(time.time())
             
+            # Limpiador de páginas: escribe en lote las páginas sucias
+            self.memory_manager.run_page_cleaner()
+            
             # Actualizar estadísticas
             self._update_statistics()
             
@@ -87,8 +118,9 @@ class Kernel:
         running = len([p for p in self.process_manager.processes.values() if p.state == 'RUNNING'])
         waiting = len([p for p in self.process_manager.processes.values() if p.state == 'WAITING'])
         terminated = len([p for p in self.process_manager.processes.values() if p.state == 'TERMINATED'])
+        suspended = len(self.process_manager.suspended_queue)
         
-        print(f"📊 Estado - Ready: {ready}, Running: {running}, Waiting: {waiting}, Terminated: {terminated}")
+        print(f"📊 Estado - Ready: {ready}, Running: {running}, Waiting: {waiting}, Suspended: {suspended}, Terminated: {terminated}")
     
     def _print_final_statistics(self):
         print("\n Estadisticas Finales")
@@ -119,6 +151,18 @@ class Kernel:
         if mem_state['mode'] == 'paging':
             print(f"  Page Faults: {mem_state.get('page_faults', 0)}")
             print(f"  Frames totales: {mem_state.get('total_frames', 0)}")
+            if mem_state.get('tlb'):
+                print(f"  TLB hit rate: {mem_state['tlb']['hit_rate']:.1f}%")
+                print(f"  Tiempo efectivo de acceso: {mem_state['tlb']['effective_access_time']:.2f}")
+            comparison = self.memory_manager.paging_manager.compare_algorithms()
+            for algo, result in comparison.items():
+                print(f"  {algo}: {result['page_faults']} page faults "
+                      f"({result['hit_rate']:.1f}% aciertos)")
+        slab_stats = self.memory_manager.get_slab_statistics()
+        if slab_stats:
+            for name, cache in slab_stats['caches'].items():
+                print(f"  Slab {name}: {cache['active_objects']}/{cache['total_objects']} objetos "
+                      f"({cache['utilization']*100:.1f}% utilización)")
             
         # Estadísticas de E/S
         io_stats = self.io_manager.get_statistics()
@@ -255,6 +299,15 @@ def demo_memory():
     print(f"  Total accesos: {paging.page_accesses}")
     print(f"  Page faults: {paging.page_faults}")
     print(f"  Tasa de aciertos: {((paging.page_accesses - paging.page_faults) / paging.page_accesses * 100):.1f}%")
+    
+    # Comparar algoritmos sobre la misma cadena sin re-ejecutar la simulación
+    print("\n2. COMPARACIÓN DE ALGORITMOS (3 frames)")
+    print("-" * 60)
+    references = np.array([(1, page) for page in pages])
+    results = paging.simulate_references(references, 3)
+    for algo, result in results.items():
+        print(f"  {algo}: {result['page_faults']} page faults, "
+              f"tasa de aciertos {result['hit_rate']:.1f}%")
 
 
 def demo_io():
@@ -0,0 +1,102 @@
+#Pruebas de los asignadores de memoria
+
+import random
+
+import pytest
+
+from core.memory_manager import BuddyAllocator, FreeBlockIndex, PartitionManager, SlabAllocator
+
+
+def _reference_find(blocks, size, algorithm):
+    fits = [(base, block) for base, block in blocks if block >= size]
+    if not fits:
+        return None
+    if algorithm == 'first_fit':
+        return fits[0][0]
+    if algorithm == 'best_fit':
+        return min(fits, key=lambda b: (b[1], b[0]))[0]
+    return min(fits, key=lambda b: (-b[1], b[0]))[0]
+
+
+@pytest.mark.parametrize('algorithm', ['first_fit', 'best_fit', 'worst_fit'])
+def test_free_block_index_matches_linear_search(algorithm):
+    rng = random.Random(11)
+    index = FreeBlockIndex(0, 50000)
+    live = []
+    for _ in range(2000):
+        if live and rng.random() < 0.45:
+            index.free(*live.pop(rng.randrange(len(live))))
+            continue
+        size = rng.randint(1, 2000)
+        base = index.find(size, algorithm)
+        assert base == _reference_find(index.blocks(), size, algorithm)
+        if base is not None:
+            index.take(base, size)
+            live.append((base, size))
+    blocks = index.blocks()
+    assert all(a + s < b for (a, s), (b, _) in zip(blocks, blocks[1:]))
+
+
+def test_first_fit_skips_small_blocks_of_the_same_class():
+    index = FreeBlockIndex(0, 4096)
+    index.take(0, 4096)
+    for base in range(0, 3840, 256):
+        index.free(base, 100)
+    index.free(3840, 120)
+    assert index.find(110) == 3840
+    assert index.find(121) is None
+    assert index.find(50) == 0
+
+
+def test_buddy_blocks_are_aligned_and_coalesce():
+    buddy = BuddyAllocator(1024)
+    rng = random.Random(5)
+    live = {}
+    for _ in range(500):
+        if live and rng.random() < 0.5:
+            address = rng.choice(list(live))
+            del live[address]
+            buddy.free(address)
+            continue
+        size = rng.randint(1, 100)
+        address = buddy.allocate(size)
+        if address is None:
+            continue
+        block = 1 << buddy.allocated[address][0]
+        assert block >= size and address % block == 0
+        assert all(address + block <= a or a + s <= address for a, s in live.items())
+        live[address] = block
+    for address in list(live):
+        buddy.free(address)
+    assert buddy.largest_free_block() == 1024
+    assert buddy.free_counts[buddy.max_order] == 1
+
+
+def test_slab_cache_returns_pages_to_buddy_allocator():
+    buddy = BuddyAllocator(64 * 4096, min_block=4096)
+    cache = SlabAllocator(page_allocator=buddy, page_unit=4096,
+                          num_cpus=1, magazine_size=4).create_cache('pcb', 512)
+    objects = [cache.alloc(cpu=0) for _ in range(40)]
+    assert None not in objects and len(set(objects)) == 40
+    assert cache.get_statistics()['active_objects'] == 40
+    for address in objects:
+        cache.free(address, cpu=0)
+    # Los objetos liberados en el magazine se reutilizan sin tocar los slabs
+    assert cache.alloc(cpu=0) == objects[-1]
+    cache.free(objects[-1], cpu=0)
+    cache.shrink()
+    assert not cache.slabs
+    assert buddy.largest_free_block() == 64 * 4096
+
+
+@pytest.mark.parametrize('threshold, compacted', [(0.5, True), (None, False)])
+def test_dynamic_partitions_compact_above_threshold(threshold, compacted):
+    partitions = PartitionManager(100, block_size=10, compaction_threshold=threshold)
+    for pid in range(5):
+        assert partitions.allocate_first_fit(pid, 18) == pid * 20
+    partitions.deallocate(1)
+    partitions.deallocate(3)
+    # 40 libres en dos huecos de 20: con umbral 0.5 ya se compacta al liberar
+    assert partitions.get_fragmentation() == (6, 0 if compacted else 20)
+    assert (partitions.allocate_first_fit(9, 40) is not None) == compacted
+    assert partitions.compactions == int(compacted)
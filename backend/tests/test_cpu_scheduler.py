@@ -0,0 +1,47 @@
+#Pruebas del planificador de CPU
+
+from core.process_manager import ProcessManager
+from core.cpu_scheduler import CPUScheduler
+from core.memory_manager import MemoryManager
+
+
+def _scheduler(*priorities):
+    pm = ProcessManager()
+    for i, priority in enumerate(priorities):
+        pm.create_process(f"P{i}", priority=priority, burst_time=10)
+    scheduler = CPUScheduler(pm)
+    switches = []
+    scheduler.add_context_switch_listener(lambda old, new: switches.append((old, new)))
+    return pm, scheduler, switches
+
+
+def test_round_robin_preemption_switches_process():
+    pm, scheduler, switches = _scheduler(5, 5)
+    for _ in range(3):
+        scheduler.schedule('RR', time_quantum=2)
+    assert pm.running_process == 2
+    assert 1 in pm.ready_queue
+    for _ in range(2):
+        scheduler.schedule('RR', time_quantum=2)
+    assert switches == [(None, 1), (1, 2), (2, 1)]
+
+
+def test_priority_preemption_notifies_listeners():
+    pm, scheduler, switches = _scheduler(5)
+    scheduler.schedule('PRIORITY')
+    pm.create_process("urgent", priority=1, burst_time=10)
+    scheduler.schedule('PRIORITY')
+    assert pm.running_process == 2
+    assert 1 in pm.ready_queue
+    assert switches == [(None, 1), (1, 2)]
+
+
+def test_round_robin_flushes_tlb_without_asid():
+    pm, scheduler, switches = _scheduler(5, 5)
+    memory = MemoryManager(64, 'paging')
+    tlb = memory.enable_tlb(use_asid=False)
+    scheduler.add_context_switch_listener(memory.on_context_switch)
+    for _ in range(9):
+        scheduler.schedule('RR', time_quantum=2)
+    assert len(switches) == 5
+    assert tlb.context_switches == 5 == tlb.flushes
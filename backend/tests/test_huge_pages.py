@@ -0,0 +1,38 @@
+#Pruebas de páginas grandes con fork y control de conjunto de trabajo
+
+from core.memory_manager import PagingManager
+
+
+def _promoted_manager(**working_set) -> PagingManager:
+    pm = PagingManager(16, 4)
+    pm.enable_huge_pages(factor=4)
+    pm.enable_tlb()
+    if working_set:
+        pm.enable_working_set(**working_set)
+    pm.create_page_table(1, 8)
+    for page in range(4):
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'LRU')
+    assert (1, 0) in pm.huge.mappings
+    return pm
+
+
+def test_fork_demotes_huge_regions_before_sharing():
+    pm = _promoted_manager()
+    pm.fork_process(1, 2)
+    assert (1, 0) not in pm.huge.mappings
+    pm.tlb.flush()
+    assert pm.access_page(1, 1, write=True) is False
+    assert pm.access_page(2, 2, write=True) is False
+    assert pm.page_tables[1].peek(1).frame_number != pm.page_tables[2].peek(1).frame_number
+
+
+def test_demotion_during_access_falls_back_to_base_tlb_entry():
+    # Al reducir la cuota se desaloja un frame de la región y la página grande se divide
+    pm = _promoted_manager(initial_frames=4, interval=4, lower_fault_rate=0.5)
+    for _ in range(8):
+        # Sin TLB cada acceso recorre la tabla y reinserta la traducción
+        pm.tlb.flush()
+        assert pm.access_page(1, 3) is False
+    assert (1, 0) not in pm.huge.mappings
+    assert pm.tlb.lookup(1, 3) == pm.page_tables[1].peek(3).frame_number
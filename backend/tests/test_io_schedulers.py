@@ -0,0 +1,91 @@
+#Pruebas de los planificadores de E/S
+
+import pytest
+
+from core.io_manager import IOManager, DeviceType, DiskGeometry
+
+
+def _manager_with_disk(scheduler: str) -> IOManager:
+    io = IOManager()
+    io.add_device('disk0', DeviceType.DISK)
+    io.set_scheduler(scheduler)
+    return io
+
+
+def test_process_queues_uses_device_scheduler():
+    io = _manager_with_disk('SSTF')
+    io.devices['disk0'].head_position = 50
+    for cylinder in (900, 60, 10):
+        io.request_io(1, 'disk0', 'read', 512, cylinder=cylinder)
+    io.process_io_queues(0.0)
+    assert io.devices['disk0'].current_request.cylinder == 60
+
+
+def test_explicit_scheduler_overrides_device_scheduler():
+    io = _manager_with_disk('SSTF')
+    io.devices['disk0'].head_position = 50
+    for cylinder in (900, 60, 10):
+        io.request_io(1, 'disk0', 'read', 512, cylinder=cylinder)
+    io.process_io_queues(0.0, 'FCFS')
+    assert io.devices['disk0'].current_request.cylinder == 900
+
+
+def test_unknown_scheduler_is_rejected():
+    io = _manager_with_disk('FCFS')
+    io.request_io(1, 'disk0', 'read', 512, cylinder=5)
+    with pytest.raises(ValueError):
+        io.process_io_queues(0.0, 'CFQ')
+    with pytest.raises(ValueError):
+        io.set_scheduler('CFQ')
+    with pytest.raises(ValueError):
+        io.devices['disk0'].select_next('CFQ')
+    assert io.devices['disk0'].scheduler == 'FCFS'
+
+
+def test_bfq_weights_are_shared_with_configured_policies():
+    io = _manager_with_disk('BFQ')
+    io.configure_scheduler('BFQ', weights={'1': 3})
+    io.set_io_weight(2, 5)
+    assert io.io_weights == {1: 3.0, 2: 5.0}
+    assert io.devices['disk0'].policies['BFQ'].weights is io.io_weights
+    with pytest.raises(ValueError):
+        io.configure_scheduler('BFQ', weights={1: 0})
+
+
+TEXTBOOK_QUEUE = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+@pytest.mark.parametrize('algorithm, total', [
+    ('FCFS', 640), ('SSTF', 236), ('SCAN', 331),
+    ('C-SCAN', 382), ('LOOK', 299), ('C-LOOK', 322),
+])
+def test_compare_disk_schedulers_textbook_totals(algorithm, total):
+    results = IOManager.compare_disk_schedulers(
+        TEXTBOOK_QUEUE, head=53, geometry=DiskGeometry(cylinders=200), algorithms=[algorithm])
+    assert results[algorithm]['total_seek_distance'] == total
+    assert sorted(results[algorithm]['order']) == sorted(TEXTBOOK_QUEUE)
+
+
+def test_compare_disk_schedulers_rejects_bad_input():
+    geometry = DiskGeometry(cylinders=200)
+    with pytest.raises(ValueError):
+        IOManager.compare_disk_schedulers(TEXTBOOK_QUEUE, head=53, geometry=geometry,
+                                          algorithms=['CFQ'])
+    with pytest.raises(ValueError):
+        IOManager.compare_disk_schedulers(TEXTBOOK_QUEUE, head=53, geometry=geometry,
+                                          process_ids=[1, 2])
+    with pytest.raises(ValueError):
+        IOManager.compare_disk_schedulers([250], head=53, geometry=geometry)
+
+
+def test_request_io_rejects_addresses_outside_disk():
+    io = _manager_with_disk('FCFS')
+    geometry = io.devices['disk0'].geometry
+    for address in ({'lba': geometry.total_sectors()}, {'lba': -1},
+                    {'cylinder': geometry.cylinders}):
+        with pytest.raises(ValueError):
+            io.request_io(1, 'disk0', 'read', 512, **address)
+    assert not io.devices['disk0'].queue
+    assert io.request_counter == 0
+    io.request_io(1, 'disk0', 'read', 512, lba=geometry.total_sectors() - 1)
+    assert [r.cylinder for r in io.devices['disk0'].queue] == [geometry.cylinders - 1]
@@ -0,0 +1,53 @@
+#Pruebas del estado de memoria acotado (rango, pid, ocupación y límite)
+
+from core.memory_manager import MemoryManager
+
+
+def _segmented() -> MemoryManager:
+    mm = MemoryManager(1000, 'segmentation')
+    for pid in (1, 2, 3):
+        for num in range(3):
+            mm.segmentation_manager.create_segment(pid, num, 20)
+    mm.segmentation_manager.deallocate_segments(2)
+    return mm
+
+
+def test_segmentation_limit_is_global():
+    state = _segmented().get_memory_state(limit=4)
+    listed = sum(len(entry['segments']) for entry in state['segments']) + len(state['free_segments'])
+    assert listed == 4
+    assert state['truncated']
+
+
+def test_segmentation_occupied_only_hides_free_blocks():
+    mm = _segmented()
+    state = mm.get_memory_state(occupied_only=True)
+    assert state['free_segments'] == []
+    assert not state['truncated']
+    assert sorted(entry['process'] for entry in state['segments']) == [1, 3]
+    assert mm.get_memory_state()['free_segments']
+
+
+def test_segmentation_pid_filter():
+    state = _segmented().get_memory_state(pid=3)
+    assert [entry['process'] for entry in state['segments']] == [3]
+    assert len(state['segments'][0]['segments']) == 3
+    assert state['free_segments'] == []
+
+
+def test_paging_pid_filter_and_ownership_cursor():
+    mm = MemoryManager(4 * 600, 'paging')
+    pm = mm.paging_manager
+    for pid in (1, 2):
+        pm.create_page_table(pid, 300)
+    for page in range(300):
+        for pid in (1, 2):
+            if pm.access_page(pid, page):
+                pm.load_page(pid, page, 'LRU')
+    frames, next_start = pm.frame_range(pid=2, limit=3)
+    assert [f.frame_number for f in frames] == [1, 3, 5] and next_start == 7
+    state = mm.get_memory_state()
+    assert len(state['ownership']) == 256
+    assert state['ownership_next_start'] == 256
+    rest = mm.get_memory_state(start=state['ownership_next_start'])
+    assert rest['ownership'][0]['start'] == 256
@@ -0,0 +1,59 @@
+#Pruebas de las organizaciones de tabla de páginas
+
+import random
+
+import pytest
+
+from core.memory_manager import PagingManager, InvertedPageTable, RadixPageTable, PageTable
+
+
+def _chains_consistent(ipt: InvertedPageTable) -> bool:
+    # Cada frame encadenado está en el bucket de su (pid, página) y ninguna cadena cicla
+    seen = set()
+    for bucket, frame_number in enumerate(ipt.anchors):
+        while frame_number >= 0:
+            if frame_number in seen:
+                return False
+            seen.add(frame_number)
+            if ipt._bucket(ipt.entry_pid[frame_number], ipt.entry_page[frame_number]) != bucket:
+                return False
+            frame_number = ipt.chain_next[frame_number]
+    return True
+
+
+def test_inverted_table_reuses_frames_of_negative_pids():
+    ipt = InvertedPageTable(4)
+    ipt.insert(-1, 0, 2)
+    ipt.insert(-1, 4, 2)
+    ipt.insert(1, 3, 2)
+    assert _chains_consistent(ipt)
+    assert ipt.find(-1, 0)[0] is None
+    assert ipt.find(1, 3)[0] == 2
+
+
+def test_shared_segment_with_inverted_table():
+    pm = PagingManager(4, 4, 'inverted')
+    pm.create_page_table(1, 8)
+    pm.create_shared_segment('shm', 8)
+    base = pm.attach_shared(1, 'shm')
+    rng = random.Random(7)
+    for _ in range(300):
+        page = rng.randrange(base + 8)
+        if not pm.access_page(1, page):
+            assert pm.load_page(1, page, 'FIFO')
+        assert _chains_consistent(pm.inverted_table)
+    for frame in pm.frames:
+        if frame.occupied:
+            assert pm.inverted_table.find(frame.process_id, frame.page_number)[0] == frame.frame_number
+
+
+def test_radix_table_does_not_alias_high_pages():
+    table = RadixPageTable(2 ** 21, levels=2, bits_per_level=10)
+    assert table.levels == 3
+    assert table.get(5) is not table.get(5 + 2 ** 20)
+    assert table.get(5 + 2 ** 20).page_number == 5 + 2 ** 20
+
+
+def test_page_table_interface_is_abstract():
+    with pytest.raises(TypeError):
+        PageTable(4)
@@ -0,0 +1,139 @@
+#Pruebas del reemplazo y la gestión de frames en PagingManager
+
+import pytest
+
+from core.memory_manager import FreeFramePool, PagingManager
+
+SILBERSCHATZ = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+BELADY = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+
+
+def _faults(algorithm: str, frames: int, references) -> int:
+    pm = PagingManager(frames, 4)
+    pm.create_page_table(1, 10)
+    for page in references:
+        if pm.access_page(1, page):
+            pm.load_page(1, page, algorithm)
+    return pm.page_faults
+
+
+def test_free_frame_pool_reuses_freed_frames():
+    pool = FreeFramePool(8)
+    assert [pool.allocate() for _ in range(3)] == [0, 1, 2]
+    assert pool.free(1)
+    assert not pool.free(1)
+    assert pool.allocate() == 1
+    # Los frames tomados en bloque no vuelven a salir de la pila
+    assert pool.allocate_contiguous(4, align=4) == 4
+    assert [pool.allocate() for _ in range(2)] == [3, None]
+    assert pool.free_count == 0 and pool.used_count == 8
+
+
+@pytest.mark.parametrize('frames, references, faults', [
+    (3, SILBERSCHATZ, 12), (3, BELADY, 10), (4, BELADY, 8),
+])
+def test_lru_replacement_fault_counts(frames, references, faults):
+    assert _faults('LRU', frames, references) == faults
+
+
+def test_lru_evicts_least_recently_used_page():
+    pm = PagingManager(3, 4)
+    pm.create_page_table(1, 10)
+    for page in (0, 1, 2, 0, 3):
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'LRU')
+    resident = {f.page_number for f in pm.frames if f.occupied}
+    assert resident == {0, 2, 3}
+
+
+@pytest.mark.parametrize('algorithm, frames, references, faults', [
+    ('FIFO', 3, SILBERSCHATZ, 15), ('FIFO', 3, BELADY, 9), ('FIFO', 4, BELADY, 10),
+    ('CLOCK', 3, SILBERSCHATZ, 14),
+])
+def test_fifo_and_clock_fault_counts(algorithm, frames, references, faults):
+    # FIFO reproduce la anomalía de Belady: más frames, más fallos
+    assert _faults(algorithm, frames, references) == faults
+
+
+def test_clock_hand_persists_between_faults():
+    pm = PagingManager(3, 4)
+    pm.create_page_table(1, 10)
+    for page in (0, 1, 2, 3):
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'CLOCK')
+    # La manecilla avanzó tras la víctima en vez de volver al frame 0
+    assert pm.clock_hand == 1
+    if pm.access_page(1, 4):
+        pm.load_page(1, 4, 'CLOCK')
+    assert pm.frames[1].page_number == 4
+
+
+def test_demand_paging_with_sequential_readahead():
+    pm = PagingManager(16, 4)
+    pm.enable_readahead(initial_window=2)
+    pm.create_page_table(1, 1000)
+    assert pm.page_tables[1].touched_pages() == 0
+    for page in (0, 1):
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'LRU')
+    # El segundo fallo secuencial precarga la ventana siguiente
+    assert pm.readahead.prefetch_issued == 2
+    assert not pm.access_page(1, 2) and not pm.access_page(1, 3)
+    assert pm.readahead.prefetch_hits == 2
+    assert pm.page_tables[1].touched_pages() == 4
+
+
+def test_release_process_reclaims_only_its_frames():
+    pm = PagingManager(8, 4)
+    pm.create_page_table(1, 10)
+    pm.create_page_table(2, 10)
+    for page in range(3):
+        for pid in (1, 2):
+            if pm.access_page(pid, page):
+                pm.load_page(pid, page, 'LRU')
+    assert pm.release_process(1) == 3
+    assert 1 not in pm.page_tables and 1 not in pm.resident_frames
+    assert all(f.process_id != 1 for f in pm.frames)
+    assert pm.free_frames.used_count == 3 == len(pm.resident_frames[2])
+    assert pm.get_utilization()['frames_reclaimed'] == 3
+
+
+def test_page_fault_frequency_adjusts_quota():
+    pm = PagingManager(16, 4)
+    ws = pm.enable_working_set(tau=4, interval=4, initial_frames=2)
+    pm.create_page_table(1, 10)
+    for page in [0, 1, 2, 3, 4, 5] * 4:
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'WSCLOCK')
+        assert len(pm.resident_frames[1]) <= ws.quota(1)
+    assert ws.grows > 0 and ws.quota(1) > 2
+    grown = ws.quota(1)
+    for _ in range(8):
+        pm.access_page(1, 5)
+    # Sin fallos la cuota baja y los frames sobrantes se recortan
+    assert ws.quota(1) < grown
+    assert len(pm.resident_frames[1]) <= ws.quota(1)
+    assert pm.working_set_size(1) == 1
+
+
+@pytest.mark.parametrize('page_table_type', ['flat', 'two_level'])
+def test_cow_fork_copies_only_written_pages(page_table_type):
+    pm = PagingManager(16, 4096, page_table_type)
+    pm.enable_backing_store(swap_slots=4)
+    pm.create_page_table(1, 8)
+    for page in range(4):
+        if pm.access_page(1, page, write=True):
+            pm.load_page(1, page, 'LRU')
+        pm.page_data(1, page)[5] = page
+    used = pm.free_frames.used_count
+    assert pm.fork_process(1, 2)['pages_shared'] == 4
+    assert pm.free_frames.used_count == used
+    pm.access_page(2, 0, write=True)
+    pm.page_data(2, 0)[5] = 99
+    assert pm.free_frames.used_count == used + 1
+    assert pm.page_data(1, 0)[5] == 0
+    assert [pm.page_data(2, page)[5] for page in range(4)] == [99, 1, 2, 3]
+    assert pm.get_fork_statistics()['cow_faults'] == 1
+    pm.release_process(1)
+    pm.release_process(2)
+    assert pm.free_frames.used_count == 0 and not pm.frame_sharers
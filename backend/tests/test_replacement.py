@@ -0,0 +1,62 @@
+#Pruebas de la simulación de reemplazo de páginas por lotes
+
+import numpy as np
+import pytest
+
+from core.memory_manager import PagingManager
+
+SILBERSCHATZ = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+
+
+def _references(pages, pid=1):
+    return np.stack([np.full(len(pages), pid, dtype=np.int64), np.asarray(pages, dtype=np.int64)], axis=1)
+
+
+@pytest.mark.parametrize('algorithm, faults', [('FIFO', 15), ('LRU', 12), ('CLOCK', 14), ('OPT', 9)])
+def test_textbook_fault_counts(algorithm, faults):
+    results = PagingManager.simulate_references(_references(SILBERSCHATZ), 3, (algorithm,))
+    assert results[algorithm]['page_faults'] == faults
+
+
+def _naive_stack_distances(ids):
+    stack, distances = [], []
+    for page in ids:
+        if page in stack:
+            depth = len(stack) - stack.index(page)
+            stack.remove(page)
+        else:
+            depth = 0
+        stack.append(page)
+        distances.append(depth)
+    return distances
+
+
+@pytest.mark.parametrize('n', [1, 63, 64, 65, 300, 2000])
+def test_stack_distances_match_naive_stack(n):
+    rng = np.random.default_rng(n)
+    pages = rng.integers(0, max(2, n // 4), n)
+    distances = PagingManager.lru_stack_distances(_references(pages))
+    assert distances.tolist() == _naive_stack_distances(pages.tolist())
+
+
+def test_miss_ratio_curve_agrees_with_lru_simulation():
+    rng = np.random.default_rng(3)
+    refs = _references(rng.zipf(1.5, 5000) % 200)
+    curve = PagingManager(1).miss_ratio_curve(refs, max_frames=32)
+    for frames in (1, 4, 16, 32):
+        lru = PagingManager.simulate_references(refs, frames, ('LRU',))['LRU']['page_faults']
+        assert curve['page_faults'][frames - 1] == lru
+
+
+def test_recorded_trace_is_bounded():
+    pm = PagingManager(4, 64)
+    pm.trace_limit = 8
+    pm.create_page_table(1, 16)
+    for i in range(50):
+        page = i % 16
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'FIFO')
+    assert len(pm.trace_pids) < 2 * pm.trace_limit
+    window = pm._trace_references()
+    assert len(window) == pm.trace_limit
+    assert list(window[-1]) == [1, 49 % 16]
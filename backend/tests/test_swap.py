@@ -0,0 +1,103 @@
+#Pruebas del área de swap y su disco
+
+from core.io_manager import IOManager
+from core.memory_manager import PagingManager
+
+
+def _dirty_sweep(pm: PagingManager, pid: int, pages: int):
+    for page in range(pages):
+        if pm.access_page(pid, page, write=True):
+            assert pm.load_page(pid, page, 'FIFO')
+            pm.access_page(pid, page, write=True)
+
+
+def test_swap_writes_stay_inside_swap_disk():
+    # Páginas de 1 MB: el disco por defecto solo tiene sitio para ~123 slots
+    pm = PagingManager(4, 1024)
+    pm.enable_swap(8)
+    io = IOManager()
+    pm.attach_swap_device(io)
+    pm.create_page_table(1, 400)
+    _dirty_sweep(pm, 1, 400)
+    device = io.devices['swap0']
+    assert pm.swap_area.num_slots > 123
+    assert device.queue
+    for request in list(device.queue):
+        assert 0 <= request.lba < device.geometry.total_sectors()
+
+
+def test_swap_disk_sized_from_swap_area():
+    pm = PagingManager(4, 1024)
+    pm.enable_swap(1024)
+    io = IOManager()
+    pm.attach_swap_device(io)
+    geometry = io.devices['swap0'].geometry
+    assert geometry.total_sectors() >= 1024 * 1024 * 2
+
+
+def test_swap_in_skips_pages_faulted_in_while_suspended():
+    pm = PagingManager(8, 4)
+    pm.enable_swap(16)
+    pm.create_page_table(1, 4)
+    _dirty_sweep(pm, 1, 4)
+    pm.swap_out_process(1)
+    # Fallo de página mientras el proceso estaba fuera
+    assert pm.access_page(1, 0)
+    assert pm.load_page(1, 0, 'LRU')
+    pm.swap_in_process(1)
+    table = pm.page_tables[1]
+    occupied = [f for f in pm.frames if f.occupied]
+    assert len(occupied) == 4 == pm.free_frames.used_count
+    for frame in occupied:
+        assert table.peek(frame.page_number).frame_number == frame.frame_number
+
+
+def test_dirty_evictions_write_back_and_clean_pages_go_first():
+    pm = PagingManager(2, 4)
+    io = IOManager()
+    pm.attach_swap_device(io)
+    pm.create_page_table(1, 8)
+    _dirty_sweep(pm, 1, 1)
+    for page in (1, 2):
+        if pm.access_page(1, page):
+            pm.load_page(1, page, 'FIFO')
+    # La víctima limpia se prefiere a la sucia más antigua
+    assert pm.frames[0].page_number == 0
+    assert pm.get_writeback_statistics()['dirty_evictions'] == 0
+    for page in (3, 4):
+        assert pm.access_page(1, page, write=True)
+        pm.load_page(1, page, 'FIFO')
+    stats = pm.get_writeback_statistics()
+    assert stats['dirty_evictions'] == 1 == stats['eviction_writebacks']
+    assert len(io.devices['swap0'].queue) == 1
+
+
+def test_page_cleaner_batches_dirty_pages():
+    pm = PagingManager(8, 4)
+    io = IOManager()
+    pm.attach_swap_device(io)
+    pm.create_page_table(1, 8)
+    _dirty_sweep(pm, 1, 6)
+    assert pm.run_page_cleaner(batch_size=4) == 4
+    assert pm.run_page_cleaner(batch_size=4) == 2
+    assert pm.run_page_cleaner() == 0
+    assert len(io.devices['swap0'].queue) == 2
+    assert pm.get_writeback_statistics()['cleaner_batches'] == 2
+
+
+def test_backing_store_keeps_page_contents(tmp_path):
+    image = tmp_path / 'image.bin'
+    image.write_bytes(bytes(range(256)) * 32)
+    pm = PagingManager(4, 4096)
+    pm.enable_backing_store(swap_slots=2)
+    pm.create_page_table(1, 16)
+    pm.map_backing_file(1, str(image))
+    _dirty_sweep(pm, 1, 4)
+    # La página 1 se lee del archivo en el desplazamiento 4096
+    assert bytes(pm.page_data(1, 1)[2:4]) == bytes([2, 3])
+    for page in range(4):
+        pm.page_data(1, page)[1] = 100 + page
+    pm.swap_out_process(1)
+    assert pm.page_data(1, 0) is None
+    pm.swap_in_process(1)
+    assert [pm.page_data(1, page)[1] for page in range(4)] == [100, 101, 102, 103]
@@ -63,8 +63,9 @@ export const getSystemState = async () => {
   return response.data;
 };
 
-export const getMemoryState = async () => {
-  const response = await api.get('/memory/state');
+// params: { start, end, pid, occupied_only, limit }
+export const getMemoryState = async (params = {}) => {
+  const response = await api.get('/memory/state', { params });
   return response.data;
 };
 
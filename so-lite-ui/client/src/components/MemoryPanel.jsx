@@ -113,7 +113,7 @@ export default function MemoryPanel() {
 
   const usedMemory = memoryState.mode === 'partitions'
     ? memoryState.partitions?.filter(p => p.allocated).reduce((sum, p) => sum + p.size, 0) || 0
-    : memoryState.frames?.filter(f => f.occupied).length * 4 || 0;
+    : memoryState.used_frames * 4 || 0;
 
   const freeMemory = totalMemory - usedMemory;
   const utilizationPercent = (usedMemory / totalMemory * 100) || 0;
@@ -431,6 +431,33 @@ export default function MemoryPanel() {
                 marginRight: 5
               }}></span> Libre</div>
             </div>
+            {/* Mapa de propietarios por tramos: cubre todos los frames con un payload acotado */}
+            {memoryState.ownership?.length > 0 && (
+              <div style={{
+                display: 'flex',
+                height: 24,
+                marginBottom: 15,
+                borderRadius: 6,
+                overflow: 'hidden',
+                border: '1px solid #bdbdbd'
+              }}>
+                {memoryState.ownership.map((run) => (
+                  <div
+                    key={run.start}
+                    style={{
+                      flexGrow: run.length,
+                      flexBasis: 0,
+                      minWidth: 1,
+                      background: run.process === null ? '#e0e0e0' : '#ff9800',
+                      borderRight: '1px solid white'
+                    }}
+                    title={run.process === null
+                      ? `Frames ${run.start}-${run.start + run.length - 1} - Libres`
+                      : `Frames ${run.start}-${run.start + run.length - 1} - Proceso P${run.process}`}
+                  />
+                ))}
+              </div>
+            )}
             <div style={{ 
               display: "grid",
               gridTemplateColumns: "repeat(auto-fill, minmax(50px, 1fr))",